@@ -1,66 +1,98 @@
 """
 RFC 8785 JSON Canonicalization Scheme (JCS) Helper.
 This module provides a standard, strict implementation of JCS for Talos.
+
+It is self-contained so that the root ``contracts`` package works without the
+Python SDK installed; ``talos_contracts.canonical_json_bytes`` implements the
+same rules and the SDK test suite checks that both produce identical bytes.
 """
 
 import json
-import math
 
-def _is_safe_integer(n):
-    return isinstance(n, int) and -9007199254740991 <= n <= 9007199254740991
+_INFINITY = float("inf")
+
+
+def _utf16_key(key):
+    return key.encode("utf-16-be", "surrogatepass")
+
+
+def _format_float(value):
+    """Format a float as ES6 ``Number.prototype.toString`` (RFC 8785 section 3.2.2.3)."""
+    if value != value or value in (_INFINITY, -_INFINITY):
+        raise ValueError("NaN and Infinity are not allowed in JSON")
+    if value == 0:
+        return "0"
+    text = repr(value)
+    if "e" not in text:
+        return text[:-2] if text.endswith(".0") else text
+
+    # Same shortest round-trip digits as repr, laid out the ES6 way:
+    # value = 0.<digits> * 10**point.
+    sign = ""
+    if text[0] == "-":
+        sign = "-"
+        text = text[1:]
+    mantissa, _, exponent = text.partition("e")
+    whole, _, fraction = mantissa.partition(".")
+    digits = (whole + fraction).rstrip("0")
+    point = int(exponent) + 1
+    count = len(digits)
+    if count <= point <= 21:
+        body = digits + "0" * (point - count)
+    elif 0 < point <= 21:
+        body = digits[:point] + "." + digits[point:]
+    elif -6 < point <= 0:
+        body = "0." + "0" * -point + digits
+    else:
+        exp = point - 1
+        body = digits[0] + ("." + digits[1:] if count > 1 else "") + ("e+" if exp >= 0 else "e-") + str(abs(exp))
+    return sign + body
+
+
+def _encode(data, out):
+    if data is None:
+        out.append("null")
+    elif data is True:
+        out.append("true")
+    elif data is False:
+        out.append("false")
+    elif isinstance(data, str):
+        out.append(json.dumps(data, ensure_ascii=False))
+    elif isinstance(data, int):
+        out.append(int.__repr__(data))
+    elif isinstance(data, float):
+        out.append(_format_float(data))
+    elif isinstance(data, (list, tuple)):
+        out.append("[")
+        for i, item in enumerate(data):
+            if i:
+                out.append(",")
+            _encode(item, out)
+        out.append("]")
+    elif isinstance(data, dict):
+        if not all(isinstance(key, str) for key in data):
+            raise TypeError("JCS object keys must be strings")
+        out.append("{")
+        for i, key in enumerate(sorted(data, key=_utf16_key)):
+            if i:
+                out.append(",")
+            out.append(json.dumps(key, ensure_ascii=False))
+            out.append(":")
+            _encode(data[key], out)
+        out.append("}")
+    else:
+        raise TypeError(f"Type {type(data)} not serializable by JCS")
+
 
 def canonicalize(data) -> bytes:
     """
     Serialize data to JCS (RFC 8785) canonical JSON bytes.
-    
+
     Rules:
     - Object keys sorted lexicographically (UTF-16 code units).
     - No whitespace.
     - Floating point representation per IEEE 754 (ES6/JSON compatible).
     """
-    if data is None:
-        return b"null"
-    
-    if isinstance(data, bool):
-        return b"true" if data else b"false"
-    
-    if isinstance(data, (int, float)):
-        # RFC 8785: Numbers
-        # If integer, simple string.
-        # If float, formatted compatible with ES6.
-        if isinstance(data, int):
-            return str(data).encode("utf-8")
-        
-        if math.isinf(data) or math.isnan(data):
-             raise ValueError("NaN and Infinity are not allowed in JSON")
-             
-        # JCS requires generic JSON number formatting.
-        # Python's json.dumps handles most of this correctly with allow_nan=False
-        # But we must ensure no trailing .0 for integers represented as floats
-        # if they can be represented as integers.
-        # However, standard library json.dumps produces standards compliant JSON numbers.
-        # The nuance in JCS is specific to matching other implementations.
-        # For this v1, we rely on the standard `json` separators behavior + sort_keys,
-        # but manual checking might be needed for edge case floats if strict drift occurs.
-        # For configuration values (mostly ints/strings), standard json dump is usually sufficient
-        # provided `separators` are correct.
-        pass
-
-    if isinstance(data, str):
-        return json.dumps(data, ensure_ascii=False).encode("utf-8")
-
-    if isinstance(data, list):
-        items = [canonicalize(item) for item in data]
-        return b"[" + b",".join(items) + b"]"
-
-    if isinstance(data, dict):
-        # Sort keys by UTF-16 code unit order (Python sort is sufficiently compatible for BMP)
-        sorted_keys = sorted(data.keys())
-        items = []
-        for key in sorted_keys:
-            encoded_key = json.dumps(key, ensure_ascii=False).encode("utf-8")
-            encoded_val = canonicalize(data[key])
-            items.append(encoded_key + b":" + encoded_val)
-        return b"{" + b",".join(items) + b"}"
-
-    raise TypeError(f"Type {type(data)} not serializable by JCS")
+    out = []
+    _encode(data, out)
+    return "".join(out).encode("utf-8")
@@ -0,0 +1,140 @@
+"""Shared timing helpers for the talos_contracts micro-benchmarks.
+
+Each ``bench_*.py`` script in this directory is standalone::
+
+    python benchmarks/bench_base64url.py [--quick] [--json results.json]
+
+Results are printed as a table and, with ``--json``, written in the
+``schemas/perf/v1/bench_result.schema.json`` format.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+# Benchmarks run against the source tree, like the test suite does.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+def parse_args(
+    description: str,
+    extra: Callable[[argparse.ArgumentParser], None] | None = None,
+) -> argparse.Namespace:
+    """Parse the common benchmark command line; ``extra`` may add script-specific options."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--json", metavar="PATH", help="write bench_result v1 JSON to PATH")
+    parser.add_argument("--quick", action="store_true", help="fewer runs and smaller sizes")
+    if extra is not None:
+        extra(parser)
+    return parser.parse_args()
+
+
+def measure(
+    fn: Callable[[], Any],
+    *,
+    runs: int = 7,
+    warmup: int = 1,
+    min_time: float = 0.05,
+) -> dict[str, Any]:
+    """
+    Time ``fn`` and return bench_result ``stats``.
+
+    The number of calls per run is calibrated so that one run lasts at least
+    ``min_time`` seconds; the reported times are per call.
+    """
+    for _ in range(warmup):
+        fn()
+
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed == 0 else max(2, int(min_time / elapsed * 1.2))
+
+    samples = [elapsed / number]
+    for _ in range(runs - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+
+    samples_ms = sorted(t * 1e3 for t in samples)
+    median = statistics.median(samples_ms)
+    return {
+        "median_ms": median,
+        "p95_ms": samples_ms[min(len(samples_ms) - 1, int(round(0.95 * (len(samples_ms) - 1))))],
+        "mean_ms": statistics.fmean(samples_ms),
+        "stddev_ms": statistics.pstdev(samples_ms),
+        "ops_per_sec": 1e3 / median if median else 0.0,
+        "iterations": number * len(samples),
+    }
+
+
+def timed_rates(fn: Callable[[], Any], runs: int) -> list[float]:
+    """Run ``fn`` ``runs`` times; return the rate (calls per second) of each run."""
+    rates = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        rates.append(1 / (time.perf_counter() - start))
+    return rates
+
+
+def throughput_stats(rates: list[float]) -> dict[str, Any]:
+    """Convert repeated ops-per-second samples into bench_result ``stats``."""
+    samples_ms = sorted(1e3 / r for r in rates)
+    median = statistics.median(samples_ms)
+    return {
+        "median_ms": median,
+        "p95_ms": samples_ms[min(len(samples_ms) - 1, int(round(0.95 * (len(samples_ms) - 1))))],
+        "mean_ms": statistics.fmean(samples_ms),
+        "stddev_ms": statistics.pstdev(samples_ms),
+        "ops_per_sec": 1e3 / median,
+        "iterations": len(samples_ms),
+    }
+
+
+def report(
+    args: argparse.Namespace,
+    results: dict[str, dict[str, Any]],
+    *,
+    runs: int = 7,
+    warmup: int = 1,
+) -> None:
+    """Print ``results`` (name -> stats) and optionally write them as JSON."""
+    width = max((len(name) for name in results), default=10)
+    print(f"{'benchmark':<{width}}  {'median':>12}  {'p95':>12}  {'ops/s':>14}")
+    for name, stats in results.items():
+        print(
+            f"{name:<{width}}  {stats['median_ms']:>10.4f}ms  {stats['p95_ms']:>10.4f}ms"
+            f"  {stats['ops_per_sec']:>14,.1f}"
+        )
+
+    if args.json:
+        doc = {
+            "schema_version": "1.0",
+            "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "command": " ".join(sys.argv),
+            "runs_count": runs,
+            "warmup_count": warmup,
+            "benchmarks": {name: {"stats": stats} for name, stats in results.items()},
+        }
+        Path(args.json).write_text(json.dumps(doc, indent=2) + "\n")
+
+
+def speedup(results: dict[str, dict[str, Any]], baseline: str, candidate: str) -> str:
+    """Format the median speedup of ``candidate`` over ``baseline``."""
+    ratio = results[baseline]["median_ms"] / results[candidate]["median_ms"]
+    return f"{candidate} vs {baseline}: {ratio:.1f}x"
@@ -0,0 +1,81 @@
+"""Benchmark: per-event calculate_digest ingest vs the bulk audit event hash verifier."""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import tempfile
+from pathlib import Path
+
+from _harness import parse_args, report, speedup, throughput_stats, timed_rates
+
+from talos_contracts import AuditEventVerifier, audit_event_hash, calculate_digest, uuid7_batch
+
+VECTORS = json.loads(
+    (Path(__file__).resolve().parents[2] / "test_vectors" / "audit_event_vectors.json").read_text()
+)["tests"]
+
+
+def make_export(path: Path, count: int, tamper_rate: float = 0.01) -> int:
+    """Write ``count`` audit events as NDJSON; return the number of tampered events."""
+    rng = random.Random(25)
+    tampered = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for i, event_id in enumerate(uuid7_batch(count)):
+            event = dict(VECTORS[i % len(VECTORS)]["event_without_hash"], event_id=event_id, request_id=f"req-{i}")
+            event["event_hash"] = audit_event_hash(event)
+            if rng.random() < tamper_rate:
+                event["outcome"] = "tampered"
+                tampered += 1
+            f.write(json.dumps(event, ensure_ascii=False) + "\n")
+    return tampered
+
+
+def main() -> None:
+    args = parse_args(__doc__)
+    count = 20_000 if args.quick else 200_000
+    runs = 3 if args.quick else 5
+    workers = min(4, os.cpu_count() or 1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "audit.ndjson"
+        tampered = make_export(path, count)
+        size = path.stat().st_size
+        with open(path, "rb") as f:
+            events = [json.loads(line) for line in f]
+
+        def ingest() -> int:
+            """Today's ingest: parse each line and recompute its hash."""
+            bad = 0
+            with open(path, "rb") as f:
+                for line in f:
+                    event = json.loads(line)
+                    bad += calculate_digest(event, exclude_fields=["event_hash"]) != event["event_hash"]
+            return bad
+
+        configs = {
+            "audit/ingest_loop": ingest,
+            "audit/verify_ndjson": lambda: sum(1 for _ in AuditEventVerifier().verify_ndjson(path)),
+            f"audit/verify_ndjson_workers{workers}": lambda: sum(
+                1 for _ in AuditEventVerifier(workers=workers).verify_ndjson(path)
+            ),
+            "audit/verify_dicts": lambda: sum(1 for _ in AuditEventVerifier().verify(events)),
+        }
+        for name, fn in configs.items():
+            assert fn() == tampered, name
+        results = {name: throughput_stats(timed_rates(fn, runs)) for name, fn in configs.items()}
+
+    print(f"{count:,} events of ~{size // count} bytes, {tampered:,} tampered, {os.cpu_count()} CPUs")
+    report(args, results, runs=runs, warmup=0)
+    print()
+    for name, stats in results.items():
+        cores = workers if "workers" in name else 1
+        rate = stats["ops_per_sec"] * count
+        print(f"  {name:<28} {rate:>12,.0f} events/s {rate / cores:>12,.0f} events/s/core")
+    for name in list(configs)[1:]:
+        print(speedup(results, "audit/ingest_loop", name))
+
+
+if __name__ == "__main__":
+    main()
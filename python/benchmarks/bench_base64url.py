@@ -0,0 +1,92 @@
+"""Benchmark: base64url codec vs the previous per-character implementation."""
+
+from __future__ import annotations
+
+import os
+import re
+
+from _harness import measure, parse_args, report, speedup
+
+from talos_contracts import base64url_decode, base64url_encode
+
+# --- Reference: the per-character codec the binascii engine replaced -------
+
+_RE_VALID = re.compile(r"^[A-Za-z0-9\-_]*$")
+_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+_INV = {c: i for i, c in enumerate(_ALPHABET)}
+
+
+def legacy_encode(data: bytes) -> str:
+    out: list[str] = []
+    i = 0
+    n = len(data)
+    while i + 3 <= n:
+        x = (data[i] << 16) | (data[i + 1] << 8) | data[i + 2]
+        out.append(_ALPHABET[(x >> 18) & 63])
+        out.append(_ALPHABET[(x >> 12) & 63])
+        out.append(_ALPHABET[(x >> 6) & 63])
+        out.append(_ALPHABET[x & 63])
+        i += 3
+    rem = n - i
+    if rem == 1:
+        x = data[i]
+        out.append(_ALPHABET[(x >> 2) & 63])
+        out.append(_ALPHABET[(x << 4) & 63])
+    elif rem == 2:
+        x = (data[i] << 8) | data[i + 1]
+        out.append(_ALPHABET[(x >> 10) & 63])
+        out.append(_ALPHABET[(x >> 4) & 63])
+        out.append(_ALPHABET[(x << 2) & 63])
+    return "".join(out)
+
+
+def legacy_decode(s: str) -> bytes:
+    if "=" in s or not _RE_VALID.match(s) or len(s) % 4 == 1:
+        raise ValueError(s)
+    out = bytearray()
+    i = 0
+    while i < len(s):
+        remain = len(s) - i
+        if remain >= 4:
+            x = (_INV[s[i]] << 18) | (_INV[s[i + 1]] << 12) | (_INV[s[i + 2]] << 6) | _INV[s[i + 3]]
+            out.extend([(x >> 16) & 255, (x >> 8) & 255, x & 255])
+            i += 4
+        elif remain == 2:
+            out.append(((_INV[s[i]] << 18) | (_INV[s[i + 1]] << 12)) >> 16 & 255)
+            i += 2
+        else:
+            x = (_INV[s[i]] << 18) | (_INV[s[i + 1]] << 12) | (_INV[s[i + 2]] << 6)
+            out.extend([(x >> 16) & 255, (x >> 8) & 255])
+            i += 3
+    if legacy_encode(bytes(out)) != s:
+        raise ValueError(s)
+    return bytes(out)
+
+
+def main() -> None:
+    args = parse_args(__doc__)
+    sizes = {"16B": 16, "1KiB": 1024, "1MiB": 1024 * 1024}
+    if args.quick:
+        sizes.pop("1MiB")
+
+    results = {}
+    for label, size in sizes.items():
+        data = os.urandom(size)
+        text = base64url_encode(data)
+        assert legacy_decode(text) == base64url_decode(text) == data
+        assert legacy_encode(data) == text
+        runs = 3 if size > 4096 else 7
+        results[f"encode/{label}/legacy"] = measure(lambda d=data: legacy_encode(d), runs=runs)
+        results[f"encode/{label}/binascii"] = measure(lambda d=data: base64url_encode(d), runs=runs)
+        results[f"decode/{label}/legacy"] = measure(lambda t=text: legacy_decode(t), runs=runs)
+        results[f"decode/{label}/binascii"] = measure(lambda t=text: base64url_decode(t), runs=runs)
+
+    report(args, results)
+    print()
+    for label in sizes:
+        for op in ("encode", "decode"):
+            print(speedup(results, f"{op}/{label}/legacy", f"{op}/{label}/binascii"))
+
+
+if __name__ == "__main__":
+    main()
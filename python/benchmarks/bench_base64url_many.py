@@ -0,0 +1,58 @@
+"""Benchmark: batch base64url API vs a Python loop over the single-value codec."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+
+from _harness import measure, parse_args, report, speedup
+
+from talos_contracts import (
+    base64url_decode,
+    base64url_decode_many,
+    base64url_encode,
+    base64url_encode_many,
+    derive_cursor,
+)
+
+
+def main() -> None:
+    args = parse_args(__doc__)
+    count = 1_000 if args.quick else 10_000
+
+    digests = [hashlib.sha256(os.urandom(16)).digest() for _ in range(count)]
+    digest_buffer = b"".join(digests)
+    cursors = [
+        derive_cursor(1_703_721_600 + i, f"0190a5e0-7c3a-7000-8000-{i:012x}") for i in range(count)
+    ]
+    cursor_bytes = [base64url_decode(c) for c in cursors]
+    encoded_digests = [base64url_encode(d) for d in digests]
+
+    assert base64url_encode_many(digests) == encoded_digests
+    assert base64url_decode_many(encoded_digests)["values"] == digests
+    assert base64url_decode_many(cursors)["values"] == cursor_bytes
+
+    results = {
+        "encode/digest32/loop": measure(lambda: [base64url_encode(d) for d in digests]),
+        "encode/digest32/many": measure(lambda: base64url_encode_many(digests)),
+        "encode/digest32/buffer": measure(lambda: base64url_encode_many(digest_buffer, width=32)),
+        "decode/digest32/loop": measure(lambda: [base64url_decode(s) for s in encoded_digests]),
+        "decode/digest32/many": measure(lambda: base64url_decode_many(encoded_digests)),
+        "encode/cursor/loop": measure(lambda: [base64url_encode(b) for b in cursor_bytes]),
+        "encode/cursor/many": measure(lambda: base64url_encode_many(cursor_bytes)),
+        "decode/cursor/loop": measure(lambda: [base64url_decode(c) for c in cursors]),
+        "decode/cursor/many": measure(lambda: base64url_decode_many(cursors)),
+    }
+
+    print(f"{count} items per call")
+    report(args, results)
+    print()
+    print(speedup(results, "encode/digest32/loop", "encode/digest32/many"))
+    print(speedup(results, "encode/digest32/loop", "encode/digest32/buffer"))
+    print(speedup(results, "decode/digest32/loop", "decode/digest32/many"))
+    print(speedup(results, "encode/cursor/loop", "encode/cursor/many"))
+    print(speedup(results, "decode/cursor/loop", "decode/cursor/many"))
+
+
+if __name__ == "__main__":
+    main()
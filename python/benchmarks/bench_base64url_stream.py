@@ -0,0 +1,78 @@
+"""Benchmark: peak memory and time of one-shot vs bounded-memory base64url decoding."""
+
+from __future__ import annotations
+
+import io
+import os
+import tracemalloc
+
+from _harness import measure, parse_args, report
+
+from talos_contracts import (
+    Base64UrlDecoder,
+    base64url_decode,
+    base64url_decode_into,
+    base64url_encode,
+)
+
+READ_SIZE = 64 * 1024
+
+
+def peak_bytes(fn) -> int:
+    """Peak traced allocation while running ``fn``, excluding its inputs."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    args = parse_args(__doc__)
+    size = (1 if args.quick else 8) * 1024 * 1024
+    data = os.urandom(size)
+    text = base64url_encode(data)
+    raw = text.encode("ascii")
+    out = bytearray(size)
+
+    def one_shot() -> None:
+        base64url_decode(text)
+
+    def into() -> None:
+        base64url_decode_into(text, out)
+
+    def streaming() -> None:
+        src = io.BytesIO(raw)
+        sink = memoryview(out)
+        decoder = Base64UrlDecoder()
+        pos = 0
+        while chunk := src.read(READ_SIZE):
+            piece = decoder.update(chunk)
+            sink[pos : pos + len(piece)] = piece
+            pos += len(piece)
+        piece = decoder.finalize()
+        sink[pos : pos + len(piece)] = piece
+
+    into()
+    assert out == data
+    streaming()
+    assert out == data
+
+    label = f"{size // (1024 * 1024)}MiB"
+    results = {
+        f"decode/{label}/one_shot": measure(one_shot, runs=5),
+        f"decode/{label}/decode_into": measure(into, runs=5),
+        f"decode/{label}/streaming": measure(streaming, runs=5),
+    }
+    report(args, results, runs=5)
+
+    print()
+    print(f"peak extra memory, payload {size:,} bytes:")
+    for name, fn in (("one_shot", one_shot), ("decode_into", into), ("streaming", streaming)):
+        peak = peak_bytes(fn)
+        print(f"  {name:<12} {peak:>14,} bytes  ({peak / size:.2f}x payload)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Benchmark: single-pass canonical_json_bytes vs the normalise-then-json.dumps and recursive jcs encoders."""
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+from typing import Any
+
+from _harness import measure, parse_args, report, speedup
+
+from talos_contracts import canonical_json_bytes
+
+GOLDEN = Path(__file__).resolve().parents[2] / "test_vectors" / "tga" / "golden_trace_chain.json"
+
+
+def legacy_dumps(data: Any) -> bytes:
+    """The previous canonical_json_bytes: a normalised copy, then json.dumps(sort_keys=True)."""
+
+    def normalize(value: Any) -> Any:
+        if isinstance(value, dict):
+            return {k: normalize(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [normalize(v) for v in value]
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        return value
+
+    return json.dumps(normalize(data), sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def legacy_jcs(data: Any) -> bytes:
+    """The previous root ``jcs.canonicalize``: recursive bytes concatenation, no float support."""
+    if data is None:
+        return b"null"
+    if isinstance(data, bool):
+        return b"true" if data else b"false"
+    if isinstance(data, int):
+        return str(data).encode("utf-8")
+    if isinstance(data, str):
+        return json.dumps(data, ensure_ascii=False).encode("utf-8")
+    if isinstance(data, list):
+        return b"[" + b",".join(legacy_jcs(item) for item in data) + b"]"
+    if isinstance(data, dict):
+        items = [json.dumps(k, ensure_ascii=False).encode("utf-8") + b":" + legacy_jcs(data[k]) for k in sorted(data)]
+        return b"{" + b",".join(items) + b"}"
+    raise TypeError(f"Type {type(data)} not serializable by JCS")
+
+
+def build_document(rows: int, *, floats: bool = False, seed: int = 3) -> dict[str, Any]:
+    """A tool_effect-shaped document whose outcome carries ``rows`` result records."""
+    rng = random.Random(seed)
+    doc = json.loads(GOLDEN.read_text())["tool_effect"]
+    doc.pop("_digest")
+    records = []
+    for i in range(rows):
+        record: dict[str, Any] = {
+            "path": f"src/module_{i % 97}/file_{i}.py",
+            "line": rng.randrange(1, 5000),
+            "status": rng.choice(["added", "modified", "deleted"]),
+            "labels": [f"l{rng.randrange(50)}" for _ in range(3)],
+            "owner": {"team": f"team-{i % 13}", "reviewed": bool(i % 2), "note": None},
+        }
+        if floats:
+            record["score"] = rng.random() * 100
+            record["weight"] = float(rng.randrange(100))
+        records.append(record)
+    doc["outcome"] = {"status": "SUCCESS", "summary": "Done", "records": records}
+    return doc
+
+
+def main() -> None:
+    args = parse_args(__doc__)
+    rows = 2_000 if args.quick else 20_000
+    runs = 3 if args.quick else 7
+
+    small = json.loads(GOLDEN.read_text())["action_request"]
+    large = build_document(rows)
+    large_floats = build_document(rows, floats=True)
+    for doc in (small, large):
+        assert canonical_json_bytes(doc) == legacy_dumps(doc) == legacy_jcs(doc)
+    assert canonical_json_bytes(large_floats) == legacy_dumps(large_floats)
+
+    results = {
+        "small/legacy_dumps": measure(lambda: legacy_dumps(small), runs=runs),
+        "small/legacy_jcs": measure(lambda: legacy_jcs(small), runs=runs),
+        "small/canonical_json_bytes": measure(lambda: canonical_json_bytes(small), runs=runs),
+        "large/legacy_dumps": measure(lambda: legacy_dumps(large), runs=runs),
+        "large/legacy_jcs": measure(lambda: legacy_jcs(large), runs=runs),
+        "large/canonical_json_bytes": measure(lambda: canonical_json_bytes(large), runs=runs),
+        "large_floats/legacy_dumps": measure(lambda: legacy_dumps(large_floats), runs=runs),
+        "large_floats/canonical_json_bytes": measure(lambda: canonical_json_bytes(large_floats), runs=runs),
+    }
+    print(f"small: {len(canonical_json_bytes(small)):,} bytes; large: {len(canonical_json_bytes(large)):,} bytes")
+    report(args, results, runs=runs)
+    print()
+    for size in ("small", "large"):
+        print(speedup(results, f"{size}/legacy_dumps", f"{size}/canonical_json_bytes"))
+        print(speedup(results, f"{size}/legacy_jcs", f"{size}/canonical_json_bytes"))
+    print(speedup(results, "large_floats/legacy_dumps", "large_floats/canonical_json_bytes"))
+
+
+if __name__ == "__main__":
+    main()
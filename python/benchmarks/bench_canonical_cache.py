@@ -0,0 +1,72 @@
+"""Benchmark: edit-one-field-then-rehash on large TGA documents, plain dicts vs frozen subtrees."""
+
+from __future__ import annotations
+
+import json
+from itertools import count
+from typing import Any
+
+from _harness import measure, parse_args, report, speedup
+from bench_canonical import GOLDEN, build_document
+
+from talos_contracts import calculate_digest, freeze_json
+
+
+def build_action_request(rows: int) -> dict[str, Any]:
+    """action_request whose proposal.args and resources are large."""
+    doc = json.loads(GOLDEN.read_text())["action_request"]
+    records = build_document(rows)["outcome"]["records"]
+    doc["proposal"]["args"] = {"name": "fix/auth-vuln-1", "records": records}
+    doc["resources"] = [{"kind": "repo", "id": f"org/repo-{i}"} for i in range(rows // 4)]
+    return doc
+
+
+def main() -> None:
+    args = parse_args(__doc__)
+    rows = 2_000 if args.quick else 20_000
+    runs = 3 if args.quick else 7
+
+    plain = build_action_request(rows)
+    state = {"frozen": freeze_json(plain)}
+    calculate_digest(state["frozen"])  # populate the cache
+    ticks = count()
+    deep = ("proposal", "args", "records", rows // 2, "status")
+
+    def plain_top() -> str:
+        plain["ts"] = f"2026-01-15T14:45:{next(ticks) % 60:02d}.000Z"
+        return calculate_digest(plain)
+
+    def frozen_top() -> str:
+        state["frozen"] = state["frozen"].set("ts", f"2026-01-15T14:45:{next(ticks) % 60:02d}.000Z")
+        return calculate_digest(state["frozen"])
+
+    def plain_deep() -> str:
+        plain["proposal"]["args"]["records"][rows // 2]["status"] = f"s{next(ticks)}"
+        return calculate_digest(plain)
+
+    def frozen_deep() -> str:
+        state["frozen"] = state["frozen"].set_in(deep, f"s{next(ticks)}")
+        return calculate_digest(state["frozen"])
+
+    # The same edits on both representations give the same digest.
+    plain["ts"] = "2026-01-15T14:46:00.000Z"
+    plain["proposal"]["args"]["records"][rows // 2]["status"] = "checked"
+    state["frozen"] = state["frozen"].set("ts", plain["ts"]).set_in(deep, "checked")
+    assert calculate_digest(state["frozen"]) == calculate_digest(plain)
+
+    results = {
+        "edit_top/plain": measure(plain_top, runs=runs),
+        "edit_top/frozen": measure(frozen_top, runs=runs),
+        "edit_deep/plain": measure(plain_deep, runs=runs),
+        "edit_deep/frozen": measure(frozen_deep, runs=runs),
+        "cold/freeze_and_digest": measure(lambda: calculate_digest(freeze_json(plain)), runs=runs),
+    }
+    print(f"{rows:,} proposal.args records, {rows // 4:,} resources")
+    report(args, results, runs=runs)
+    print()
+    print(speedup(results, "edit_top/plain", "edit_top/frozen"))
+    print(speedup(results, "edit_deep/plain", "edit_deep/frozen"))
+
+
+if __name__ == "__main__":
+    main()
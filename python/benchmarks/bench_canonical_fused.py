@@ -0,0 +1,94 @@
+"""Benchmark: audit-event hashing with fused exclusion/null-dropping vs copy + strip_nulls by hand."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+from _harness import measure, parse_args, report, speedup
+
+from talos_contracts import calculate_digest, canonical_json_bytes
+from talos_contracts.domain.logic.canonical import strip_nulls
+
+VECTORS = Path(__file__).resolve().parents[2] / "test_vectors" / "audit_event_vectors.json"
+EXCLUDE = ["event_hash"]
+
+
+def by_hand(event: dict[str, Any]) -> str:
+    """The compose-by-hand path: strip_nulls tree, copy, delete excluded fields, hash."""
+    clean = strip_nulls(event).copy()
+    for field in EXCLUDE:
+        clean.pop(field, None)
+    return hashlib.sha256(canonical_json_bytes(clean)).hexdigest()
+
+
+def fused(event: dict[str, Any]) -> str:
+    return calculate_digest(event, EXCLUDE, drop_nulls=True)
+
+
+def peak_bytes(fn) -> int:
+    """Peak traced allocation while running ``fn``, excluding its inputs."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def intermediate_allocations(event: dict[str, Any]) -> int:
+    """Allocations still held by the intermediate trees the by-hand path builds."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    stripped = strip_nulls(event)
+    copied = stripped.copy()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del stripped, copied
+    return sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+
+
+def audit_events(count: int) -> list[dict[str, Any]]:
+    """Audit events with optional fields left as None, each carrying its event_hash."""
+    base = json.loads(VECTORS.read_text())["tests"]
+    events = []
+    for i in range(count):
+        event = json.loads(json.dumps(base[i % len(base)]["event_without_hash"]))
+        event["request_id"] = f"req-{i}"
+        event["principal"]["team_id"] = None if i % 2 else event["principal"].get("team_id")
+        event.setdefault("http", {})["client_ip_hash"] = None if i % 3 == 0 else f"{i:064x}"
+        event["error"] = None
+        event["meta"] = dict(event.get("meta") or {}, retries=None, labels=[f"l{i % 7}", None])
+        event["event_hash"] = by_hand(event)
+        events.append(event)
+    return events
+
+
+def main() -> None:
+    args = parse_args(__doc__)
+    count = 2_000 if args.quick else 20_000
+    runs = 3 if args.quick else 7
+
+    events = audit_events(count)
+    assert [by_hand(e) for e in events] == [fused(e) for e in events] == [e["event_hash"] for e in events]
+
+    results = {
+        "audit/copy_strip_nulls": measure(lambda: [by_hand(e) for e in events], runs=runs),
+        "audit/fused": measure(lambda: [fused(e) for e in events], runs=runs),
+    }
+    print(f"{count:,} audit events (times are per batch)")
+    report(args, results, runs=runs)
+    print()
+    print(speedup(results, "audit/copy_strip_nulls", "audit/fused"))
+    print()
+    event = events[0]
+    print("per call, one event:")
+    print(f"  copy_strip_nulls  peak {peak_bytes(lambda: by_hand(event)):>6,} bytes  intermediate allocations {intermediate_allocations(event)}")
+    print(f"  fused             peak {peak_bytes(lambda: fused(event)):>6,} bytes  intermediate allocations 0")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark: peak memory and time of calculate_digest vs calculate_digest_streaming."""
+
+from __future__ import annotations
+
+import argparse
+import resource
+import subprocess
+import sys
+import tracemalloc
+
+from _harness import measure, parse_args, report, speedup
+from bench_canonical import build_document
+
+from talos_contracts import calculate_digest, calculate_digest_streaming, canonical_json_bytes
+
+DIGESTS = {"calculate_digest": calculate_digest, "calculate_digest_streaming": calculate_digest_streaming}
+
+
+def peak_bytes(fn) -> int:
+    """Peak traced allocation while running ``fn``, excluding its inputs."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def rss_child(name: str, rows: int) -> None:
+    """Print the growth of this process's peak RSS (KiB) caused by one digest."""
+    doc = build_document(rows)
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    DIGESTS[name](doc)
+    print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before)
+
+
+def peak_rss_kib(name: str, rows: int) -> int:
+    # Peak RSS never decreases, so each digest runs in a fresh process.
+    out = subprocess.run(
+        [sys.executable, __file__, "--rss-child", name, "--rows", str(rows)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return int(out.stdout)
+
+
+def main() -> None:
+    def extra(parser: argparse.ArgumentParser) -> None:
+        parser.add_argument("--rows", type=int, help="records in the document (default 20k quick, 200k full)")
+        parser.add_argument("--rss-child", choices=sorted(DIGESTS), help=argparse.SUPPRESS)
+
+    args = parse_args(__doc__, extra)
+    rows = args.rows or (20_000 if args.quick else 200_000)
+    if args.rss_child:
+        rss_child(args.rss_child, rows)
+        return
+    runs = 3 if args.quick else 5
+    # ru_maxrss survives exec, so the children must run while this process is still small.
+    rss = {name: peak_rss_kib(name, rows) for name in DIGESTS}
+
+    doc = build_document(rows)
+    size = len(canonical_json_bytes(doc))
+    assert calculate_digest(doc) == calculate_digest_streaming(doc)
+
+    results = {name: measure(lambda fn=fn: fn(doc), runs=runs, min_time=0.2) for name, fn in DIGESTS.items()}
+    print(f"{rows:,} records, {size:,} canonical bytes")
+    report(args, results, runs=runs)
+    print()
+    print(speedup(results, "calculate_digest", "calculate_digest_streaming"))
+    print()
+    print("peak extra memory (traced allocations / process peak RSS growth):")
+    for name, fn in DIGESTS.items():
+        peak = peak_bytes(lambda fn=fn: fn(doc))
+        print(f"  {name:<28} {peak:>14,} bytes ({peak / size:.2f}x output)  rss +{rss[name]:,} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark: is_canonical_json vs parse + re-canonicalize + compare on received payloads."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+from _harness import measure, parse_args, report, speedup
+from bench_canonical import GOLDEN, build_document
+
+from talos_contracts import canonical_json_bytes, is_canonical_json
+
+
+def roundtrip(data: bytes) -> str | None:
+    """The current check: parse, re-encode, compare, then hash."""
+    if canonical_json_bytes(json.loads(data)) != data:
+        return None
+    return hashlib.sha256(data).hexdigest()
+
+
+def scan(data: bytes) -> str | None:
+    return is_canonical_json(data, digest=True)["digest"]
+
+
+def main() -> None:
+    args = parse_args(__doc__)
+    rows = 2_000 if args.quick else 20_000
+    runs = 3 if args.quick else 7
+
+    small = canonical_json_bytes(json.loads(GOLDEN.read_text())["action_request"])
+    large = canonical_json_bytes(build_document(rows, floats=True))
+    for data in (small, large):
+        assert roundtrip(data) == scan(data) is not None
+    # A sender that pretty-printed: the scanner stops at the first space.
+    pretty = json.dumps(json.loads(large), indent=2).encode()
+    assert roundtrip(pretty) is None and scan(pretty) is None
+
+    results = {
+        "small/roundtrip": measure(lambda: roundtrip(small), runs=runs),
+        "small/is_canonical_json": measure(lambda: scan(small), runs=runs),
+        "large/roundtrip": measure(lambda: roundtrip(large), runs=runs),
+        "large/is_canonical_json": measure(lambda: scan(large), runs=runs),
+        "large_rejected/roundtrip": measure(lambda: roundtrip(pretty), runs=runs),
+        "large_rejected/is_canonical_json": measure(lambda: scan(pretty), runs=runs),
+    }
+    print(f"small: {len(small):,} bytes; large: {len(large):,} bytes")
+    report(args, results, runs=runs)
+    print()
+    for case in ("small", "large", "large_rejected"):
+        print(speedup(results, f"{case}/roundtrip", f"{case}/is_canonical_json"))
+
+
+if __name__ == "__main__":
+    main()
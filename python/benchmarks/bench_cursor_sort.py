@@ -0,0 +1,50 @@
+"""Benchmark: sorting cursors with cmp_to_key(compare_cursor) vs CursorCodec.sort_key."""
+
+from __future__ import annotations
+
+import random
+from functools import cmp_to_key
+
+from _harness import parse_args, report, throughput_stats, timed_rates
+
+from talos_contracts import CursorCodec, compare_cursor, derive_cursor, uuid7_batch
+
+
+def main() -> None:
+    args = parse_args(__doc__)
+    count = 10_000 if args.quick else 100_000
+    rng = random.Random(1)
+    ids = []
+    while len(ids) < count:
+        ids += uuid7_batch(1000)
+    cursors = [derive_cursor(rng.randrange(1_700_000_000, 1_700_086_400), eid) for eid in ids]
+    rng.shuffle(cursors)
+
+    expected = sorted(cursors, key=CursorCodec().sort_key)
+    warm = CursorCodec(maxsize=2 * count)
+    assert sorted(cursors, key=warm.sort_key) == expected
+
+    results = {
+        "sort/cmp_to_key(compare_cursor)": throughput_stats(
+            timed_rates(lambda: sorted(cursors, key=cmp_to_key(compare_cursor)), 1)
+        ),
+        "sort/codec.sort_key(cold)": throughput_stats(
+            timed_rates(lambda: sorted(cursors, key=CursorCodec(maxsize=2 * count).sort_key), 3)
+        ),
+        "sort/codec.sort_key(warm)": throughput_stats(
+            timed_rates(lambda: sorted(cursors, key=warm.sort_key), 3)
+        ),
+        "sort/cmp_to_key(codec.compare,warm)": throughput_stats(
+            timed_rates(lambda: sorted(cursors, key=cmp_to_key(warm.compare)), 3)
+        ),
+    }
+    print(f"ops = one sort of {count:,} cursors")
+    report(args, results, runs=3, warmup=0)
+    base = results["sort/cmp_to_key(compare_cursor)"]["median_ms"]
+    for name, stats in results.items():
+        print(f"  {name:<38} {base / stats['median_ms']:8.1f}x")
+    print(f"warm codec: hits={warm.hits:,} misses={warm.misses:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark: per-event assert_cursor_invariant loop vs the streaming bulk validator."""
+
+from __future__ import annotations
+
+import os
+import random
+
+from _harness import parse_args, report, speedup, throughput_stats, timed_rates
+
+from talos_contracts import (
+    CursorStreamValidator,
+    assert_cursor_invariant,
+    derive_cursor,
+    uuid7_batch,
+)
+
+
+def make_events(count: int, failure_rate: float = 0.01) -> list[dict]:
+    rng = random.Random(7)
+    events = []
+    for eid in uuid7_batch(count):
+        ts = rng.randrange(1_700_000_000, 1_800_000_000)
+        event = {"timestamp": ts, "event_id": eid, "cursor": derive_cursor(ts, eid)}
+        if rng.random() < failure_rate:
+            event["cursor"] = event["cursor"][:-1] + "A"
+        events.append(event)
+    return events
+
+
+def main() -> None:
+    args = parse_args(__doc__)
+    count = 20_000 if args.quick else 200_000
+    runs = 3 if args.quick else 5
+    events = make_events(count)
+
+    def loop() -> int:
+        return sum(not assert_cursor_invariant(e)["ok"] for e in events)
+
+    def serial() -> int:
+        return sum(1 for _ in CursorStreamValidator().validate(events))
+
+    workers = min(4, os.cpu_count() or 1)
+
+    def parallel() -> int:
+        return sum(1 for _ in CursorStreamValidator(chunk_size=16_384, workers=workers).validate(events))
+
+    failures = loop()
+    assert serial() == failures
+    assert parallel() == failures
+
+    results = {
+        "invariant/loop": throughput_stats(timed_rates(loop, runs)),
+        "invariant/stream": throughput_stats(timed_rates(serial, runs)),
+        f"invariant/stream_workers{workers}": throughput_stats(timed_rates(parallel, runs)),
+    }
+    print(f"{count:,} events, {failures:,} failures, {os.cpu_count()} CPUs")
+    report(args, results, runs=runs, warmup=0)
+    print()
+    for name, stats in results.items():
+        print(f"  {name:<28} {stats['ops_per_sec'] * count:>14,.0f} events/s")
+    print(speedup(results, "invariant/loop", "invariant/stream"))
+    print(speedup(results, "invariant/loop", f"invariant/stream_workers{workers}"))
+
+
+if __name__ == "__main__":
+    main()
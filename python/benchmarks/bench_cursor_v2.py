@@ -0,0 +1,40 @@
+"""Benchmark: compact v2 cursors vs v1 for derive, decode, compare and size."""
+
+from __future__ import annotations
+
+import random
+
+from _harness import measure, parse_args, report, speedup
+
+from talos_contracts import compare_cursor, decode_cursor, derive_cursor, uuid7_batch
+
+
+def main() -> None:
+    args = parse_args(__doc__)
+    count = 1_000 if args.quick else 10_000
+    rng = random.Random(3)
+    keys = [(rng.randrange(1_700_000_000, 1_700_100_000), eid) for eid in uuid7_batch(count)]
+    v1 = [derive_cursor(t, e) for t, e in keys]
+    v2 = [derive_cursor(t, e, version=2) for t, e in keys]
+    pairs1 = list(zip(v1, reversed(v1), strict=True))
+    pairs2 = list(zip(v2, reversed(v2), strict=True))
+    assert [decode_cursor(c) for c in v1] == [decode_cursor(c) for c in v2]
+    assert [compare_cursor(a, b) for a, b in pairs1] == [compare_cursor(a, b) for a, b in pairs2]
+
+    results = {
+        "derive/v1": measure(lambda: [derive_cursor(t, e) for t, e in keys]),
+        "derive/v2": measure(lambda: [derive_cursor(t, e, version=2) for t, e in keys]),
+        "decode/v1": measure(lambda: [decode_cursor(c) for c in v1]),
+        "decode/v2": measure(lambda: [decode_cursor(c) for c in v2]),
+        "compare/v1": measure(lambda: [compare_cursor(a, b) for a, b in pairs1]),
+        "compare/v2": measure(lambda: [compare_cursor(a, b) for a, b in pairs2]),
+    }
+    print(f"{count} cursors per call; length v1 {len(v1[0])} chars, v2 {len(v2[0])} chars")
+    report(args, results)
+    print()
+    print(speedup(results, "decode/v1", "decode/v2"))
+    print(speedup(results, "compare/v1", "compare/v2"))
+
+
+if __name__ == "__main__":
+    main()
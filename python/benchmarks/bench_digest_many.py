@@ -0,0 +1,67 @@
+"""Benchmark: digest_many worker scaling vs a serial calculate_digest loop."""
+
+from __future__ import annotations
+
+import marshal
+import os
+import pickle
+import time
+
+from _harness import parse_args, report, speedup, throughput_stats, timed_rates
+from bench_canonical import build_document
+from bench_canonical_fused import audit_events
+
+from talos_contracts import calculate_digest, digest_many
+
+WORKERS = (1, 2, 4, 8)
+
+
+def large_records(count: int) -> list[dict]:
+    """Records of roughly 20 KB canonical JSON each."""
+    records = build_document(count * 100)["outcome"]["records"]
+    return [{"batch": i, "rows": records[i * 100 : (i + 1) * 100]} for i in range(count)]
+
+
+def main() -> None:
+    args = parse_args(__doc__)
+    count = 20_000 if args.quick else 200_000
+    runs = 3 if args.quick else 5
+
+    cases = {"audit": (audit_events(count), ["event_hash"]), "large": (large_records(count // 100), None)}
+    results = {}
+    for case, (records, exclude) in cases.items():
+        expected = [calculate_digest(r, exclude) for r in records]
+        configs = {
+            f"{case}/serial_loop": lambda records=records, exclude=exclude: [calculate_digest(r, exclude) for r in records]
+        }
+        configs[f"{case}/workers0"] = lambda records=records, exclude=exclude: list(digest_many(records, exclude))
+        for n in WORKERS:
+            configs[f"{case}/processes{n}"] = lambda n=n, records=records, exclude=exclude: list(
+                digest_many(iter(records), exclude, workers=n)
+            )
+            configs[f"{case}/threads{n}"] = lambda n=n, records=records, exclude=exclude: list(
+                digest_many(iter(records), exclude, workers=n, use_threads=True)
+            )
+        for name, fn in configs.items():
+            assert fn() == expected, name
+            results[name] = throughput_stats(timed_rates(fn, runs))
+
+    print(f"{count:,} audit events, {count // 100:,} large records, {os.cpu_count()} CPUs (times are per batch)")
+    report(args, results, runs=runs, warmup=0)
+    print()
+    for case in cases:
+        for n in WORKERS:
+            print(speedup(results, f"{case}/serial_loop", f"{case}/processes{n}"))
+            print(speedup(results, f"{case}/serial_loop", f"{case}/threads{n}"))
+
+    # Parent-side cost of shipping one 1024-event chunk to a worker process.
+    chunk = cases["audit"][0][:1024]
+    for name, dump in (("pickle", lambda: pickle.dumps(chunk, pickle.HIGHEST_PROTOCOL)), ("marshal", lambda: marshal.dumps(chunk))):
+        start = time.perf_counter()
+        for _ in range(20):
+            dump()
+        print(f"  {name:<8} {(time.perf_counter() - start) / 20 * 1e3:8.2f} ms per chunk")
+
+
+if __name__ == "__main__":
+    main()
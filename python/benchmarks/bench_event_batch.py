@@ -0,0 +1,67 @@
+"""Benchmark: columnar EventBatch (NumPy and pure Python) vs per-dict ordering and cursor derivation."""
+
+from __future__ import annotations
+
+import random
+from functools import cmp_to_key
+
+from _harness import measure, parse_args, report, speedup
+
+from talos_contracts import EventBatch, derive_cursor, ordering_compare, uuid7_batch
+
+try:
+    import numpy  # noqa: F401
+
+    BACKENDS = [("numpy", True), ("python", False)]
+except ImportError:
+    BACKENDS = [("python", False)]
+
+
+def main() -> None:
+    args = parse_args(__doc__)
+    count = 100_000 if args.quick else 1_000_000
+    runs = 3
+    rng = random.Random(12)
+    ids = uuid7_batch(count)
+    rng.shuffle(ids)
+    ts = [rng.randrange(1_700_000_000, 1_700_000_000 + count // 100) for _ in ids]
+    events = [{"timestamp": t, "event_id": e} for t, e in zip(ts, ids, strict=True)]
+    cmp_key = cmp_to_key(ordering_compare)
+
+    results = {
+        "sort/dicts_cmp_to_key": measure(lambda: sorted(events, key=cmp_key), runs=runs, min_time=0),
+        "derive/dicts_loop": measure(
+            lambda: [derive_cursor(e["timestamp"], e["event_id"]) for e in events], runs=runs, min_time=0
+        ),
+    }
+    expected_order = None
+    for name, use_numpy in BACKENDS:
+        results[f"build/{name}"] = measure(
+            lambda use_numpy=use_numpy: EventBatch(ts, ids, use_numpy=use_numpy), runs=runs, min_time=0
+        )
+        batch = EventBatch(ts, ids, use_numpy=use_numpy)
+        order = batch.order()
+        if expected_order is None:
+            expected_order = order
+            assert [events[i] for i in order] == sorted(events, key=cmp_key)
+            assert batch.derive_cursors() == [derive_cursor(t, e) for t, e in zip(ts, ids, strict=True)]
+        assert order == expected_order
+
+        ordered = batch.sorted()
+        probes = rng.sample(ordered.derive_cursors(), 10_000)
+        results[f"sort/{name}"] = measure(batch.order, runs=runs, min_time=0)
+        results[f"derive/{name}"] = measure(batch.derive_cursors, runs=runs, min_time=0)
+        results[f"seek10k/{name}"] = measure(
+            lambda ordered=ordered, probes=probes: ordered.seek_many(probes), runs=runs
+        )
+
+    print(f"{count:,} rows")
+    report(args, results, runs=runs)
+    print()
+    for name, _ in BACKENDS:
+        print(speedup(results, "sort/dicts_cmp_to_key", f"sort/{name}"))
+        print(speedup(results, "derive/dicts_loop", f"derive/{name}"))
+
+
+if __name__ == "__main__":
+    main()
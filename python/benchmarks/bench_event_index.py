@@ -0,0 +1,91 @@
+"""Benchmark: EventIndex page(after=cursor) vs per-request scan or sort, 10^4..10^7 events."""
+
+from __future__ import annotations
+
+import heapq
+import random
+import time
+from collections.abc import Iterator
+from functools import cmp_to_key
+
+from _harness import measure, parse_args, report
+
+from talos_contracts import EventIndex, decode_cursor, derive_cursor, ordering_compare, uuid7_batch
+
+LIMIT = 50
+# Per-request baselines are skipped above these sizes; they only get slower.
+MAX_SORT = 100_000
+MAX_SCAN = 1_000_000
+
+
+def make_events(count: int) -> list[dict]:
+    rng = random.Random(1)
+    ids = uuid7_batch(count)
+    return [{"timestamp": rng.randrange(count // 4 + 1), "event_id": eid} for eid in ids]
+
+
+def main() -> None:
+    args = parse_args(
+        __doc__,
+        lambda p: p.add_argument(
+            "--max-exp", type=int, default=6, help="largest size is 10**N events (7 needs ~4 GB RAM)"
+        ),
+    )
+    max_exp = 5 if args.quick else args.max_exp
+    rng = random.Random(2)
+    results = {}
+
+    for exp in range(4, max_exp + 1):
+        n = 10**exp
+        events = make_events(n)
+        ordered = sorted(events, key=lambda e: (e["timestamp"], e["event_id"]), reverse=True)
+        probes = [derive_cursor(e["timestamp"], e["event_id"]) for e in rng.sample(ordered, 64)]
+
+        start = time.perf_counter()
+        index = EventIndex()
+        # Ingest order: each batch is newer than everything already indexed.
+        for i in range(n, 0, -10_000):
+            index.extend(ordered[max(0, i - 10_000) : i])
+        build = time.perf_counter() - start
+        print(f"10^{exp}: bulk build {build:.2f}s ({n / build:,.0f} events/s)")
+
+        cursors = iter(probes * 1_000_000)
+
+        def page(index: EventIndex = index, cursors: Iterator[str] = cursors) -> None:
+            index.page(after=next(cursors), limit=LIMIT)
+
+        results[f"page/10^{exp}/index"] = measure(page)
+
+        probe = probes[0]
+        expected = index.page(after=probe, limit=LIMIT)["events"]
+
+        def sort_slice(events: list[dict] = events, probe: str = probe) -> list[dict]:
+            # Sort, then slice after the first event that orders after the cursor.
+            after = decode_cursor(probe)
+            srt = sorted(events, key=cmp_to_key(ordering_compare))
+            pos = next(i for i, e in enumerate(srt) if ordering_compare(e, after) > 0)
+            return srt[pos : pos + LIMIT]
+
+        def scan(events: list[dict] = events, probe: str = probe) -> list[dict]:
+            after = decode_cursor(probe)
+            key = (after["timestamp"], after["event_id"])
+            return heapq.nlargest(
+                LIMIT,
+                (e for e in events if (e["timestamp"], e["event_id"]) < key),
+                key=lambda e: (e["timestamp"], e["event_id"]),
+            )
+
+        if n <= MAX_SCAN:
+            assert scan() == expected
+            results[f"page/10^{exp}/scan"] = measure(scan, runs=3)
+        if n <= MAX_SORT:
+            assert sort_slice() == expected
+            results[f"page/10^{exp}/sort_slice"] = measure(sort_slice, runs=3)
+        del events, ordered, index, page, scan, sort_slice
+
+    print()
+    report(args, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark: Merkle checkpoints and proofs over execution logs of 10^3 to 10^7 entries."""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import time
+
+from _harness import measure, parse_args, report
+
+from talos_contracts import ExecutionLogMerkleTree, verify_consistency_proof, verify_inclusion_proof
+
+
+def entry_digests(start: int, stop: int):
+    sha256 = hashlib.sha256
+    return (sha256(i.to_bytes(8, "big")).hexdigest() for i in range(start, stop))
+
+
+def chain_replay(n: int) -> str:
+    """Lower bound of proving membership by replaying the linear chain: one hash per entry."""
+    sha256 = hashlib.sha256
+    prev = b"\x00" * 32
+    for digest in entry_digests(0, n):
+        prev = sha256(prev + bytes.fromhex(digest)).digest()
+    return prev.hex()
+
+
+def main() -> None:
+    args = parse_args(__doc__)
+    exponents = range(3, 6) if args.quick else range(3, 8)
+    runs = 3 if args.quick else 5
+    rng = random.Random(5)
+
+    tree = ExecutionLogMerkleTree()
+    results = {}
+    rows = []
+    for exponent in exponents:
+        size = 10**exponent
+        before = len(tree)
+        start = time.perf_counter()
+        tree.extend(entry_digests(before, size))
+        extend_rate = (size - before) / (time.perf_counter() - start)
+        old = size // 3
+        index = rng.randrange(size)
+        digest = next(entry_digests(index, index + 1))
+        root, old_root = tree.root(), tree.root(old)
+        inclusion = tree.inclusion_proof(index)
+        consistency = tree.consistency_proof(old)
+        assert verify_inclusion_proof(digest, index, size, inclusion, root)
+        assert verify_consistency_proof(old, size, old_root, root, consistency)
+
+        name = f"n=1e{exponent}"
+        results[f"{name}/root"] = measure(tree.root, runs=runs)
+        results[f"{name}/inclusion_proof"] = measure(lambda tree=tree, index=index: tree.inclusion_proof(index), runs=runs)
+        results[f"{name}/verify_inclusion"] = measure(
+            lambda digest=digest, index=index, size=size, inclusion=inclusion, root=root: verify_inclusion_proof(
+                digest, index, size, inclusion, root
+            ),
+            runs=runs,
+        )
+        results[f"{name}/consistency_proof"] = measure(lambda tree=tree, old=old: tree.consistency_proof(old), runs=runs)
+        results[f"{name}/verify_consistency"] = measure(
+            lambda old=old, size=size, old_root=old_root, root=root, consistency=consistency: verify_consistency_proof(
+                old, size, old_root, root, consistency
+            ),
+            runs=runs,
+        )
+        if exponent <= 6:
+            results[f"{name}/chain_replay"] = measure(lambda size=size: chain_replay(size), runs=1, warmup=0)
+
+        memory = sum(len(level) for level in tree._levels)
+        # Cost of single appends at this size; the next size extends past them.
+        probe = list(entry_digests(size, size + 1_000))
+        start = time.perf_counter()
+        for probe_digest in probe:
+            tree.append(probe_digest)
+        append_us = (time.perf_counter() - start) / len(probe) * 1e6
+        rows.append((size, len(inclusion), len(consistency), append_us, extend_rate, memory))
+
+    report(args, results, runs=runs)
+    print()
+    print(f"{'entries':>12} {'incl. proof':>12} {'cons. proof':>12} {'append':>10} {'extend':>14} {'tree':>10}")
+    for size, inc, con, append_us, rate, memory in rows:
+        print(
+            f"{size:>12,} {inc:>8} hashes {con:>6} hashes {append_us:>7.2f} us"
+            f" {rate:>10,.0f} /s {memory / 1e6:>7.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark: streaming execution-log chain verification vs a load-everything script."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from _harness import parse_args, report, speedup, throughput_stats, timed_rates
+
+from talos_contracts import canonical_json_bytes, execution_log_entry_digest, verify_execution_log
+
+WORKERS = (0, 1, 4, 8)
+
+
+def write_log(path: Path, count: int, *, start: int = 0, prev: str = "0" * 64) -> str:
+    """Append ``count`` chained entries to ``path``; return the last entry_digest."""
+    with open(path, "ab") as f:
+        for seq in range(start, start + count):
+            entry = {
+                "trace_id": "018d0a5a-5a5a-7a5a-8a5a-5a5a5a5a5a5a",
+                "sequence_number": seq,
+                "type": ("plan", "tool_call", "tool_effect", "observation")[seq % 4],
+                "payload": {"step": seq, "tool": "http.get", "args": {"url": f"https://example.com/{seq}"}},
+                "ts": "2026-01-27T12:00:00.000Z",
+                "prev_entry_digest": prev,
+            }
+            prev = entry["entry_digest"] = execution_log_entry_digest(entry)
+            f.write(canonical_json_bytes(entry) + b"\n")
+    return prev
+
+
+def load_and_loop(path: Path) -> bool:
+    """The ad-hoc script: read the whole log, then walk the chain."""
+    entries = [json.loads(line) for line in path.read_text().splitlines()]
+    prev = "0" * 64
+    for seq, entry in enumerate(entries):
+        if entry["sequence_number"] != seq or entry["prev_entry_digest"] != prev:
+            return False
+        if execution_log_entry_digest(entry) != entry["entry_digest"]:
+            return False
+        prev = entry["entry_digest"]
+    return True
+
+
+def main() -> None:
+    args = parse_args(__doc__)
+    count = 20_000 if args.quick else 200_000
+    runs = 3 if args.quick else 5
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log = Path(tmp) / "trace.jsonl"
+        last = write_log(log, count)
+        assert load_and_loop(log)
+
+        results = {"verify/load_and_loop": throughput_stats(timed_rates(lambda: load_and_loop(log), runs))}
+        for n in WORKERS:
+            result = verify_execution_log(log, workers=n)
+            assert result["ok"] and result["entries"] == count, result
+            results[f"verify/workers{n}"] = throughput_stats(
+                timed_rates(lambda n=n: verify_execution_log(log, workers=n), runs)
+            )
+
+        # Re-verify after 1% more entries were appended.
+        checkpoint = verify_execution_log(log)["checkpoint"]
+        write_log(log, count // 100, start=count, prev=last)
+        resumed = verify_execution_log(log, resume_from=checkpoint)
+        assert resumed["ok"] and resumed["entries"] == count // 100
+        results["verify/resume_1pct_appended"] = throughput_stats(
+            timed_rates(lambda: verify_execution_log(log, resume_from=checkpoint), runs)
+        )
+        size = log.stat().st_size
+
+    print(f"{count:,} entries, {size / 1e6:.1f} MB, {os.cpu_count()} CPUs (times are per log)")
+    report(args, results, runs=runs, warmup=0)
+    print()
+    for name, stats in results.items():
+        if name != "verify/resume_1pct_appended":
+            print(f"  {name:<24} {stats['ops_per_sec'] * count:>12,.0f} entries/s")
+    for n in WORKERS:
+        print(speedup(results, "verify/load_and_loop", f"verify/workers{n}"))
+    print(speedup(results, "verify/workers0", "verify/resume_1pct_appended"))
+
+
+if __name__ == "__main__":
+    main()
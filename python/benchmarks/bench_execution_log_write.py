@@ -0,0 +1,124 @@
+"""Benchmark: execution log appends with group commit vs per-entry fsync, and indexed reads."""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import tempfile
+import threading
+from pathlib import Path
+
+from _harness import measure, parse_args, report, speedup, throughput_stats, timed_rates
+
+from talos_contracts import (
+    ExecutionLogReader,
+    ExecutionLogWriter,
+    canonical_json_bytes,
+    execution_log_entry_digest,
+)
+
+TRACE = "018d0a5a-5a5a-7a5a-8a5a-5a5a5a5a5a5a"
+INTERVALS = (0.0005, 0.002, 0.01)
+PRODUCERS = 8
+
+
+def payload(i: int) -> dict:
+    return {"step": i, "tool": "http.get", "args": {"url": f"https://example.com/{i}"}}
+
+
+def fsync_each(directory: Path, count: int) -> None:
+    """Today's producers: build the entry, digest it, write and fsync one line."""
+    prev = "0" * 64
+    with open(directory / "per_entry.jsonl", "ab") as f:
+        for seq in range(count):
+            entry = {
+                "trace_id": TRACE,
+                "sequence_number": seq,
+                "type": "tool_call",
+                "payload": payload(seq),
+                "ts": "2026-01-27T12:00:00.000Z",
+                "prev_entry_digest": prev,
+            }
+            prev = entry["entry_digest"] = execution_log_entry_digest(entry)
+            f.write(canonical_json_bytes(entry) + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def writer_threads(directory: Path, count: int, commit_interval: float, producers: int, *, wait: bool = True) -> None:
+    """``producers`` threads append to one trace, each waiting for durability unless ``wait`` is False."""
+    with ExecutionLogWriter(directory, commit_interval=commit_interval) as writer:
+
+        def produce(k: int) -> None:
+            for i in range(k, count, producers):
+                writer.append(TRACE, "tool_call", payload(i), wait=wait)
+
+        threads = [threading.Thread(target=produce, args=(k,)) for k in range(producers)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+
+def main() -> None:
+    args = parse_args(__doc__)
+    count = 2_000 if args.quick else 20_000
+    runs = 3 if args.quick else 5
+    fresh = iter(range(10**9))
+
+    with tempfile.TemporaryDirectory() as tmp:
+
+        def new_dir() -> Path:
+            path = Path(tmp) / f"run{next(fresh)}"
+            path.mkdir()
+            return path
+
+        configs = {
+            "append/fsync_each_entry": lambda: fsync_each(new_dir(), count),
+            "append/writer_interval0_1thread": lambda: writer_threads(new_dir(), count, 0, 1),
+            f"append/writer_interval0_{PRODUCERS}threads": lambda: writer_threads(new_dir(), count, 0, PRODUCERS),
+        }
+        for interval in INTERVALS:
+            configs[f"append/writer_interval{interval * 1e3:g}ms_{PRODUCERS}threads"] = (
+                lambda interval=interval: writer_threads(new_dir(), count, interval, PRODUCERS)
+            )
+        configs["append/writer_interval2ms_1thread_nowait"] = lambda: writer_threads(
+            new_dir(), count, 0.002, 1, wait=False
+        )
+        results = {name: throughput_stats(timed_rates(fn, runs)) for name, fn in configs.items()}
+
+        # Reading entry N: linear scan vs the memory-mapped sequence index.
+        log = new_dir()
+        writer_threads(log, count, 0.002, 1)
+        path = log / f"{TRACE}.jsonl"
+        rng = random.Random(3)
+        targets = [rng.randrange(count) for _ in range(100)]
+
+        def scan() -> None:
+            for n in targets:
+                with open(path, "rb") as f:
+                    for i, line in enumerate(f):
+                        if i == n:
+                            json.loads(line)
+                            break
+
+        with ExecutionLogReader(path) as reader:
+            assert all(reader[n]["sequence_number"] == n for n in targets)
+            results["read_100/linear_scan"] = measure(scan, runs=runs)
+            results["read_100/indexed_mmap"] = measure(lambda: [reader[n] for n in targets], runs=runs)
+
+    print(f"{count:,} entries per append run, {PRODUCERS} producer threads, {os.cpu_count()} CPUs")
+    report(args, results, runs=runs, warmup=0)
+    print()
+    for name, stats in results.items():
+        if name.startswith("append/"):
+            print(f"  {name:<36} {stats['ops_per_sec'] * count:>10,.0f} entries/s")
+    for name in results:
+        if name.startswith("append/writer"):
+            print(speedup(results, "append/fsync_each_entry", name))
+    print(speedup(results, "read_100/linear_scan", "read_100/indexed_mmap"))
+
+
+if __name__ == "__main__":
+    main()
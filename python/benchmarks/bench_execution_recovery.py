@@ -0,0 +1,77 @@
+"""Benchmark: execution state recovery time as the log grows, full replay vs checkpoint plus replay."""
+
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+
+from _harness import measure, parse_args, report, speedup
+
+from talos_contracts import (
+    ExecutionLogWriter,
+    apply_execution_log_entry,
+    execution_checkpoint,
+    initial_execution_state,
+    recover_execution_state,
+)
+
+TRACE = "018d0a5a-5a5a-7a5a-8a5a-5a5a5a5a5a5a"
+PLAN = "018d0a5a-5a5a-7a5a-8a5a-5a5a5a5a5a5b"
+INTERVAL = 1_000
+
+
+def write_log(directory: Path, count: int) -> tuple[Path, list, dict]:
+    """Write ``count`` entries, checkpointing every INTERVAL entries; return log, checkpoints and final state."""
+    state = initial_execution_state(TRACE, PLAN)
+    checkpoints = []
+    with ExecutionLogWriter(directory, commit_interval=0.002) as writer:
+        for i in range(count):
+            payload = {"step": i, "tool": "http.get", "args": {"url": f"https://example.com/{i}"}}
+            if i in (0, 1, 2):
+                payload["to_state"] = ("PENDING", "AUTHORIZED", "EXECUTING")[i]
+            entry = writer.append(TRACE, "tool_call", payload, wait=False)
+            state = apply_execution_log_entry(state, entry)
+            if (i + 1) % INTERVAL == 0:
+                checkpoints.append(execution_checkpoint(state))
+    return writer.log_path(TRACE), checkpoints, state
+
+
+def main() -> None:
+    args = parse_args(__doc__)
+    exponents = range(3, 6) if args.quick else range(3, 7)
+    runs = 3 if args.quick else 5
+
+    results = {}
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for exponent in exponents:
+            # INTERVAL - 1 entries past the last checkpoint: the longest suffix.
+            count = 10**exponent + INTERVAL - 1
+            log, checkpoints, state = write_log(Path(tmp) / f"n{exponent}", count)
+
+            def full(log: Path = log, state: dict = state) -> dict:
+                return recover_execution_state(log, TRACE, PLAN, stored_state=state)
+
+            def fast(log: Path = log, checkpoints: list = checkpoints, state: dict = state) -> dict:
+                return recover_execution_state(log, TRACE, PLAN, checkpoints=checkpoints, stored_state=state)
+
+            for fn in (full, fast):
+                result = fn()
+                assert result["chain_valid"] and not result["state_diverged"] and result["state"] == state
+            name = f"n=1e{exponent}"
+            results[f"{name}/full_replay"] = measure(full, runs=1 if exponent >= 6 else runs)
+            results[f"{name}/checkpoint_replay"] = measure(fast, runs=runs)
+            rows.append((name, count, full()["replayed"], fast()["replayed"], len(checkpoints)))
+
+    report(args, results, runs=runs)
+    print()
+    print(f"checkpoint every {INTERVAL:,} entries; each log ends {INTERVAL - 1:,} entries past its last checkpoint")
+    print(f"{'log':>8} {'entries':>12} {'full replay':>12} {'suffix':>8} {'checkpoints':>12}")
+    for name, count, full_n, fast_n, n_checkpoints in rows:
+        print(f"{name:>8} {count:>12,} {full_n:>12,} {fast_n:>8,} {n_checkpoints:>12,}")
+    for name, *_ in rows:
+        print(speedup(results, f"{name}/full_replay", f"{name}/checkpoint_replay"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Benchmark: ordering_key / merge_ordered vs sorted(..., key=cmp_to_key(ordering_compare))."""
+
+from __future__ import annotations
+
+import random
+from functools import cmp_to_key
+from itertools import chain
+
+from _harness import measure, parse_args, report, speedup
+
+from talos_contracts import merge_ordered, ordering_compare, ordering_key, uuid7_batch
+
+SHARDS = 8
+
+
+def main() -> None:
+    args = parse_args(__doc__)
+    count = 20_000 if args.quick else 200_000
+    runs = 3 if args.quick else 5
+    rng = random.Random(6)
+
+    # About 100 events per second of timestamp, so event_id tie-breaks are common.
+    events = [{"timestamp": rng.randrange(count // 100), "event_id": eid} for eid in uuid7_batch(count)]
+    rng.shuffle(events)
+    cmp_key = cmp_to_key(ordering_compare)
+    shards = [sorted(events[i::SHARDS], key=ordering_key) for i in range(SHARDS)]
+
+    expected = sorted(events, key=cmp_key)
+    assert sorted(events, key=ordering_key) == expected
+    assert list(merge_ordered(*shards)) == expected
+
+    results = {
+        "sort/cmp_to_key": measure(lambda: sorted(events, key=cmp_key), runs=runs),
+        "sort/ordering_key": measure(lambda: sorted(events, key=ordering_key), runs=runs),
+        f"merge{SHARDS}/sort_chain_cmp_to_key": measure(
+            lambda: sorted(chain.from_iterable(shards), key=cmp_key), runs=runs
+        ),
+        f"merge{SHARDS}/merge_ordered": measure(lambda: list(merge_ordered(*shards)), runs=runs),
+        f"merge{SHARDS}/merge_ordered_dedupe": measure(
+            lambda: list(merge_ordered(*shards, dedupe=True)), runs=runs
+        ),
+    }
+    print(f"{count:,} events, {SHARDS} shards")
+    report(args, results, runs=runs)
+    print()
+    print(speedup(results, "sort/cmp_to_key", "sort/ordering_key"))
+    print(speedup(results, f"merge{SHARDS}/sort_chain_cmp_to_key", f"merge{SHARDS}/merge_ordered"))
+
+
+if __name__ == "__main__":
+    main()
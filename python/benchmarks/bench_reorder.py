@@ -0,0 +1,124 @@
+"""Benchmark: ReorderBuffer throughput and per-push tail latency at several disorder rates."""
+
+from __future__ import annotations
+
+import random
+import statistics
+import time
+
+from _harness import parse_args, report, throughput_stats, timed_rates
+
+from talos_contracts import ReorderBuffer, uuid7_batch
+
+RATE = 1_000  # events per second of event time
+LATENESS = 2
+
+
+def make_stream(count: int, disorder: float, seed: int = 8) -> list[dict]:
+    """In-order events where a ``disorder`` fraction is delivered up to 2*LATENESS seconds late."""
+    rng = random.Random(seed)
+    events = [{"timestamp": 1_700_000_000 + i // RATE, "event_id": eid} for i, eid in enumerate(uuid7_batch(count))]
+    arrival = [
+        e["timestamp"] + (rng.uniform(0, 2 * LATENESS) if rng.random() < disorder else 0.0) + i * 1e-9
+        for i, e in enumerate(events)
+    ]
+    order = sorted(range(count), key=arrival.__getitem__)
+    return [events[i] for i in order]
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def main() -> None:
+    args = parse_args(__doc__)
+    # resort_all is quadratic in the stream length, which bounds the full size.
+    count = 50_000 if args.quick else 200_000
+    runs = 3
+    results = {}
+    tails = []
+
+    for disorder in (0.0, 0.01, 0.1, 0.5):
+        stream = make_stream(count, disorder)
+
+        def run_buffer(stream: list[dict] = stream) -> None:
+            buffer = ReorderBuffer(lateness=LATENESS)
+            push = buffer.push
+            for e in stream:
+                push(e)
+            buffer.flush()
+
+        def run_batched(stream: list[dict] = stream) -> None:
+            # Frames handed over in receive batches of 64.
+            buffer = ReorderBuffer(lateness=LATENESS)
+            for i in range(0, count, 64):
+                buffer.push_many(stream[i : i + 64])
+            buffer.flush()
+
+        def run_resort_all(stream: list[dict] = stream) -> None:
+            # Previous approach: buffer everything and re-sort whenever the
+            # watermark moves, releasing what is below it.
+            kept: list[dict] = []
+            released = 0
+            max_ts = None
+            for e in stream:
+                kept.append(e)
+                if max_ts is None or e["timestamp"] > max_ts:
+                    max_ts = e["timestamp"]
+                    kept.sort(key=lambda x: (x["timestamp"], x["event_id"]))
+                    while released < len(kept) and kept[released]["timestamp"] < max_ts - LATENESS:
+                        released += 1
+
+        def run_resort_window(stream: list[dict] = stream) -> None:
+            # The same, hand-rolled with released events dropped (no late detection).
+            pending: list[dict] = []
+            max_ts = None
+            for e in stream:
+                pending.append(e)
+                if max_ts is None or e["timestamp"] > max_ts:
+                    max_ts = e["timestamp"]
+                    pending.sort(key=lambda x: (x["timestamp"], x["event_id"]))
+                    cut = 0
+                    while cut < len(pending) and pending[cut]["timestamp"] < max_ts - LATENESS:
+                        cut += 1
+                    del pending[:cut]
+
+        label = f"disorder={disorder:g}"
+        results[f"{label}/reorder_buffer"] = throughput_stats(timed_rates(run_buffer, runs))
+        results[f"{label}/reorder_buffer_batched"] = throughput_stats(timed_rates(run_batched, runs))
+        results[f"{label}/resort_all"] = throughput_stats(timed_rates(run_resort_all, runs))
+        results[f"{label}/resort_window"] = throughput_stats(timed_rates(run_resort_window, runs))
+
+        buffer = ReorderBuffer(lateness=LATENESS)
+        latencies = []
+        clock = time.perf_counter_ns
+        for e in stream:
+            start = clock()
+            buffer.push(e)
+            latencies.append(clock() - start)
+        latencies.sort()
+        tails.append(
+            (
+                label,
+                statistics.median(latencies) / 1e3,
+                percentile(latencies, 0.99) / 1e3,
+                percentile(latencies, 0.999) / 1e3,
+                buffer.stats["max_buffered"],
+                buffer.stats["late"],
+            )
+        )
+
+    print(f"{count:,} events per run, {RATE} events/s event time, lateness {LATENESS}s")
+    report(args, results, runs=runs, warmup=0)
+    print()
+    print(f"{'':<40}  {'events/s':>12}")
+    for name, stats in results.items():
+        print(f"{name:<40}  {stats['ops_per_sec'] * count:>12,.0f}")
+    print()
+    print(f"{'push latency':<16}  {'p50 us':>8}  {'p99 us':>8}  {'p99.9 us':>8}  {'max buffered':>12}  {'late':>6}")
+    for label, p50, p99, p999, buffered, late in tails:
+        print(f"{label:<16}  {p50:>8.2f}  {p99:>8.2f}  {p999:>8.2f}  {buffered:>12,}  {late:>6,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark: per-object calculate_digest checks vs the streaming TGA trace-chain verifier."""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+import random
+from pathlib import Path
+
+from _harness import parse_args, report, speedup, throughput_stats, timed_rates
+
+from talos_contracts import TraceChainVerifier, calculate_digest, uuid7_batch
+
+GOLDEN = json.loads(
+    (Path(__file__).resolve().parents[2] / "test_vectors" / "tga" / "golden_trace_chain.json").read_text()
+)
+ORDER = ["action_request", "supervisor_decision", "tool_call", "tool_effect"]
+LINKS = {"supervisor_decision": "action_request", "tool_call": "supervisor_decision", "tool_effect": "tool_call"}
+
+
+def make_traces(count: int, tamper_rate: float = 0.01) -> list[dict]:
+    """``count`` four-object traces with fresh ids; ``tamper_rate`` of them have an edited tool_call."""
+    rng = random.Random(11)
+    objects = []
+    for trace in range(count):
+        ids = iter(uuid7_batch(8))
+        trace_id, plan_id = next(ids), next(ids)
+        chain = {name: copy.deepcopy(GOLDEN[name]) for name in ORDER}
+        for name in ORDER:
+            obj = chain[name]
+            obj["trace_id"], obj["plan_id"] = trace_id, plan_id
+            obj[f"{name}_id"] = next(ids)
+            parent = LINKS.get(name)
+            if parent:
+                obj[f"{parent}_id"] = chain[parent][f"{parent}_id"]
+                obj[f"{parent}_digest"] = chain[parent]["_digest"]
+            obj["_digest"] = calculate_digest(obj)
+        if rng.random() < tamper_rate:
+            chain["tool_call"]["call"]["args"]["name"] = f"fix/{trace}"
+        objects.extend(chain[name] for name in ORDER)
+    return objects
+
+
+def loop(objects: list[dict]) -> int:
+    """What the digest tests do today: re-hash each object and re-hash the parent for each link."""
+    broken = 0
+    for k in range(0, len(objects), 4):
+        chain = dict(zip(ORDER, objects[k : k + 4], strict=True))
+        for name, obj in chain.items():
+            broken += calculate_digest(obj) != obj["_digest"]
+            parent = LINKS.get(name)
+            if parent:
+                broken += calculate_digest(chain[parent]) != obj[f"{parent}_digest"]
+                broken += obj[f"{parent}_id"] != chain[parent][f"{parent}_id"]
+    return broken
+
+
+def main() -> None:
+    args = parse_args(__doc__)
+    count = 5_000 if args.quick else 50_000
+    runs = 3 if args.quick else 5
+    objects = make_traces(count)
+    workers = min(4, os.cpu_count() or 1)
+
+    def serial() -> int:
+        return sum(1 for _ in TraceChainVerifier().verify(objects))
+
+    def parallel() -> int:
+        return sum(1 for _ in TraceChainVerifier(chunk_size=1_024, workers=workers).verify(objects))
+
+    breaks = serial()
+    assert loop(objects) == breaks
+    assert parallel() == breaks
+
+    results = {
+        "trace_chain/calculate_digest_loop": throughput_stats(timed_rates(lambda: loop(objects), runs)),
+        "trace_chain/verifier": throughput_stats(timed_rates(serial, runs)),
+        f"trace_chain/verifier_workers{workers}": throughput_stats(timed_rates(parallel, runs)),
+    }
+    print(f"{count:,} traces of 4 objects, {breaks:,} breaks, {os.cpu_count()} CPUs")
+    report(args, results, runs=runs, warmup=0)
+    print()
+    for name, stats in results.items():
+        print(f"  {name:<36} {stats['ops_per_sec'] * count:>12,.0f} traces/s")
+    print(speedup(results, "trace_chain/calculate_digest_loop", "trace_chain/verifier"))
+    print(speedup(results, "trace_chain/calculate_digest_loop", f"trace_chain/verifier_workers{workers}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark: UUIDv7 generation throughput under multi-threaded contention."""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+
+from _harness import parse_args, report, throughput_stats
+
+from talos_contracts import UUIDv7Generator
+
+
+def run(threads: int, per_thread: int, batch: int) -> float:
+    """Generate ``threads * per_thread`` ids; return ids per second."""
+    gen = UUIDv7Generator()
+    barrier = threading.Barrier(threads + 1)
+
+    def work() -> None:
+        barrier.wait()
+        if batch == 1:
+            for _ in range(per_thread):
+                gen.uuid7()
+        else:
+            for _ in range(per_thread // batch):
+                gen.uuid7_batch(batch)
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    for w in workers:
+        w.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for w in workers:
+        w.join()
+    return threads * per_thread / (time.perf_counter() - start)
+
+
+def run_uuid4(count: int) -> float:
+    """Reference rate of ``str(uuid.uuid4())`` on one thread."""
+    start = time.perf_counter()
+    for _ in range(count):
+        str(uuid.uuid4())
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    args = parse_args(__doc__)
+    per_thread = 5_000 if args.quick else 50_000
+
+    runs = 3
+    results = {
+        "reference/uuid4": throughput_stats([run_uuid4(per_thread) for _ in range(runs)]),
+    }
+    for threads in (1, 2, 4, 8):
+        for batch in (1, 64, 1024):
+            name = f"threads={threads}/" + ("uuid7" if batch == 1 else f"batch{batch}")
+            results[name] = throughput_stats([run(threads, per_thread, batch) for _ in range(runs)])
+
+    print("ops = one id, all threads combined")
+    report(args, results, runs=runs, warmup=0)
+
+
+if __name__ == "__main__":
+    main()
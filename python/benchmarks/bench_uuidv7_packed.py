@@ -0,0 +1,74 @@
+"""Benchmark: memory and sort throughput of packed vs string UUIDv7 columns."""
+
+from __future__ import annotations
+
+import random
+import tracemalloc
+from functools import cmp_to_key
+
+from _harness import parse_args, report, throughput_stats, timed_rates
+
+from talos_contracts import (
+    ordering_compare,
+    pack_uuid7,
+    pack_uuid7_many,
+    sort_packed_uuid7,
+    unpack_uuid7_many,
+    uuid7_batch,
+)
+
+
+def traced_size(build) -> tuple[int, object]:
+    """Bytes retained by the object ``build()`` returns."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    obj = build()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return after - before, obj
+
+
+def main() -> None:
+    args = parse_args(__doc__)
+    count = 100_000 if args.quick else 1_000_000
+    source = []
+    while len(source) < count:
+        source += uuid7_batch(1000)
+    random.shuffle(source)
+    text = "".join(source)  # keep the generator's strings out of the measurement
+
+    str_size, ids = traced_size(lambda: [text[i : i + 36] for i in range(0, len(text), 36)])
+    bytes_size, keys = traced_size(lambda: [pack_uuid7(v) for v in ids])
+    buffer_size, packed = traced_size(lambda: pack_uuid7_many(ids))
+
+    print(f"{count:,} ids, retained memory:")
+    for name, size in (
+        ("list[str]", str_size),
+        ("list[bytes] (pack_uuid7)", bytes_size),
+        ("bytes buffer (pack_uuid7_many)", buffer_size),
+    ):
+        print(f"  {name:<32} {size:>14,} bytes  {size / count:6.1f} B/id")
+    print()
+
+    expected = sorted(ids, reverse=True)
+    assert unpack_uuid7_many(sort_packed_uuid7(packed)) == expected
+    assert [pack_uuid7(v) for v in expected] == sorted(keys, reverse=True)
+    events = [{"timestamp": 1, "event_id": v} for v in ids[: count // 10]]
+
+    runs = 3
+    results = {
+        "sort/str": throughput_stats(timed_rates(lambda: sorted(ids, reverse=True), runs)),
+        "sort/bytes_keys": throughput_stats(timed_rates(lambda: sorted(keys, reverse=True), runs)),
+        "sort/packed_buffer": throughput_stats(timed_rates(lambda: sort_packed_uuid7(packed), runs)),
+        "pack_many": throughput_stats(timed_rates(lambda: pack_uuid7_many(ids), runs)),
+        "unpack_many": throughput_stats(timed_rates(lambda: unpack_uuid7_many(packed), runs)),
+        f"reference/cmp_to_key_sort_{len(events)}": throughput_stats(
+            timed_rates(lambda: sorted(events, key=cmp_to_key(ordering_compare)), runs)
+        ),
+    }
+    print(f"ops = one full pass over {count:,} ids")
+    report(args, results, runs=runs, warmup=0)
+
+
+if __name__ == "__main__":
+    main()
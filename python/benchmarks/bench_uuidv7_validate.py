@@ -0,0 +1,69 @@
+"""Benchmark: one-pass UUIDv7 validation vs the regex + lowercase two-call path."""
+
+from __future__ import annotations
+
+import os
+import re
+
+from _harness import measure, parse_args, report, speedup
+
+from talos_contracts import (
+    is_canonical_lower_uuid,
+    is_canonical_uuid_v7,
+    is_uuid_v7,
+    validate_uuid_v7_many,
+)
+
+# --- Reference: the regex validator is_canonical_uuid_v7 replaced ----------
+
+_RE_UUID = re.compile(
+    r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+)
+
+
+def legacy_is_uuid_v7(value: str) -> bool:
+    if not _RE_UUID.match(value):
+        return False
+    if value[14].lower() != "7":
+        return False
+    return value[19].lower() in ("8", "9", "a", "b")
+
+
+def random_v7() -> str:
+    h = os.urandom(16).hex()
+    variant = "89ab"[int(h[16], 16) & 3]
+    return f"{h[:8]}-{h[8:12]}-7{h[13:16]}-{variant}{h[17:20]}-{h[20:32]}"
+
+
+def main() -> None:
+    args = parse_args(__doc__)
+    count = 10_000 if args.quick else 100_000
+    ids = [random_v7() for _ in range(count)]
+    one = ids[0]
+    assert validate_uuid_v7_many(ids) == b"\x01" * count
+
+    results = {
+        "single/legacy_two_call": measure(
+            lambda: legacy_is_uuid_v7(one) and is_canonical_lower_uuid(one)
+        ),
+        "single/two_call": measure(lambda: is_uuid_v7(one) and is_canonical_lower_uuid(one)),
+        "single/is_canonical_uuid_v7": measure(lambda: is_canonical_uuid_v7(one)),
+        "column/legacy_two_call": measure(
+            lambda: [legacy_is_uuid_v7(v) and is_canonical_lower_uuid(v) for v in ids], runs=5
+        ),
+        "column/is_canonical_uuid_v7": measure(
+            lambda: [is_canonical_uuid_v7(v) for v in ids], runs=5
+        ),
+        "column/validate_uuid_v7_many": measure(lambda: validate_uuid_v7_many(ids), runs=5),
+    }
+
+    print(f"column size: {count}")
+    report(args, results)
+    print()
+    print(speedup(results, "single/legacy_two_call", "single/is_canonical_uuid_v7"))
+    print(speedup(results, "column/legacy_two_call", "column/is_canonical_uuid_v7"))
+    print(speedup(results, "column/legacy_two_call", "column/validate_uuid_v7_many"))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,53 +6,210 @@ Public API - all exports are stable and backward-compatible.
 # Infrastructure layer
 # Domain layer - logic
 from talos_contracts.domain.logic import (
+    AuditEventVerifier,
+    CursorCodec,
+    CursorStreamValidator,
+    EventBatch,
+    EventIndex,
+    ExecutionLogMerkleTree,
+    ExecutionLogReader,
+    ExecutionLogWriter,
+    ReorderBuffer,
+    TraceChainVerifier,
+    apply_execution_log_entry,
     assert_cursor_invariant,
+    audit_event_hash,
     compare_cursor,
+    cursor_sort_key,
     decode_cursor,
     derive_cursor,
+    execution_checkpoint,
+    execution_log_entry_digest,
+    execution_state_digest,
+    initial_execution_state,
+    is_unix_seconds_int,
+    merge_ordered,
     ordering_compare,
+    ordering_key,
+    recover_execution_state,
+    validate_cursor_stream,
+    verify_audit_events,
+    verify_consistency_proof,
+    verify_execution_log,
+    verify_inclusion_proof,
+    verify_trace_chains,
 )
 
 # Domain layer - types
 from talos_contracts.domain.types import (
+    AuditHashMismatch,
+    AuditHashMismatchReason,
+    AuditHashSummary,
     CursorBad,
     CursorOk,
+    CursorStreamFailure,
+    CursorStreamSummary,
     CursorValidationReason,
     CursorValidationResult,
     DecodedCursor,
+    EventPage,
+    ExecutionCheckpoint,
+    ExecutionCheckpointState,
+    ExecutionLogBreak,
+    ExecutionLogBreakReason,
+    ExecutionLogCheckpoint,
+    ExecutionLogEntry,
+    ExecutionLogEntryType,
+    ExecutionLogVerification,
+    ExecutionRecovery,
+    ExecutionState,
+    ExecutionStateName,
+    MerkleCheckpoint,
+    ReorderOutput,
+    ReorderStats,
+    TraceChainArtifact,
+    TraceChainBreak,
+    TraceChainBreakReason,
+    TraceChainSummary,
 )
 from talos_contracts.infrastructure import (
+    Base64UrlDecodeManyResult,
+    Base64UrlDecoder,
+    Base64UrlEncoder,
     Base64UrlError,
+    CanonicalJsonCheck,
+    CanonicalJsonViolation,
+    FrozenDict,
+    FrozenList,
+    UUIDv7Generator,
     base64url_decode,
+    base64url_decode_into,
+    base64url_decode_many,
     base64url_encode,
+    base64url_encode_many,
     calculate_digest,
+    calculate_digest_streaming,
     canonical_json_bytes,
+    canonical_json_write,
+    digest_many,
+    freeze_json,
+    is_canonical_json,
     is_canonical_lower_uuid,
+    is_canonical_uuid_v7,
     is_uuid_v7,
+    pack_uuid7,
+    pack_uuid7_many,
+    sort_packed_uuid7,
+    unpack_uuid7,
+    unpack_uuid7_many,
+    uuid7,
+    uuid7_batch,
+    uuid7_timestamp_ms,
+    validate_uuid_v7_many,
 )
 
 __all__ = [
     # Infrastructure: Canonicalization
     "canonical_json_bytes",
+    "canonical_json_write",
     "calculate_digest",
+    "calculate_digest_streaming",
+    "digest_many",
+    "FrozenDict",
+    "FrozenList",
+    "freeze_json",
+    "is_canonical_json",
+    "CanonicalJsonCheck",
+    "CanonicalJsonViolation",
     # Infrastructure: Base64url
     "Base64UrlError",
     "base64url_encode",
     "base64url_decode",
+    "base64url_encode_many",
+    "base64url_decode_many",
+    "Base64UrlDecodeManyResult",
+    "base64url_decode_into",
+    "Base64UrlEncoder",
+    "Base64UrlDecoder",
     # Infrastructure: UUIDv7
     "is_uuid_v7",
     "is_canonical_lower_uuid",
+    "is_canonical_uuid_v7",
+    "validate_uuid_v7_many",
+    "UUIDv7Generator",
+    "uuid7",
+    "uuid7_batch",
+    "uuid7_timestamp_ms",
+    "pack_uuid7",
+    "unpack_uuid7",
+    "pack_uuid7_many",
+    "unpack_uuid7_many",
+    "sort_packed_uuid7",
     # Domain: Cursor types
     "CursorValidationReason",
     "CursorOk",
     "CursorBad",
     "CursorValidationResult",
     "DecodedCursor",
+    "CursorStreamFailure",
+    "CursorStreamSummary",
+    "EventPage",
+    "ReorderOutput",
+    "ReorderStats",
     # Domain: Cursor operations
     "derive_cursor",
     "decode_cursor",
     "compare_cursor",
     "assert_cursor_invariant",
+    "cursor_sort_key",
+    "is_unix_seconds_int",
+    "CursorCodec",
+    "CursorStreamValidator",
+    "validate_cursor_stream",
+    "EventIndex",
+    "EventBatch",
     # Domain: Ordering
     "ordering_compare",
+    "ordering_key",
+    "merge_ordered",
+    "ReorderBuffer",
+    # Domain: TGA execution log
+    "ExecutionLogEntryType",
+    "ExecutionLogEntry",
+    "ExecutionLogBreakReason",
+    "ExecutionLogBreak",
+    "ExecutionLogCheckpoint",
+    "ExecutionLogVerification",
+    "execution_log_entry_digest",
+    "verify_execution_log",
+    "ExecutionLogWriter",
+    "ExecutionLogReader",
+    "ExecutionLogMerkleTree",
+    "MerkleCheckpoint",
+    "verify_inclusion_proof",
+    "verify_consistency_proof",
+    "ExecutionStateName",
+    "ExecutionState",
+    "ExecutionCheckpointState",
+    "ExecutionCheckpoint",
+    "ExecutionRecovery",
+    "execution_state_digest",
+    "initial_execution_state",
+    "apply_execution_log_entry",
+    "execution_checkpoint",
+    "recover_execution_state",
+    # Domain: TGA trace chain
+    "TraceChainArtifact",
+    "TraceChainBreakReason",
+    "TraceChainBreak",
+    "TraceChainSummary",
+    "TraceChainVerifier",
+    "verify_trace_chains",
+    # Domain: audit events
+    "AuditHashMismatchReason",
+    "AuditHashMismatch",
+    "AuditHashSummary",
+    "audit_event_hash",
+    "AuditEventVerifier",
+    "verify_audit_events",
 ]
@@ -3,18 +3,31 @@
 # Types
 # Logic
 from talos_contracts.domain.logic import (
+    CursorCodec,
+    CursorStreamValidator,
+    EventBatch,
+    EventIndex,
+    ReorderBuffer,
     assert_cursor_invariant,
     compare_cursor,
     decode_cursor,
     derive_cursor,
+    merge_ordered,
     ordering_compare,
+    ordering_key,
+    validate_cursor_stream,
 )
 from talos_contracts.domain.types import (
     CursorBad,
     CursorOk,
+    CursorStreamFailure,
+    CursorStreamSummary,
     CursorValidationReason,
     CursorValidationResult,
     DecodedCursor,
+    EventPage,
+    ReorderOutput,
+    ReorderStats,
 )
 
 __all__ = [
@@ -24,10 +37,23 @@ __all__ = [
     "CursorBad",
     "CursorValidationResult",
     "DecodedCursor",
+    "CursorStreamFailure",
+    "CursorStreamSummary",
+    "EventPage",
+    "ReorderOutput",
+    "ReorderStats",
     # Logic
     "derive_cursor",
     "decode_cursor",
     "compare_cursor",
     "assert_cursor_invariant",
+    "CursorCodec",
+    "CursorStreamValidator",
+    "validate_cursor_stream",
+    "EventIndex",
+    "EventBatch",
     "ordering_compare",
+    "ordering_key",
+    "merge_ordered",
+    "ReorderBuffer",
 ]
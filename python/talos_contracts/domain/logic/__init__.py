@@ -1,17 +1,77 @@
 """Domain logic barrel exports."""
 
+from talos_contracts.domain.logic.audit_stream import (
+    AuditEventVerifier,
+    audit_event_hash,
+    verify_audit_events,
+)
 from talos_contracts.domain.logic.cursor import (
+    CursorCodec,
     assert_cursor_invariant,
     compare_cursor,
+    cursor_sort_key,
     decode_cursor,
     derive_cursor,
+    is_unix_seconds_int,
+)
+from talos_contracts.domain.logic.cursor_stream import (
+    CursorStreamValidator,
+    validate_cursor_stream,
+)
+from talos_contracts.domain.logic.event_batch import EventBatch
+from talos_contracts.domain.logic.event_index import EventIndex
+from talos_contracts.domain.logic.execution_log import (
+    execution_log_entry_digest,
+    verify_execution_log,
+)
+from talos_contracts.domain.logic.execution_log_merkle import (
+    ExecutionLogMerkleTree,
+    verify_consistency_proof,
+    verify_inclusion_proof,
+)
+from talos_contracts.domain.logic.execution_log_store import ExecutionLogReader, ExecutionLogWriter
+from talos_contracts.domain.logic.execution_recovery import (
+    apply_execution_log_entry,
+    execution_checkpoint,
+    execution_state_digest,
+    initial_execution_state,
+    recover_execution_state,
 )
-from talos_contracts.domain.logic.ordering import ordering_compare
+from talos_contracts.domain.logic.ordering import merge_ordered, ordering_compare, ordering_key
+from talos_contracts.domain.logic.reorder import ReorderBuffer
+from talos_contracts.domain.logic.trace_chain import TraceChainVerifier, verify_trace_chains
 
 __all__ = [
     "derive_cursor",
     "decode_cursor",
     "compare_cursor",
     "assert_cursor_invariant",
+    "cursor_sort_key",
+    "is_unix_seconds_int",
+    "CursorCodec",
+    "CursorStreamValidator",
+    "validate_cursor_stream",
+    "EventIndex",
+    "EventBatch",
     "ordering_compare",
+    "ordering_key",
+    "merge_ordered",
+    "ReorderBuffer",
+    "execution_log_entry_digest",
+    "verify_execution_log",
+    "ExecutionLogWriter",
+    "ExecutionLogReader",
+    "ExecutionLogMerkleTree",
+    "verify_inclusion_proof",
+    "verify_consistency_proof",
+    "execution_state_digest",
+    "initial_execution_state",
+    "apply_execution_log_entry",
+    "execution_checkpoint",
+    "recover_execution_state",
+    "TraceChainVerifier",
+    "verify_trace_chains",
+    "audit_event_hash",
+    "AuditEventVerifier",
+    "verify_audit_events",
 ]
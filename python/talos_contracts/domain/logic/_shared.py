@@ -0,0 +1,30 @@
+"""Domain logic (internal): helpers shared by the streaming verifiers."""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from typing import Any
+
+# prev_entry_digest of the first entry of an execution log.
+GENESIS_DIGEST = "0" * 64
+
+
+def utc_now() -> str:
+    """Current time as an RFC 3339 UTC timestamp with millisecond precision."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+def read_jsonl(path: str | os.PathLike[str]) -> Iterator[Any]:
+    """Yield one object per non-empty JSONL line; unparsable lines become ``{}``."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                obj = json.loads(line)
+            except ValueError:
+                obj = {}
+            yield obj if isinstance(obj, dict) else {}
@@ -0,0 +1,251 @@
+"""Domain logic: bulk audit event hash verification (schemas/audit/audit_event.schema.json).
+
+An audit event's ``event_hash`` is the SHA-256 of the JCS of the event
+without ``event_hash``. Results are identical to comparing
+``audit_event_hash(event)`` with the stored hash for every event, but only
+mismatches are emitted, in input order, with running totals.
+
+NDJSON exports are read in large blocks of whole lines and each block is
+parsed and hashed on its own, optionally in a process pool; only raw bytes
+are shipped to the workers and only mismatches come back. Event dicts are
+shipped as ``marshal`` blobs where possible, as in ``digest_many``. Most audit events
+hold strings, integers, booleans and nulls only, and for those the C JSON
+encoder with sorted keys and compact separators produces exactly the JCS
+bytes. A line takes that path when it has no float, no NaN or Infinity, no
+``\\u`` escape and no character outside the Basic Multilingual Plane
+(where code point order and RFC 8785's UTF-16 key order could differ);
+every other line is encoded by ``canonical_json_bytes``. The target is at
+least 40,000 events of about 600 bytes per second per core
+(benchmarks/bench_audit_stream.py).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import suppress
+from typing import Any
+
+from talos_contracts.domain.types.audit_types import (
+    AuditHashMismatch,
+    AuditHashMismatchReason,
+    AuditHashSummary,
+)
+from talos_contracts.infrastructure._parallel import chunks, ordered_map, pack_chunk, unpack_chunk
+from talos_contracts.infrastructure.canonical import calculate_digest, canonical_json_bytes
+
+_EVENT_HASH_EXCLUDE = ["event_hash"]
+_ASTRAL = re.compile("[\U00010000-\U0010ffff]")
+
+
+class _SlowPath(Exception):
+    pass
+
+
+def _refuse(_: str) -> Any:
+    raise _SlowPath
+
+
+_fast_decode = json.JSONDecoder(parse_float=_refuse, parse_constant=_refuse).decode
+_fast_encode = json.JSONEncoder(ensure_ascii=False, allow_nan=False, sort_keys=True, separators=(",", ":")).encode
+
+
+def audit_event_hash(event: Mapping[str, Any]) -> str:
+    """
+    Calculate the ``event_hash`` of an audit event.
+
+    Args:
+        event: Audit event; an existing 'event_hash' field is ignored
+
+    Returns:
+        Lowercase hex SHA-256 of the JCS of the event without 'event_hash'
+    """
+    return calculate_digest(event, _EVENT_HASH_EXCLUDE)
+
+
+def _check(index: int, event: Any, computed: str | None) -> AuditHashMismatch | None:
+    reason: AuditHashMismatchReason | None = None
+    claimed = event.get("event_hash") if isinstance(event, dict) else None
+    if computed is None:
+        reason = "INVALID_EVENT"
+    elif claimed is None:
+        reason = "MISSING_HASH"
+    elif claimed != computed:
+        reason = "HASH_MISMATCH"
+    if reason is None:
+        return None
+    return {
+        "index": index,
+        "reason": reason,
+        "event_hash": claimed if isinstance(claimed, str) else None,
+        "computed": computed,
+    }
+
+
+def _verify_events(payload: bytes | list[Any], start: int) -> tuple[int, list[AuditHashMismatch]]:
+    """Verify one chunk of event objects; return its size and its mismatches."""
+    chunk = unpack_chunk(payload)
+    mismatches = []
+    for k, event in enumerate(chunk):
+        computed = None
+        if isinstance(event, dict):
+            with suppress(TypeError, ValueError):
+                computed = calculate_digest(event, _EVENT_HASH_EXCLUDE)
+        mismatch = _check(start + k, event, computed)
+        if mismatch is not None:
+            mismatches.append(mismatch)
+    return len(chunk), mismatches
+
+
+def _blocks(path: str | os.PathLike[str], block_size: int) -> Iterator[bytes]:
+    """Yield blocks of whole lines; the last line needs no trailing newline."""
+    with open(path, "rb") as f:
+        pending = b""
+        while chunk := f.read(block_size):
+            data = pending + chunk if pending else chunk
+            cut = data.rfind(b"\n") + 1
+            if cut:
+                yield data[:cut]
+            pending = data[cut:]
+        if pending:
+            yield pending
+
+
+def _verify_block(block: bytes) -> tuple[int, list[AuditHashMismatch]]:
+    """Parse and verify the non-blank lines of a block; return their count and the mismatches."""
+    mismatches = []
+    count = 0
+    sha256 = hashlib.sha256
+    for line in block.split(b"\n"):
+        if not line.strip():
+            continue
+        index = count
+        count += 1
+        event: Any = None
+        data: bytes | None = None
+        try:
+            text = line.decode()
+            fast = "\\u" not in text and (text.isascii() or _ASTRAL.search(text) is None)
+        except UnicodeDecodeError:
+            fast = False
+        if fast:
+            try:
+                event = _fast_decode(text)
+            except (_SlowPath, ValueError):
+                event = None
+            if isinstance(event, dict):
+                claimed = event.pop("event_hash", None)
+                data = _fast_encode(event).encode()
+                if claimed is not None:
+                    event["event_hash"] = claimed
+        if event is None:
+            try:
+                event = json.loads(line)
+                if isinstance(event, dict):
+                    data = canonical_json_bytes(event, exclude_fields=_EVENT_HASH_EXCLUDE)
+            except (TypeError, ValueError):
+                data = None
+        mismatch = _check(index, event, None if data is None else sha256(data).hexdigest())
+        if mismatch is not None:
+            mismatches.append(mismatch)
+    return count, mismatches
+
+
+class AuditEventVerifier:
+    """
+    Streaming bulk audit event hash verifier.
+
+    ``verify`` and ``verify_ndjson`` yield an ``AuditHashMismatch`` for every
+    event whose ``event_hash`` is missing or differs from the recomputed
+    hash (with the recomputed hash), or that is not a JSON object that can
+    be canonicalized, in input order, and keep ``summary`` up to date as
+    the stream is consumed.
+
+    Args:
+        chunk_size: Events verified per batch by ``verify``
+        block_size: Bytes of NDJSON read (and shipped to a worker) at a time
+            by ``verify_ndjson``
+        workers: If > 0, verify batches in a process pool of this size
+    """
+
+    def __init__(self, *, chunk_size: int = 4096, block_size: int = 1 << 20, workers: int = 0) -> None:
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+        if block_size <= 0:
+            raise ValueError("block_size must be a positive integer")
+        if workers < 0:
+            raise ValueError("workers must be non-negative")
+        self.chunk_size = chunk_size
+        self.block_size = block_size
+        self.workers = workers
+        self.summary: AuditHashSummary = {
+            "total": 0,
+            "ok": 0,
+            "hash_mismatch": 0,
+            "missing_hash": 0,
+            "invalid_event": 0,
+        }
+
+    def _account(self, size: int, mismatches: list[AuditHashMismatch]) -> None:
+        summary = self.summary
+        summary["total"] += size
+        summary["ok"] += size - len(mismatches)
+        for mismatch in mismatches:
+            if mismatch["reason"] == "HASH_MISMATCH":
+                summary["hash_mismatch"] += 1
+            elif mismatch["reason"] == "MISSING_HASH":
+                summary["missing_hash"] += 1
+            else:
+                summary["invalid_event"] += 1
+
+    def verify(self, events: Iterable[dict[str, Any]]) -> Iterator[AuditHashMismatch]:
+        """Verify an iterable of audit event dicts, yielding mismatches only."""
+        ship = self.workers > 0
+        tasks = ((pack_chunk(chunk) if ship else chunk, start) for chunk, start in chunks(events, self.chunk_size))
+        for size, mismatches in ordered_map(_verify_events, tasks, self.workers):
+            self._account(size, mismatches)
+            yield from mismatches
+
+    def verify_ndjson(self, path: str | os.PathLike[str]) -> Iterator[AuditHashMismatch]:
+        """
+        Verify an NDJSON export of audit events, yielding mismatches only.
+
+        Blank lines are skipped; lines that are not JSON objects are
+        reported as ``INVALID_EVENT``.
+        """
+        start = 0
+        tasks = ((block,) for block in _blocks(path, self.block_size))
+        for count, mismatches in ordered_map(_verify_block, tasks, self.workers):
+            # Indices come back relative to their block.
+            for mismatch in mismatches:
+                mismatch["index"] += start
+            self._account(count, mismatches)
+            start += count
+            yield from mismatches
+
+
+def verify_audit_events(
+    events: Iterable[dict[str, Any]],
+    *,
+    chunk_size: int = 4096,
+    workers: int = 0,
+) -> Iterator[AuditHashMismatch]:
+    """
+    Verify the ``event_hash`` of a stream of audit events.
+
+    ``AuditEventVerifier`` also verifies NDJSON exports and keeps running
+    totals.
+
+    Args:
+        events: Iterable of audit event dicts
+        chunk_size: Events verified per batch
+        workers: Process-pool size; 0 verifies in the calling process
+
+    Returns:
+        Iterator over mismatches (index, reason, event_hash, computed) in
+        input order
+    """
+    return AuditEventVerifier(chunk_size=chunk_size, workers=workers).verify(events)
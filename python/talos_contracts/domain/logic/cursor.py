@@ -1,19 +1,31 @@
 """Domain logic: cursor operations.
 
 D4=B: Invalid frames do not throw from validation, return INVALID_FRAME.
+
+Cursor formats:
+    v1: base64url(utf8("{timestamp}:{event_id}")), 51+ characters
+    v2: base64url(0x02 || u64be(timestamp) || uuid bytes), always 34 characters
+
+The v2 frame bytes compare in the same order as ``compare_cursor``; the two
+formats are told apart by length.
 """
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 from talos_contracts.domain.types.cursor_types import CursorValidationResult, DecodedCursor
 from talos_contracts.infrastructure.base64url import base64url_decode, base64url_encode
-from talos_contracts.infrastructure.uuidv7 import is_canonical_lower_uuid, is_uuid_v7
+from talos_contracts.infrastructure.uuidv7 import is_canonical_uuid_v7, is_uuid_v7, pack_uuid7
+
+_V2_VERSION = 2
+_V2_FRAME_SIZE = 25
+_V2_LENGTH = 34
 
 
-def _is_valid_unix_seconds_int(n: Any) -> bool:
-    """Check if n is a valid unix seconds integer."""
+def is_unix_seconds_int(n: Any) -> bool:
+    """Check if n is a valid unix seconds integer (a non-negative int)."""
     return isinstance(n, int) and n >= 0
 
 
@@ -24,41 +36,68 @@ def _is_canonical_ts_str(s: str) -> bool:
     return not (len(s) > 1 and s.startswith("0"))
 
 
-def derive_cursor(timestamp: int, event_id: str) -> str:
+def derive_cursor(timestamp: int, event_id: str, *, version: int = 1) -> str:
     """
     Derive a cursor from timestamp and event_id.
 
-    cursor = base64url(utf8("{timestamp}:{event_id}"))
+    v1: cursor = base64url(utf8("{timestamp}:{event_id}"))
+    v2: cursor = base64url(0x02 || u64be(timestamp) || uuid bytes)
 
     Args:
         timestamp: Unix seconds integer
-        event_id: Event ID (should be UUIDv7)
+        event_id: Event ID (should be UUIDv7; must be canonical for v2)
+        version: Cursor format, 1 (default) or 2 (compact, 34 characters)
 
     Returns:
         Base64url encoded cursor
 
     Raises:
-        ValueError: If timestamp is not a valid unix seconds integer
+        ValueError: If timestamp is not a valid unix seconds integer, or the
+            event_id or timestamp cannot be represented in the v2 frame
     """
-    if not _is_valid_unix_seconds_int(timestamp):
+    if not is_unix_seconds_int(timestamp):
         raise ValueError("timestamp must be unix seconds integer")
-    plain = f"{timestamp}:{event_id}".encode()
-    return base64url_encode(plain)
+    if version == 1:
+        plain = f"{timestamp}:{event_id}".encode()
+        return base64url_encode(plain)
+    if version == _V2_VERSION:
+        if timestamp >= 1 << 64:
+            raise ValueError("timestamp out of range")
+        return base64url_encode(b"\x02" + timestamp.to_bytes(8, "big") + pack_uuid7(event_id))
+    raise ValueError("unsupported cursor version")
+
+
+def _decode_v2_frame(cursor: str) -> bytes:
+    """Decode and validate a v2 cursor into its 25-byte frame."""
+    frame = base64url_decode(cursor)
+    if frame[0] != _V2_VERSION:
+        raise ValueError("unsupported cursor version")
+    # UUID version nibble 7 and RFC variant bits 10.
+    if frame[15] >> 4 != 7 or frame[17] >> 6 != 2:
+        raise ValueError("event_id is not uuidv7")
+    return frame
 
 
-def decode_cursor(cursor: str) -> DecodedCursor:
+def cursor_sort_key(cursor: str) -> tuple[int, str]:
     """
-    Decode a cursor to {timestamp, event_id}.
+    Decode and validate a cursor into a ``(timestamp, event_id)`` tuple.
+
+    The tuples order like ``compare_cursor``, so this is a ``sort``/``bisect``
+    key; ``CursorCodec.sort_key`` is the cached form.
 
     Args:
-        cursor: Base64url encoded cursor
+        cursor: Base64url encoded cursor (v1 or v2)
 
     Returns:
-        DecodedCursor TypedDict with 'timestamp' and 'event_id'
+        ``(timestamp, event_id)``
 
     Raises:
         ValueError: If cursor format is invalid
     """
+    if len(cursor) == _V2_LENGTH:
+        h = _decode_v2_frame(cursor).hex()
+        return int(h[2:18], 16), f"{h[18:26]}-{h[26:30]}-{h[30:34]}-{h[34:38]}-{h[38:]}"
+
     raw = base64url_decode(cursor).decode("utf-8")
 
     colon_idx = raw.find(":")
@@ -72,14 +111,33 @@ def decode_cursor(cursor: str) -> DecodedCursor:
         raise ValueError("timestamp is not canonical base-10")
 
     ts = int(ts_str)
-    if not _is_valid_unix_seconds_int(ts):
+    if not is_unix_seconds_int(ts):
         raise ValueError("timestamp out of range")
 
-    if not is_uuid_v7(event_id):
-        raise ValueError("event_id is not uuidv7")
-    if not is_canonical_lower_uuid(event_id):
+    if not is_canonical_uuid_v7(event_id):
+        if not is_uuid_v7(event_id):
+            raise ValueError("event_id is not uuidv7")
         raise ValueError("event_id must be lowercase canonical uuid")
 
+    return ts, event_id
+
+
+def decode_cursor(cursor: str) -> DecodedCursor:
+    """
+    Decode a cursor to {timestamp, event_id}.
+
+    Accepts both v1 and v2 cursors; the format is detected from the length.
+
+    Args:
+        cursor: Base64url encoded cursor
+
+    Returns:
+        DecodedCursor TypedDict with 'timestamp' and 'event_id'
+
+    Raises:
+        ValueError: If cursor format is invalid
+    """
+    ts, event_id = cursor_sort_key(cursor)
     return {"timestamp": ts, "event_id": event_id}
 
 
@@ -94,26 +152,24 @@ def compare_cursor(a: str, b: str) -> int:
     Returns:
         -1 if a < b, 0 if equal, 1 if a > b
     """
-    da = decode_cursor(a)
-    db = decode_cursor(b)
-
-    if da["timestamp"] < db["timestamp"]:
-        return -1
-    if da["timestamp"] > db["timestamp"]:
-        return 1
-
-    if da["event_id"] < db["event_id"]:
-        return -1
-    if da["event_id"] > db["event_id"]:
-        return 1
+    if len(a) == _V2_LENGTH and len(b) == _V2_LENGTH:
+        # v2 frames are big-endian (timestamp, uuid): compare the bytes.
+        fa = _decode_v2_frame(a)
+        fb = _decode_v2_frame(b)
+        return (fa > fb) - (fa < fb)
 
-    return 0
+    # (timestamp, event_id) tuples compare field by field, timestamp first.
+    ka = cursor_sort_key(a)
+    kb = cursor_sort_key(b)
+    return (ka > kb) - (ka < kb)
 
 
 def assert_cursor_invariant(event: dict[str, Any]) -> CursorValidationResult:
     """
     Validate that an event's cursor matches the derived cursor.
 
+    The cursor is derived in the format of the event's cursor (v1 or v2).
+
     D4=B: Does not throw on invalid frames, returns { ok: False, reason: "INVALID_FRAME" }
 
     Args:
@@ -139,11 +195,81 @@ def assert_cursor_invariant(event: dict[str, Any]) -> CursorValidationResult:
 
     # Derived cursor must match exactly (CURSOR_MISMATCH)
     derived = derive_cursor(ts, eid)
+    if len(cur) == _V2_LENGTH:
+        # A v2 frame needs a canonical UUIDv7 event_id and a 64-bit timestamp.
+        if not is_canonical_uuid_v7(eid) or ts >= 1 << 64:
+            return {"ok": False, "derived": derived, "reason": "INVALID_FRAME"}
+        derived = derive_cursor(ts, eid, version=_V2_VERSION)
     if cur != derived:
         return {"ok": False, "derived": derived, "reason": "CURSOR_MISMATCH"}
 
     # Also enforce event_id canonical uuidv7 for the event frame
-    if not is_uuid_v7(eid) or not is_canonical_lower_uuid(eid):
+    if not is_canonical_uuid_v7(eid):
         return {"ok": False, "derived": derived, "reason": "INVALID_FRAME"}
 
     return {"ok": True, "derived": derived}
+
+
+class CursorCodec:
+    """
+    Cursor codec with a bounded LRU cache of decoded cursors.
+
+    Decoding is the expensive part of comparing cursors (base64url, UTF-8,
+    canonical timestamp and UUIDv7 checks). The codec memoizes the decoded
+    ``(timestamp, event_id)`` tuple per cursor string so that repeated
+    comparisons, merges and re-sorts decode each cursor once. Invalid
+    cursors raise ``ValueError`` exactly like ``decode_cursor`` and are not
+    cached.
+
+    Args:
+        maxsize: Maximum number of decoded cursors kept (LRU eviction)
+    """
+
+    def __init__(self, maxsize: int = 65536) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize = maxsize
+        self._decode = lru_cache(maxsize=maxsize)(cursor_sort_key)
+
+    def derive(self, timestamp: int, event_id: str, *, version: int = 1) -> str:
+        """Derive a cursor; same as ``derive_cursor``."""
+        return derive_cursor(timestamp, event_id, version=version)
+
+    def decode(self, cursor: str) -> DecodedCursor:
+        """Decode a cursor; same result as ``decode_cursor``."""
+        ts, event_id = self._decode(cursor)
+        return {"timestamp": ts, "event_id": event_id}
+
+    def sort_key(self, cursor: str) -> tuple[int, str]:
+        """
+        Key that orders cursors like ``compare_cursor``.
+
+        ``sorted(cursors, key=codec.sort_key)`` decodes each cursor once,
+        instead of O(log n) times with ``cmp_to_key(compare_cursor)``.
+        """
+        return self._decode(cursor)
+
+    def compare(self, a: str, b: str) -> int:
+        """Compare two cursors; same result as ``compare_cursor``."""
+        ka = self._decode(a)
+        kb = self._decode(b)
+        return (ka > kb) - (ka < kb)
+
+    @property
+    def hits(self) -> int:
+        """Number of decodes served from the cache."""
+        return self._decode.cache_info().hits
+
+    @property
+    def misses(self) -> int:
+        """Number of decodes that had to run the full decoder."""
+        return self._decode.cache_info().misses
+
+    @property
+    def size(self) -> int:
+        """Number of decoded cursors currently cached."""
+        return self._decode.cache_info().currsize
+
+    def cache_clear(self) -> None:
+        """Drop all cached entries and reset the counters."""
+        self._decode.cache_clear()
@@ -0,0 +1,133 @@
+"""Domain logic: bulk cursor-invariant validation over event streams.
+
+Results are identical to calling ``assert_cursor_invariant`` on every event,
+but only failures are emitted. Events are processed in chunks: cursors for
+the whole chunk are derived with one batch base64url call and event ids are
+validated as one column, so the per-event function only runs for the few
+events that do not pass the fast check.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from talos_contracts.domain.logic._shared import read_jsonl
+from talos_contracts.domain.logic.cursor import assert_cursor_invariant
+from talos_contracts.domain.types.cursor_types import CursorStreamFailure, CursorStreamSummary
+from talos_contracts.infrastructure._parallel import chunks, ordered_map
+from talos_contracts.infrastructure.base64url import base64url_encode_many
+from talos_contracts.infrastructure.uuidv7 import validate_uuid_v7_many
+
+
+def _validate_chunk(chunk: list[Any], start: int) -> tuple[int, list[CursorStreamFailure]]:
+    """
+    Validate one chunk of events; return its size and its failures.
+
+    The fast path accepts an event only when its cursor equals the derived
+    cursor, its timestamp is a non-negative ``int`` and its event id is a
+    canonical UUIDv7; such a cursor always decodes, so
+    ``assert_cursor_invariant`` would return ok. Everything else is handed to
+    ``assert_cursor_invariant`` for the exact reason and derived cursor.
+    """
+    tss = [e.get("timestamp") for e in chunk]
+    eids = [e.get("event_id") for e in chunk]
+    curs = [e.get("cursor") for e in chunk]
+
+    suspects: Iterable[int]
+    if chunk and set(map(type, tss)) == {int} and set(map(type, eids)) == {str} and set(
+        map(type, curs)
+    ) == {str}:
+        derived = base64url_encode_many([f"{t}:{i}".encode() for t, i in zip(tss, eids, strict=True)])
+        flags = validate_uuid_v7_many(eids)
+        suspects = [
+            k
+            for k, (c, d, f, t) in enumerate(zip(curs, derived, flags, tss, strict=True))
+            if c != d or not f or t < 0
+        ]
+    else:
+        suspects = range(len(chunk))
+
+    failures: list[CursorStreamFailure] = []
+    for k in suspects:
+        result = assert_cursor_invariant(chunk[k])
+        if not result["ok"]:
+            failures.append({"index": start + k, "reason": result["reason"], "derived": result["derived"]})
+    return len(chunk), failures
+
+
+class CursorStreamValidator:
+    """
+    Streaming bulk cursor-invariant validator.
+
+    ``validate`` yields a ``CursorStreamFailure`` for every event whose
+    ``assert_cursor_invariant`` result is not ok, in input order, and keeps
+    ``summary`` up to date as the stream is consumed.
+
+    Args:
+        chunk_size: Events validated per batch
+        workers: If > 0, validate chunks in a process pool of this size
+            (useful for multi-million-event backfills)
+    """
+
+    def __init__(self, *, chunk_size: int = 4096, workers: int = 0) -> None:
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+        if workers < 0:
+            raise ValueError("workers must be non-negative")
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.summary: CursorStreamSummary = {
+            "total": 0,
+            "ok": 0,
+            "invalid_frame": 0,
+            "cursor_mismatch": 0,
+        }
+
+    def _account(self, size: int, failures: list[CursorStreamFailure]) -> None:
+        summary = self.summary
+        summary["total"] += size
+        summary["ok"] += size - len(failures)
+        for failure in failures:
+            if failure["reason"] == "INVALID_FRAME":
+                summary["invalid_frame"] += 1
+            else:
+                summary["cursor_mismatch"] += 1
+
+    def validate(self, events: Iterable[dict[str, Any]]) -> Iterator[CursorStreamFailure]:
+        """Validate an iterable of event dicts, yielding failures only."""
+        for size, failures in ordered_map(_validate_chunk, chunks(events, self.chunk_size), self.workers):
+            self._account(size, failures)
+            yield from failures
+
+    def validate_jsonl(self, path: str | os.PathLike[str]) -> Iterator[CursorStreamFailure]:
+        """
+        Validate a JSONL file of events, yielding failures only.
+
+        Lines that are not JSON objects are reported as ``INVALID_FRAME``.
+        """
+        return self.validate(read_jsonl(path))
+
+
+def validate_cursor_stream(
+    events: Iterable[dict[str, Any]],
+    *,
+    chunk_size: int = 4096,
+    workers: int = 0,
+) -> Iterator[CursorStreamFailure]:
+    """
+    Validate the cursor invariant over a stream of events.
+
+    The running per-reason counts are kept on
+    ``CursorStreamValidator.summary``.
+
+    Args:
+        events: Iterable of dicts with 'timestamp', 'event_id' and 'cursor'
+        chunk_size: Events validated per batch
+        workers: Process-pool size; 0 validates in the calling process
+
+    Returns:
+        Iterator over failures (index, reason, derived) in input order
+    """
+    return CursorStreamValidator(chunk_size=chunk_size, workers=workers).validate(events)
@@ -0,0 +1,282 @@
+"""Domain logic: columnar event batch with vectorized ordering and cursor seek.
+
+NumPy is optional. With NumPy, timestamps are held as int64 and event ids as
+two uint64 halves, ordering is one ``lexsort`` and cursor seeks are one
+``searchsorted``; without it the same API runs on Python lists. Both back ends
+return the same plain-Python results.
+"""
+
+from __future__ import annotations
+
+import operator
+from bisect import bisect_right
+from collections.abc import Iterable, Sequence
+from typing import Any, Literal
+
+from talos_contracts.domain.logic.cursor import cursor_sort_key
+from talos_contracts.domain.logic.ordering import ordering_key
+from talos_contracts.infrastructure.base64url import base64url_encode_many
+from talos_contracts.infrastructure.uuidv7 import validate_uuid_v7_many
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    _HAVE_NUMPY = False
+else:
+    _HAVE_NUMPY = True
+
+EventBatchBackend = Literal["numpy", "python"]
+
+_INT63 = (1 << 63) - 1
+# Hex digit ranges of a UUID; group k starts k characters later in the
+# canonical string because of the dashes before it.
+_HEX_GROUPS = ((0, 8), (8, 12), (12, 16), (16, 20), (20, 32))
+_HEX_DIGITS: Any = np.frombuffer(b"0123456789abcdef", dtype=np.uint8) if _HAVE_NUMPY else None
+
+
+def _check_columns(timestamps: list[Any], event_ids: list[Any]) -> list[int]:
+    """Validate the columns; return the timestamps as plain ints."""
+    if len(timestamps) != len(event_ids):
+        raise ValueError("timestamps and event_ids must have the same length")
+    ints: list[int] = []
+    for ts in timestamps:
+        # Any integer type (e.g. NumPy int64) is accepted, bool is not.
+        try:
+            value = operator.index(ts)
+        except TypeError:
+            value = -1
+        if isinstance(ts, bool) or not 0 <= value <= _INT63:
+            raise ValueError("timestamp must be unix seconds integer")
+        ints.append(value)
+    if not all(type(eid) is str for eid in event_ids):
+        raise ValueError("event_id must be lowercase canonical uuidv7")
+    flags = validate_uuid_v7_many(event_ids)
+    if 0 in flags:
+        raise ValueError("event_id must be lowercase canonical uuidv7")
+    return ints
+
+
+def _desc_key(ts: int, eid: str) -> tuple[Any, bytes]:
+    return ordering_key({"timestamp": ts, "event_id": eid})
+
+
+class EventBatch:
+    """
+    Columnar batch of ``(timestamp, event_id)`` records.
+
+    ``order()`` and ``sorted()`` give the ``ordering_compare`` order (stable
+    for equal keys, like ``sorted`` with ``cmp_to_key``); ``derive_cursors()``
+    equals ``derive_cursor`` per row. Event ids must be lowercase canonical
+    UUIDv7, so their string order is the numeric order of their halves.
+
+    Args:
+        timestamps: Unix seconds integers (any integer type, e.g. NumPy int64)
+        event_ids: Lowercase canonical UUIDv7 strings, one per timestamp
+        use_numpy: Force (True) or disable (False) the NumPy back end;
+            None uses NumPy when it is installed
+
+    Raises:
+        ValueError: If a column value is invalid, or use_numpy=True without NumPy
+    """
+
+    # NumPy arrays or lists, depending on the back end.
+    _ts: Any
+    _hi: Any
+    _lo: Any
+    _ids: list[str]
+
+    def __init__(
+        self,
+        timestamps: Iterable[int],
+        event_ids: Iterable[str],
+        *,
+        use_numpy: bool | None = None,
+    ) -> None:
+        if use_numpy and not _HAVE_NUMPY:
+            raise ValueError("numpy is not installed")
+        id_list = list(event_ids)
+        ts_list = _check_columns(list(timestamps), id_list)
+        self._sorted = False
+        self._seek_keys: Any = None
+        if _HAVE_NUMPY and use_numpy is not False:
+            self.backend: EventBatchBackend = "numpy"
+            self._ts = np.array(ts_list, dtype=np.int64)
+            raw = bytes.fromhex("".join(id_list).replace("-", ""))
+            halves = np.frombuffer(raw, dtype=">u8").reshape(-1, 2).astype(np.uint64)
+            self._hi = halves[:, 0].copy()
+            self._lo = halves[:, 1].copy()
+        else:
+            self.backend = "python"
+            self._ts = ts_list
+            self._ids = id_list
+
+    @classmethod
+    def from_events(cls, events: Iterable[dict[str, Any]], *, use_numpy: bool | None = None) -> EventBatch:
+        """Build a batch from event dicts with 'timestamp' and 'event_id'."""
+        items = list(events)
+        return cls(
+            [e["timestamp"] for e in items],
+            [e["event_id"] for e in items],
+            use_numpy=use_numpy,
+        )
+
+    @classmethod
+    def _from_columns(cls, backend: EventBatchBackend, columns: tuple[Any, ...], *, is_sorted: bool) -> EventBatch:
+        batch = cls.__new__(cls)
+        batch.backend = backend
+        batch._sorted = is_sorted
+        batch._seek_keys = None
+        if backend == "numpy":
+            batch._ts, batch._hi, batch._lo = columns
+        else:
+            batch._ts, batch._ids = columns
+        return batch
+
+    def __len__(self) -> int:
+        return len(self._ts)
+
+    @property
+    def timestamps(self) -> list[int]:
+        """Timestamp column as a list."""
+        if self.backend == "numpy":
+            return self._ts.tolist()  # type: ignore[no-any-return]
+        return list(self._ts)
+
+    @property
+    def event_ids(self) -> list[str]:
+        """Event id column as a list."""
+        if self.backend == "python":
+            return list(self._ids)
+        text = self._uuid_chars().tobytes().decode("ascii")
+        return [text[i : i + 36] for i in range(0, len(text), 36)]
+
+    def to_events(self) -> list[dict[str, Any]]:
+        """Rows as ``{"timestamp", "event_id"}`` dicts."""
+        rows = zip(self.timestamps, self.event_ids, strict=True)
+        return [{"timestamp": t, "event_id": e} for t, e in rows]
+
+    def order(self) -> list[int]:
+        """
+        Row indices in contract order (timestamp DESC, event_id DESC).
+
+        Returns:
+            Permutation such that ``[rows[i] for i in order()]`` equals sorting
+            the rows with ``cmp_to_key(ordering_compare)``
+        """
+        if self.backend == "numpy":
+            # Complemented keys sort ascending in contract order; lexsort is
+            # stable, so equal keys keep their input order.
+            perm = np.lexsort((~self._lo, ~self._hi, -self._ts))
+            return perm.tolist()  # type: ignore[no-any-return]
+        ts, ids = self._ts, self._ids
+        return sorted(range(len(ts)), key=lambda i: (ts[i], ids[i]), reverse=True)
+
+    def sorted(self) -> EventBatch:
+        """Return a copy of the batch in contract order."""
+        if self.backend == "numpy":
+            perm = np.lexsort((~self._lo, ~self._hi, -self._ts))
+            columns: tuple[Any, ...] = (self._ts[perm], self._hi[perm], self._lo[perm])
+        else:
+            rows = self.order()
+            columns = ([self._ts[i] for i in rows], [self._ids[i] for i in rows])
+        return EventBatch._from_columns(self.backend, columns, is_sorted=True)
+
+    def _uuid_chars(self) -> Any:
+        """(n, 36) uint8 array of the canonical id strings."""
+        n = len(self._hi)
+        raw = np.empty((n, 2), dtype=">u8")
+        raw[:, 0] = self._hi
+        raw[:, 1] = self._lo
+        octets = raw.view(np.uint8).reshape(n, 16)
+        nibbles = np.empty((n, 32), dtype=np.uint8)
+        nibbles[:, 0::2] = octets >> 4
+        nibbles[:, 1::2] = octets & 0xF
+        hex_chars = _HEX_DIGITS[nibbles]
+        chars = np.full((n, 36), ord("-"), dtype=np.uint8)
+        for offset, (start, stop) in enumerate(_HEX_GROUPS):
+            chars[:, start + offset : stop + offset] = hex_chars[:, start:stop]
+        return chars
+
+    def derive_cursors(self) -> list[str]:
+        """
+        Derive the cursor of every row.
+
+        Returns:
+            ``[derive_cursor(ts, event_id) for each row]``
+        """
+        if self.backend == "python":
+            frames = [f"{t}:{e}".encode() for t, e in zip(self._ts, self._ids, strict=True)]
+            return base64url_encode_many(frames)
+
+        # Frames are fixed width per timestamp digit count, so each group is
+        # assembled as one uint8 matrix and base64url-encoded as one buffer
+        # of fixed-width records.
+        n = len(self._ts)
+        out: list[str] = [""] * n
+        uuid_chars = self._uuid_chars()
+        ts = self._ts
+        digits = np.searchsorted(10 ** np.arange(1, 19, dtype=np.int64), ts, side="right") + 1
+        for d in np.unique(digits).tolist():
+            rows = np.flatnonzero(digits == d)
+            width = d + 37
+            frame = np.empty((len(rows), width), dtype=np.uint8)
+            group = ts[rows]
+            for k in range(d):
+                frame[:, d - 1 - k] = group // 10**k % 10 + ord("0")
+            frame[:, d] = ord(":")
+            frame[:, d + 1 :] = uuid_chars[rows]
+            encoded = base64url_encode_many(frame, width=width)
+            if len(rows) == n:
+                return encoded
+            for i, cursor in zip(rows.tolist(), encoded, strict=True):
+                out[i] = cursor
+        return out
+
+    def seek(self, cursor: str) -> int:
+        """
+        Position of the first row after ``cursor`` in a sorted batch.
+
+        Raises:
+            ValueError: If the cursor is invalid or the batch is not sorted
+        """
+        return self.seek_many([cursor])[0]
+
+    def seek_many(self, cursors: Sequence[str]) -> list[int]:
+        """
+        Positions of the first row after each cursor, in a sorted batch.
+
+        Args:
+            cursors: Cursors to seek; need not be in this batch
+
+        Returns:
+            For each cursor, the number of rows at or before it in contract order
+
+        Raises:
+            ValueError: If a cursor is invalid or the batch is not sorted
+        """
+        if not self._sorted:
+            raise ValueError("batch is not in contract order; call sorted() first")
+        parts = [cursor_sort_key(c) for c in cursors]
+        if self.backend == "python":
+            if self._seek_keys is None:
+                self._seek_keys = [_desc_key(t, e) for t, e in zip(self._ts, self._ids, strict=True)]
+            return [bisect_right(self._seek_keys, _desc_key(t, e)) for t, e in parts]
+
+        if self._seek_keys is None:
+            self._seek_keys = self._packed_keys(self._ts, self._hi, self._lo)
+        if not parts:
+            return []
+        q_ts = np.array([t for t, _ in parts], dtype=np.int64)
+        raw = bytes.fromhex("".join(e for _, e in parts).replace("-", ""))
+        halves = np.frombuffer(raw, dtype=">u8").reshape(-1, 2).astype(np.uint64)
+        query = self._packed_keys(q_ts, halves[:, 0], halves[:, 1])
+        return np.searchsorted(self._seek_keys, query, side="right").tolist()  # type: ignore[no-any-return]
+
+    @staticmethod
+    def _packed_keys(ts: Any, hi: Any, lo: Any) -> Any:
+        """24-byte big-endian keys whose byte order is the contract order."""
+        packed = np.empty((len(ts), 3), dtype=">u8")
+        packed[:, 0] = _INT63 - ts
+        packed[:, 1] = ~hi
+        packed[:, 2] = ~lo
+        return packed.view("S24").ravel()
@@ -0,0 +1,203 @@
+"""Domain logic: in-memory cursor-paginated event index.
+
+Events are kept in contract order (timestamp DESC, event_id DESC) so that
+``page(after=cursor, limit=n)`` is a bisect plus a slice instead of a scan
+or a sort per request.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from itertools import pairwise
+from typing import Any
+
+from talos_contracts.domain.logic.cursor import cursor_sort_key, derive_cursor, is_unix_seconds_int
+from talos_contracts.domain.types.cursor_types import EventPage
+from talos_contracts.infrastructure.uuidv7 import is_canonical_uuid_v7
+
+
+def _event_key(event: dict[str, Any]) -> tuple[int, str]:
+    """Return the ``(timestamp, event_id)`` key of an event, validating the frame."""
+    ts = event["timestamp"]
+    eid = event["event_id"]
+    if not is_unix_seconds_int(ts):
+        raise ValueError("timestamp must be unix seconds integer")
+    if not isinstance(eid, str) or not is_canonical_uuid_v7(eid):
+        raise ValueError("event_id must be lowercase canonical uuidv7")
+    return ts, eid
+
+
+class EventIndex:
+    """
+    Reference cursor-paginated event index.
+
+    Pages are identical to ``sorted(events, key=cmp_to_key(ordering_compare))``
+    sliced after the cursor position. Internally keys are stored ascending,
+    so the newest events are appended at the end and eviction drops a prefix.
+    An event key ``(timestamp, event_id)`` is unique within the index.
+
+    Args:
+        events: Initial events, in any order
+        maxlen: If set, keep at most this many events, evicting the oldest
+            (smallest in contract order) first
+    """
+
+    def __init__(self, events: Iterable[dict[str, Any]] = (), *, maxlen: int | None = None) -> None:
+        if maxlen is not None and maxlen <= 0:
+            raise ValueError("maxlen must be a positive integer")
+        self.maxlen = maxlen
+        # Ascending keys and the matching events; entries before _head are
+        # evicted and compacted away lazily.
+        self._keys: list[tuple[int, str]] = []
+        self._events: list[dict[str, Any]] = []
+        self._head = 0
+        self._merge(list(events), presorted=False)
+
+    def __len__(self) -> int:
+        return len(self._keys) - self._head
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Iterate over events in contract order."""
+        events = self._events
+        for i in range(len(events) - 1, self._head - 1, -1):
+            yield events[i]
+
+    def __contains__(self, event: object) -> bool:
+        try:
+            key = _event_key(event)  # type: ignore[arg-type]
+        except (KeyError, TypeError, ValueError):
+            return False
+        i = bisect_left(self._keys, key, self._head)
+        return i < len(self._keys) and self._keys[i] == key
+
+    def add(self, event: dict[str, Any]) -> None:
+        """
+        Insert one event at its ordered position.
+
+        Raises:
+            ValueError: If the event frame is invalid or its key is already indexed
+        """
+        key = _event_key(event)
+        keys = self._keys
+        if not keys or keys[-1] < key:
+            keys.append(key)
+            self._events.append(event)
+        else:
+            i = bisect_left(keys, key, self._head)
+            if i < len(keys) and keys[i] == key:
+                raise ValueError("duplicate event key")
+            keys.insert(i, key)
+            self._events.insert(i, event)
+        self._evict()
+
+    def extend(self, events: Iterable[dict[str, Any]]) -> None:
+        """
+        Bulk-insert a batch already in contract order (newest first).
+
+        A batch entirely newer than the index is appended in O(k); any other
+        batch is merged with the index events in its key range and spliced in.
+
+        Raises:
+            ValueError: If the batch is not strictly in contract order, an
+                event frame is invalid or a key is already indexed
+        """
+        self._merge(list(events), presorted=True)
+
+    def _merge(self, batch: list[dict[str, Any]], *, presorted: bool) -> None:
+        if not batch:
+            return
+        if presorted:
+            batch.reverse()
+        pairs = [(_event_key(e), e) for e in batch]
+        if presorted:
+            for (a, _), (b, _) in pairwise(pairs):
+                if not a < b:
+                    raise ValueError("batch is not strictly in contract order")
+        else:
+            pairs.sort(key=lambda p: p[0])
+
+        keys = self._keys
+        if not keys or keys[-1] < pairs[0][0]:
+            if not presorted:
+                for (a, _), (b, _) in pairwise(pairs):
+                    if a == b:
+                        raise ValueError("duplicate event key")
+            keys.extend(k for k, _ in pairs)
+            self._events.extend(e for _, e in pairs)
+        else:
+            # Only the overlapping key range needs merging; the result is
+            # spliced back in place.
+            lo = bisect_left(keys, pairs[0][0], self._head)
+            hi = bisect_left(keys, pairs[-1][0], lo)
+            if hi < len(keys) and keys[hi] == pairs[-1][0]:
+                raise ValueError("duplicate event key")
+            merged = list(zip(keys[lo:hi], self._events[lo:hi], strict=True))
+            merged.extend(pairs)
+            merged.sort(key=lambda p: p[0])
+            for (a, _), (b, _) in pairwise(merged):
+                if a == b:
+                    raise ValueError("duplicate event key")
+            keys[lo:hi] = [k for k, _ in merged]
+            self._events[lo:hi] = [e for _, e in merged]
+        self._evict()
+
+    def _evict(self) -> None:
+        if self.maxlen is None:
+            return
+        excess = len(self) - self.maxlen
+        if excess <= 0:
+            return
+        for i in range(self._head, self._head + excess):
+            self._events[i] = None  # type: ignore[call-overload]
+        self._head += excess
+        if self._head > len(self._keys) // 2:
+            del self._keys[: self._head]
+            del self._events[: self._head]
+            self._head = 0
+
+    def seek(self, cursor: str | None) -> int:
+        """
+        Position (in contract order) of the first event after ``cursor``.
+
+        O(log n). ``None`` seeks to the start.
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        if cursor is None:
+            return 0
+        return len(self._keys) - bisect_left(self._keys, cursor_sort_key(cursor), self._head)
+
+    def page(self, after: str | None = None, limit: int = 50) -> EventPage:
+        """
+        Return up to ``limit`` events strictly after ``after`` in contract order.
+
+        Args:
+            after: Cursor of the last event already seen, or None for the first page
+            limit: Maximum number of events to return
+
+        Returns:
+            EventPage with 'events' and 'next_cursor' (None when no events remain)
+
+        Raises:
+            ValueError: If the cursor is invalid or limit is not positive
+        """
+        if limit <= 0:
+            raise ValueError("limit must be a positive integer")
+        keys = self._keys
+        end = len(keys) if after is None else bisect_left(keys, cursor_sort_key(after), self._head)
+        start = max(self._head, end - limit)
+        events = self._events[start:end]
+        events.reverse()
+        next_cursor = None
+        if start > self._head:
+            ts, eid = keys[start]
+            next_cursor = derive_cursor(ts, eid)
+        return {"events": events, "next_cursor": next_cursor}
+
+    def clear(self) -> None:
+        """Remove all events."""
+        self._keys = []
+        self._events = []
+        self._head = 0
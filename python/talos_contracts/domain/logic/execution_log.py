@@ -0,0 +1,233 @@
+"""Domain logic: TGA execution log hash chains (schemas/tga/execution_log.schema.json).
+
+Every entry carries ``entry_digest``, the SHA-256 of the JCS of the entry
+without ``entry_digest``, and ``prev_entry_digest``, the ``entry_digest`` of
+the entry before it (64 zeros for the first entry). Sequence numbers
+increase by one per entry and one log holds one trace.
+
+Verification splits the work in two. Parsing and hashing entries is
+independent per line, so the log is read in large blocks of whole lines
+and each block is parsed and hashed on its own, optionally in a process
+pool; only raw bytes are shipped to the workers and a small tuple per entry
+comes back. Linkage and sequence continuity are then checked by one cheap
+sequential pass over those tuples in file order.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Iterator, Mapping
+from contextlib import closing, suppress
+from typing import Any
+
+from talos_contracts.domain.logic._shared import GENESIS_DIGEST
+from talos_contracts.domain.types.execution_log_types import (
+    ExecutionLogBreak,
+    ExecutionLogBreakReason,
+    ExecutionLogCheckpoint,
+    ExecutionLogVerification,
+)
+from talos_contracts.infrastructure._parallel import ordered_map
+from talos_contracts.infrastructure.canonical import calculate_digest
+
+_ENTRY_DIGEST_EXCLUDE = ["entry_digest"]
+
+# (line offset, line end, trace_id, sequence_number, prev_entry_digest,
+# entry_digest, computed digest); computed is None for an invalid frame.
+_Row = tuple[int, int, Any, Any, Any, Any, str | None]
+
+
+def execution_log_entry_digest(entry: Mapping[str, Any]) -> str:
+    """
+    Calculate the ``entry_digest`` of an execution log entry.
+
+    Args:
+        entry: Log entry; an existing 'entry_digest' field is ignored
+
+    Returns:
+        Lowercase hex SHA-256 of the JCS of the entry without 'entry_digest'
+    """
+    return calculate_digest(entry, _ENTRY_DIGEST_EXCLUDE)
+
+
+def _digest_block(block: bytes, base: int) -> list[_Row]:
+    """Parse and hash every line of a block of whole lines starting at byte ``base``."""
+    rows: list[_Row] = []
+    find = block.find
+    start = 0
+    size = len(block)
+    while start < size:
+        end = find(b"\n", start) + 1
+        line = block[start:end]
+        start, line_start = end, start
+        if not line.strip():
+            continue
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            entry = None
+        computed = None
+        if (
+            isinstance(entry, dict)
+            and isinstance(entry.get("trace_id"), str)
+            and type(entry.get("sequence_number")) is int
+            and isinstance(entry.get("entry_digest"), str)
+        ):
+            with suppress(ValueError):  # NaN or Infinity, which json.loads accepts
+                computed = calculate_digest(entry, _ENTRY_DIGEST_EXCLUDE)
+        if computed is None:
+            rows.append((base + line_start, base + end, None, None, None, None, None))
+        else:
+            rows.append(
+                (
+                    base + line_start,
+                    base + end,
+                    entry["trace_id"],
+                    entry["sequence_number"],
+                    entry.get("prev_entry_digest"),
+                    entry["entry_digest"],
+                    computed,
+                )
+            )
+    return rows
+
+
+def _blocks(path: str | os.PathLike[str], offset: int, block_size: int) -> Iterator[tuple[bytes, int]]:
+    """
+    Yield ``(block, base_offset)`` of whole lines from ``offset`` onwards.
+
+    Trailing bytes without a newline are an append in progress and are not
+    yielded; the next verification run picks them up.
+    """
+    with open(path, "rb") as f:
+        f.seek(offset)
+        pending = b""
+        base = offset
+        while chunk := f.read(block_size):
+            data = pending + chunk if pending else chunk
+            cut = data.rfind(b"\n") + 1
+            if cut:
+                yield data[:cut], base
+                base += cut
+            pending = data[cut:]
+
+
+def _entry_before(path: str | os.PathLike[str], offset: int) -> Any:
+    """Parse the line that ends exactly at byte ``offset``, or return None."""
+    with open(path, "rb") as f:
+        window = 4096
+        while True:
+            start = max(0, offset - window)
+            f.seek(start)
+            data = f.read(offset - start)
+            if len(data) != offset - start or not data.endswith(b"\n"):
+                return None
+            cut = data.rfind(b"\n", 0, len(data) - 1)
+            if cut >= 0 or start == 0:
+                try:
+                    return json.loads(data[cut + 1 :])
+                except ValueError:
+                    return None
+            window *= 2
+
+
+def verify_execution_log(
+    path: str | os.PathLike[str],
+    *,
+    resume_from: ExecutionLogCheckpoint | None = None,
+    workers: int = 0,
+    block_size: int = 1 << 20,
+) -> ExecutionLogVerification:
+    """
+    Verify the hash chain of a JSONL execution log without loading it.
+
+    Without ``resume_from`` the first entry must have the genesis
+    ``prev_entry_digest`` (64 zeros); each later entry must have the same
+    trace_id, the next sequence number and the previous entry's digest, and
+    every ``entry_digest`` must match the entry. Verification stops at the
+    first break.
+
+    Args:
+        path: JSONL log file, one entry per line
+        resume_from: Checkpoint returned by an earlier run over the same
+            log; only the bytes after it are verified, after checking that
+            the entry just before its offset is the checkpointed one
+        workers: Process-pool size for parsing and hashing; 0 works in the
+            calling process
+        block_size: Bytes read (and shipped to a worker) at a time
+
+    Returns:
+        ExecutionLogVerification with the number of entries verified in
+        this run, the checkpoint of the last valid entry (pass it as
+        ``resume_from`` to continue later) and the first break, if any
+
+    Raises:
+        ValueError: If workers is negative or block_size is not positive
+    """
+    if workers < 0:
+        raise ValueError("workers must be non-negative")
+    if block_size <= 0:
+        raise ValueError("block_size must be a positive integer")
+
+    checkpoint = resume_from
+    trace_id: Any = None
+    expected_seq: int | None = None
+    prev = GENESIS_DIGEST
+    offset = 0
+    if resume_from is not None:
+        offset = resume_from["offset"]
+        entry = _entry_before(path, offset) if offset > 0 else None
+        if not (
+            isinstance(entry, dict)
+            and entry.get("entry_digest") == resume_from["entry_digest"]
+            and entry.get("sequence_number") == resume_from["sequence_number"]
+            and entry.get("trace_id") == resume_from["trace_id"]
+        ):
+            failure: ExecutionLogBreak = {
+                "offset": offset,
+                "sequence_number": resume_from["sequence_number"],
+                "reason": "CHECKPOINT_MISMATCH",
+            }
+            return {"ok": False, "entries": 0, "checkpoint": None, "first_break": failure}
+        trace_id = resume_from["trace_id"]
+        expected_seq = resume_from["sequence_number"] + 1
+        prev = resume_from["entry_digest"]
+
+    entries = 0
+    last: _Row | None = None
+    broken: _Row | None = None
+    reason: ExecutionLogBreakReason | None = None
+    # Closing stops the pool early when verification stops at the first break.
+    with closing(ordered_map(_digest_block, _blocks(path, offset, block_size), workers)) as chunks:
+        for rows in chunks:
+            for row in rows:
+                _, _, tid, seq, prev_digest, claimed, computed = row
+                if computed is None:
+                    reason = "INVALID_FRAME"
+                elif trace_id is not None and tid != trace_id:
+                    reason = "TRACE_MISMATCH"
+                elif expected_seq is not None and seq != expected_seq:
+                    reason = "SEQUENCE_GAP"
+                elif prev_digest != prev:
+                    reason = "PREV_DIGEST_MISMATCH"
+                elif computed != claimed:
+                    reason = "ENTRY_DIGEST_MISMATCH"
+                else:
+                    trace_id = tid
+                    expected_seq = seq + 1
+                    prev = claimed
+                    entries += 1
+                    last = row
+                    continue
+                broken = row
+                break
+            if broken is not None:
+                break
+
+    if last is not None:
+        checkpoint = {"trace_id": last[2], "sequence_number": last[3], "entry_digest": last[5], "offset": last[1]}
+    first_break: ExecutionLogBreak | None = None
+    if broken is not None and reason is not None:
+        first_break = {"offset": broken[0], "sequence_number": broken[3], "reason": reason}
+    return {"ok": first_break is None, "entries": entries, "checkpoint": checkpoint, "first_break": first_break}
@@ -0,0 +1,315 @@
+"""Domain logic: Merkle checkpoints and proofs over execution log entry digests.
+
+The tree is the RFC 9162 (Certificate Transparency v2) Merkle tree with
+SHA-256: a leaf is ``SHA-256(0x00 || entry_digest)`` over the 32 raw bytes
+of an entry's ``entry_digest`` and an interior node is ``SHA-256(0x01 ||
+left || right)``. Leaf i is the entry with sequence number i. Proofs and
+their verification follow RFC 9162 sections 2.1.3 and 2.1.4, so they can be
+checked with any CT-compatible verifier.
+
+Every complete, aligned subtree is stored, one contiguous ``bytearray`` of
+32-byte hashes per level (about 64 bytes per entry in total). Appending a
+leaf hashes at most one node per level, and any root, inclusion proof or
+consistency proof is assembled from O(log n) stored nodes, including roots
+and proofs for earlier tree sizes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable, Sequence
+from itertools import islice
+
+from talos_contracts.domain.types.execution_log_types import MerkleCheckpoint
+from talos_contracts.infrastructure.canonical import calculate_digest
+
+_EXTEND_BATCH = 1 << 16
+
+
+def _leaf_hash(entry_digest: str) -> bytes:
+    raw = bytes.fromhex(entry_digest)
+    if len(raw) != 32:
+        raise ValueError(f"entry digest must be 64 hex characters: {entry_digest!r}")
+    return hashlib.sha256(b"\x00" + raw).digest()
+
+
+def _node_hash(left: bytes | bytearray, right: bytes) -> bytes:
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+def _split(n: int) -> int:
+    """Largest power of two strictly less than ``n`` (n > 1)."""
+    return 1 << ((n - 1).bit_length() - 1)
+
+
+class ExecutionLogMerkleTree:
+    """
+    Append-only Merkle tree over the entry digests of one execution log.
+
+    Args:
+        entry_digests: Initial entry digests (hex), in sequence order
+    """
+
+    def __init__(self, entry_digests: Iterable[str] = ()) -> None:
+        self._levels: list[bytearray] = [bytearray()]
+        self.extend(entry_digests)
+
+    def __len__(self) -> int:
+        return len(self._levels[0]) // 32
+
+    def append(self, entry_digest: str) -> int:
+        """
+        Add one entry digest.
+
+        Returns:
+            The entry's leaf index
+
+        Raises:
+            ValueError: If entry_digest is not 64 hex characters
+        """
+        node = _leaf_hash(entry_digest)
+        levels = self._levels
+        index = position = len(self)
+        levels[0] += node
+        level = 0
+        # Each completed pair adds its parent to the level above.
+        while position & 1:
+            start = (position - 1) * 32
+            node = _node_hash(levels[level][start : start + 32], node)
+            level += 1
+            position >>= 1
+            if level == len(levels):
+                levels.append(bytearray())
+            levels[level] += node
+        return index
+
+    def extend(self, entry_digests: Iterable[str]) -> None:
+        """
+        Add entry digests in order, hashing each new level in bulk.
+
+        Raises:
+            ValueError: If a digest is not 64 hex characters
+        """
+        it = iter(entry_digests)
+        levels = self._levels
+        while batch := list(islice(it, _EXTEND_BATCH)):
+            levels[0] += b"".join(map(_leaf_hash, batch))
+            level = 0
+            while True:
+                nodes = levels[level]
+                pairs = len(nodes) // 64
+                if level + 1 == len(levels):
+                    if not pairs:
+                        break
+                    levels.append(bytearray())
+                parents = levels[level + 1]
+                done = len(parents) // 32
+                if done == pairs:
+                    break
+                sha256 = hashlib.sha256
+                parents += b"".join(
+                    sha256(b"\x01" + nodes[64 * j : 64 * j + 64]).digest() for j in range(done, pairs)
+                )
+                level += 1
+
+    def _subtree(self, lo: int, hi: int) -> bytes:
+        """MTH(D[lo:hi]) for a range that occurs in the RFC 9162 recursion."""
+        n = hi - lo
+        if n & (n - 1) == 0 and lo % n == 0:
+            level = n.bit_length() - 1
+            return bytes(self._levels[level][32 * (lo >> level) : 32 * ((lo >> level) + 1)])
+        k = _split(n)
+        return _node_hash(self._subtree(lo, lo + k), self._subtree(lo + k, hi))
+
+    def _size(self, tree_size: int | None) -> int:
+        size = len(self) if tree_size is None else tree_size
+        if not 0 <= size <= len(self):
+            raise ValueError(f"tree_size must be between 0 and {len(self)}")
+        return size
+
+    def root(self, tree_size: int | None = None) -> str:
+        """
+        Merkle root (hex) of the first ``tree_size`` entries (default: all).
+
+        Raises:
+            ValueError: If tree_size is negative or larger than the tree
+        """
+        size = self._size(tree_size)
+        if size == 0:
+            return hashlib.sha256(b"").hexdigest()
+        return self._subtree(0, size).hex()
+
+    def inclusion_proof(self, index: int, tree_size: int | None = None) -> list[str]:
+        """
+        RFC 9162 inclusion proof of leaf ``index`` in the first ``tree_size`` entries.
+
+        Returns:
+            Sibling hashes (hex) from the leaf up to the root
+
+        Raises:
+            ValueError: If index is not a leaf of that tree
+        """
+        size = self._size(tree_size)
+        if not 0 <= index < size:
+            raise ValueError(f"index must be between 0 and {size - 1}")
+        path: list[bytes] = []
+        lo, hi = 0, size
+        while hi - lo > 1:
+            k = _split(hi - lo)
+            if index < lo + k:
+                path.append(self._subtree(lo + k, hi))
+                hi = lo + k
+            else:
+                path.append(self._subtree(lo, lo + k))
+                lo += k
+        return [node.hex() for node in reversed(path)]
+
+    def consistency_proof(self, old_size: int, new_size: int | None = None) -> list[str]:
+        """
+        RFC 9162 consistency proof that the first ``old_size`` entries are a
+        prefix of the first ``new_size`` entries.
+
+        Raises:
+            ValueError: Unless 0 < old_size <= new_size <= len(self)
+        """
+        size = self._size(new_size)
+        if not 0 < old_size <= size:
+            raise ValueError(f"old_size must be between 1 and {size}")
+        proof: list[bytes] = []
+        lo, hi, m = 0, size, old_size
+        complete = True
+        while m != hi - lo:
+            k = _split(hi - lo)
+            if m <= k:
+                proof.append(self._subtree(lo + k, hi))
+                hi = lo + k
+            else:
+                proof.append(self._subtree(lo, lo + k))
+                lo += k
+                m -= k
+                complete = False
+        if not complete:
+            proof.append(self._subtree(lo, hi))
+        return [node.hex() for node in reversed(proof)]
+
+    def checkpoint(
+        self, trace_id: str, tree_size: int | None = None, *, first_sequence_number: int = 0
+    ) -> MerkleCheckpoint:
+        """
+        Checkpoint committing to the first ``tree_size`` entries (default: all).
+
+        Args:
+            trace_id: Trace the log belongs to
+            tree_size: Number of entries covered
+            first_sequence_number: Sequence number of leaf 0
+
+        Returns:
+            MerkleCheckpoint whose 'checkpoint_digest' is the SHA-256 of the
+            canonical JSON of its other fields
+
+        Raises:
+            ValueError: If the tree (prefix) is empty
+        """
+        size = self._size(tree_size)
+        if size == 0:
+            raise ValueError("cannot checkpoint an empty tree")
+        checkpoint: MerkleCheckpoint = {
+            "trace_id": trace_id,
+            "checkpoint_sequence_number": first_sequence_number + size - 1,
+            "tree_size": size,
+            "merkle_root": self.root(size),
+            "checkpoint_digest": "",
+        }
+        checkpoint["checkpoint_digest"] = calculate_digest(checkpoint, ["checkpoint_digest"])
+        return checkpoint
+
+
+def verify_inclusion_proof(
+    entry_digest: str, index: int, tree_size: int, proof: Sequence[str], merkle_root: str
+) -> bool:
+    """
+    Check an RFC 9162 inclusion proof in O(log n).
+
+    Args:
+        entry_digest: Digest (hex) of the entry claimed to be leaf ``index``
+        index: Leaf index
+        tree_size: Number of entries the root covers
+        proof: Sibling hashes (hex) from ``inclusion_proof``
+        merkle_root: Root (hex) of the tree of ``tree_size`` entries
+
+    Returns:
+        True if the entry is leaf ``index`` of that tree
+    """
+    if not 0 <= index < tree_size:
+        return False
+    try:
+        node = _leaf_hash(entry_digest)
+        path = [bytes.fromhex(p) for p in proof]
+        root = bytes.fromhex(merkle_root)
+    except ValueError:
+        return False
+    fn, sn = index, tree_size - 1
+    for sibling in path:
+        if sn == 0:
+            return False
+        if fn & 1 or fn == sn:
+            node = _node_hash(sibling, node)
+            while not fn & 1 and fn:
+                fn >>= 1
+                sn >>= 1
+        else:
+            node = _node_hash(node, sibling)
+        fn >>= 1
+        sn >>= 1
+    return sn == 0 and node == root
+
+
+def verify_consistency_proof(
+    old_size: int, new_size: int, old_root: str, new_root: str, proof: Sequence[str]
+) -> bool:
+    """
+    Check an RFC 9162 consistency proof between two checkpoints in O(log n).
+
+    Args:
+        old_size: Entries covered by the older root
+        new_size: Entries covered by the newer root
+        old_root: Older Merkle root (hex)
+        new_root: Newer Merkle root (hex)
+        proof: Hashes (hex) from ``consistency_proof``
+
+    Returns:
+        True if the older tree is a prefix of the newer one
+    """
+    if not 0 < old_size <= new_size:
+        return False
+    try:
+        path = [bytes.fromhex(p) for p in proof]
+        first = bytes.fromhex(old_root)
+        second = bytes.fromhex(new_root)
+    except ValueError:
+        return False
+    if old_size == new_size:
+        return not path and first == second
+    if old_size & (old_size - 1) == 0:
+        path.insert(0, first)
+    if not path:
+        return False
+    fn, sn = old_size - 1, new_size - 1
+    while fn & 1:
+        fn >>= 1
+        sn >>= 1
+    fr = sr = path[0]
+    for c in path[1:]:
+        if sn == 0:
+            return False
+        if fn & 1 or fn == sn:
+            fr = _node_hash(c, fr)
+            sr = _node_hash(c, sr)
+            while not fn & 1 and fn:
+                fn >>= 1
+                sn >>= 1
+        else:
+            sr = _node_hash(sr, c)
+        fn >>= 1
+        sn >>= 1
+    return sn == 0 and fr == first and sr == second
@@ -0,0 +1,566 @@
+"""Domain logic: append-only TGA execution log files with group commit.
+
+``ExecutionLogWriter`` keeps one JSONL log per trace, ``<trace_id>.jsonl``,
+and owns each trace's chain state: it assigns ``sequence_number`` (from 0),
+``prev_entry_digest`` and ``entry_digest``. Entries are written as canonical
+JSON; since "entry_digest" sorts first among the entry's keys, each line is
+the digest preimage with the digest spliced in front, so every entry is
+encoded exactly once.
+
+Appends are buffered and committed in groups: one write and one fsync per
+trace per commit, issued by a background thread every ``commit_interval``
+seconds (or sooner once ``max_batch`` entries are waiting). Producers that
+wait for durability share that fsync, but each of them gets at most one
+entry in per commit, so the interval should stay near the fsync latency
+unless many producers append at once or they append with ``wait=False``.
+
+Next to every log is a sequence index, ``<trace_id>.jsonl.idx``: the byte
+offset of entry N as a little-endian uint64 at position 8 * N.
+``ExecutionLogReader`` memory-maps both files to return entry N without
+scanning. The index is derived data and is not fsynced; after a crash the
+writer truncates an incomplete last line (one without its newline) off the
+log and repairs the index from the log. A complete line that is not a
+valid entry is corruption rather than a torn append, and is reported.
+
+Chain state is kept for every trace the writer has seen, but file handles
+only for the ``max_open_traces`` most recently committed ones; the others
+are closed and reopened on their next commit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import IO, Any
+
+from talos_contracts.domain.logic._shared import GENESIS_DIGEST, utc_now
+from talos_contracts.domain.logic.execution_log import execution_log_entry_digest
+from talos_contracts.domain.types.execution_log_types import (
+    ExecutionLogEntry,
+    ExecutionLogEntryType,
+)
+from talos_contracts.infrastructure.canonical import canonical_json_bytes
+
+_ENTRY_TYPES = frozenset({"plan", "tool_call", "tool_effect", "error", "observation"})
+_TRACE_ID = re.compile(r"[0-9A-Za-z][0-9A-Za-z_.-]*\Z")
+_OFFSET = struct.Struct("<Q")
+
+
+def _index_path(log_path: Path) -> Path:
+    return log_path.with_name(log_path.name + ".idx")
+
+
+def _parse_entry(line: bytes) -> dict[str, Any] | None:
+    """Parse one log line; None unless it is an entry whose digest matches."""
+    try:
+        entry = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(entry, dict) or type(entry.get("sequence_number")) is not int:
+        return None
+    try:
+        if execution_log_entry_digest(entry) != entry.get("entry_digest"):
+            return None
+    except (TypeError, ValueError):
+        return None
+    return entry
+
+
+def _last_entry(f: IO[bytes], size: int) -> tuple[dict[str, Any] | None, int]:
+    """
+    Return the last entry and the offset just past the last newline.
+
+    Bytes after the last newline are an append that never completed; blank
+    lines are skipped.
+
+    Raises:
+        ValueError: If the last non-blank complete line is not an entry
+            whose digest matches
+    """
+    end = size
+    complete = -1  # offset just past the last newline, once found
+    window = 4096
+    while end > 0:
+        start = max(0, end - window)
+        f.seek(start)
+        data = f.read(end - start)
+        nl = data.rfind(b"\n")
+        if nl < 0:
+            if start == 0:
+                break
+            window *= 2
+            continue
+        if complete < 0:
+            complete = start + nl + 1
+        # data[:nl + 1] ends with a complete line; find where it starts.
+        prev_nl = data.rfind(b"\n", 0, nl)
+        if prev_nl < 0 and start > 0:
+            window *= 2
+            continue
+        line = data[prev_nl + 1 : nl + 1]
+        if line.strip():
+            entry = _parse_entry(line)
+            if entry is None:
+                raise ValueError(f"{f.name}: corrupt execution log entry at byte {start + prev_nl + 1}")
+            return entry, complete
+        end = start + prev_nl + 1
+        window = 4096
+    return None, max(complete, 0)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def _scan_offsets(f: IO[bytes], start: int, end: int) -> list[int]:
+    """Byte offsets of the non-blank lines in ``[start, end)``."""
+    f.seek(start)
+    offsets = []
+    pos = start
+    for line in f:
+        if pos >= end:
+            break
+        if line.strip():
+            offsets.append(pos)
+        pos += len(line)
+    return offsets
+
+
+def _recover(log_path: Path) -> tuple[int, str, int]:
+    """
+    Truncate an incomplete last line off a log and bring its index in line.
+
+    Returns:
+        (next sequence number, last entry digest, log size)
+
+    Raises:
+        ValueError: If the last complete entry is corrupt
+    """
+    index_path = _index_path(log_path)
+    with open(log_path, "r+b") as f:
+        last, size = _last_entry(f, os.fstat(f.fileno()).st_size)
+        if size != os.fstat(f.fileno()).st_size:
+            f.truncate(size)
+            f.flush()
+            os.fsync(f.fileno())
+        if last is None:
+            index_path.write_bytes(b"")
+            return 0, GENESIS_DIGEST, size
+
+        count = last["sequence_number"] + 1
+        try:
+            raw = index_path.read_bytes()
+        except FileNotFoundError:
+            raw = b""
+        offsets = [o for (o,) in _OFFSET.iter_unpack(raw[: len(raw) - len(raw) % 8])][:count]
+        # Keep the longest prefix that is increasing and points inside the log.
+        keep = 0
+        for i, offset in enumerate(offsets):
+            if offset >= size or (i and offset <= offsets[i - 1]):
+                break
+            keep = i + 1
+        offsets = offsets[:keep]
+        if offsets:
+            f.seek(offsets[-1])
+            entry = _parse_entry(f.readline())
+            if entry is None or entry["sequence_number"] != len(offsets) - 1:
+                offsets = []
+        if len(offsets) != count:
+            resume = offsets.pop() if offsets else 0
+            offsets += _scan_offsets(f, resume, size)
+            with open(index_path, "wb") as idx:
+                idx.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+        elif len(raw) != 8 * count:
+            with open(index_path, "r+b") as idx:
+                idx.truncate(8 * count)
+    return count, last["entry_digest"], size
+
+
+class _Trace:
+    """Chain state of one trace, and its file descriptors while they are open."""
+
+    __slots__ = ("path", "next_seq", "prev", "size", "lines", "offsets", "log_fd", "index_fd")
+
+    def __init__(self, path: Path, next_seq: int, prev: str, size: int) -> None:
+        self.path = path
+        self.next_seq = next_seq
+        self.prev = prev
+        self.size = size
+        self.lines: list[bytes] = []
+        self.offsets: list[int] = []
+        self.log_fd = -1
+        self.index_fd = -1
+
+    def open(self) -> None:
+        """Open the log and index for appending, if they are not open yet."""
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+        if self.log_fd < 0:
+            self.log_fd = os.open(self.path, flags, 0o666)
+        if self.index_fd < 0:
+            self.index_fd = os.open(_index_path(self.path), flags, 0o666)
+
+    def close(self) -> None:
+        for fd in (self.log_fd, self.index_fd):
+            if fd >= 0:
+                os.close(fd)
+        self.log_fd = self.index_fd = -1
+
+
+class ExecutionLogWriter:
+    """
+    Append-only execution log writer with group commit.
+
+    Safe to share between threads. A trace's log is created, or recovered
+    and continued, on its first ``append``.
+
+    Args:
+        directory: Directory holding ``<trace_id>.jsonl`` logs and their
+            ``.idx`` sequence indexes
+        commit_interval: Seconds between group commits; 0 commits in the
+            appending thread instead (still grouping whatever is pending)
+        max_batch: Pending entries that trigger a commit before the
+            interval is up
+        max_open_traces: Traces whose log and index stay open between
+            commits; the least recently committed are closed beyond that
+
+    Raises:
+        ValueError: If commit_interval is negative, or max_batch or
+            max_open_traces is not positive
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        commit_interval: float = 0.002,
+        max_batch: int = 4096,
+        max_open_traces: int = 256,
+    ) -> None:
+        if commit_interval < 0:
+            raise ValueError("commit_interval must be non-negative")
+        if max_batch <= 0:
+            raise ValueError("max_batch must be a positive integer")
+        if max_open_traces <= 0:
+            raise ValueError("max_open_traces must be a positive integer")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.commit_interval = commit_interval
+        self.max_batch = max_batch
+        self.max_open_traces = max_open_traces
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._commit_lock = threading.Lock()
+        self._traces: dict[str, _Trace] = {}
+        self._dirty: dict[str, _Trace] = {}
+        self._open_traces: OrderedDict[str, _Trace] = OrderedDict()  # guarded by _commit_lock
+        self._pending = 0
+        self._appended = 0  # tickets handed out, one per append
+        self._durable = 0  # every ticket up to this one is fsynced
+        self._error: BaseException | None = None
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        if commit_interval > 0:
+            self._thread = threading.Thread(target=self._run, name="execution-log-commit", daemon=True)
+            self._thread.start()
+
+    def log_path(self, trace_id: str) -> Path:
+        """Path of a trace's log file."""
+        return self.directory / f"{trace_id}.jsonl"
+
+    def append(
+        self,
+        trace_id: str,
+        entry_type: ExecutionLogEntryType,
+        payload: Mapping[str, Any],
+        *,
+        ts: str | None = None,
+        wait: bool = True,
+    ) -> ExecutionLogEntry:
+        """
+        Append one entry to a trace's chain.
+
+        Args:
+            trace_id: Trace the entry belongs to; also its log's file name
+            entry_type: 'plan', 'tool_call', 'tool_effect', 'error' or
+                'observation'
+            payload: JSON object
+            ts: RFC 3339 UTC timestamp (default: now, millisecond precision)
+            wait: Return only once the entry is durable; with False it is
+                durable after the next commit, ``commit()`` or ``close()``
+
+        Returns:
+            The entry, including its sequence number and digests
+
+        Raises:
+            ValueError: If trace_id or entry_type is invalid, the writer is
+                closed or the trace's existing log ends in a corrupt entry
+            TypeError: If payload is not a JSON object
+            OSError: If a commit has failed; the writer accepts no more entries
+        """
+        if not isinstance(trace_id, str) or not _TRACE_ID.match(trace_id):
+            raise ValueError(f"invalid trace_id: {trace_id!r}")
+        if entry_type not in _ENTRY_TYPES:
+            raise ValueError(f"invalid execution log entry type: {entry_type!r}")
+        if not isinstance(payload, Mapping):
+            raise TypeError("payload must be a JSON object")
+        if ts is None:
+            ts = utc_now()
+        # Everything but prev_entry_digest and sequence_number is encoded
+        # before taking the lock; the keys after them complete the preimage.
+        payload_json = canonical_json_bytes(payload)
+        tail = b',"trace_id":%s,"ts":%s,"type":%s}' % (
+            canonical_json_bytes(trace_id),
+            canonical_json_bytes(ts),
+            canonical_json_bytes(entry_type),
+        )
+        with self._lock:
+            if self._closed:
+                raise ValueError("execution log writer is closed")
+            self._raise_if_failed()
+            trace = self._traces.get(trace_id) or self._open(trace_id)
+            seq = trace.next_seq
+            prev = trace.prev
+            preimage = b'{"payload":%s,"prev_entry_digest":"%s","sequence_number":%d%s' % (
+                payload_json,
+                prev.encode(),
+                seq,
+                tail,
+            )
+            digest = hashlib.sha256(preimage).hexdigest()
+            line = b'{"entry_digest":"%s",%s\n' % (digest.encode(), preimage[1:])
+            trace.lines.append(line)
+            trace.offsets.append(trace.size)
+            trace.size += len(line)
+            trace.next_seq = seq + 1
+            trace.prev = digest
+            self._dirty[trace_id] = trace
+            self._pending += 1
+            self._appended += 1
+            ticket = self._appended
+            full = self._pending >= self.max_batch
+            if full and self._thread is not None:
+                self._cond.notify_all()
+        if wait:
+            self._wait_durable(ticket)
+        elif full and self._thread is None:
+            self.commit()
+        return {
+            "trace_id": trace_id,
+            "sequence_number": seq,
+            "type": entry_type,
+            "payload": dict(payload),
+            "ts": ts,
+            "prev_entry_digest": prev,
+            "entry_digest": digest,
+        }
+
+    def commit(self) -> None:
+        """
+        Write and fsync every pending entry; return once they are durable.
+
+        Raises:
+            OSError: If this or an earlier commit failed; entries that were
+                pending then are lost and nothing more is written
+        """
+        with self._commit_lock:
+            with self._lock:
+                self._raise_if_failed()
+                batch = list(self._dirty.items())
+                ticket = self._appended
+                self._dirty = {}
+                self._pending = 0
+                work = [(trace_id, trace, trace.lines, trace.offsets) for trace_id, trace in batch]
+                for _, trace in batch:
+                    trace.lines = []
+                    trace.offsets = []
+            try:
+                for trace_id, trace, lines, offsets in work:
+                    self._activate(trace_id, trace)
+                    _write_all(trace.log_fd, b"".join(lines))
+                    os.fsync(trace.log_fd)
+                    _write_all(trace.index_fd, struct.pack(f"<{len(offsets)}Q", *offsets))
+            except BaseException as exc:
+                with self._lock:
+                    self._error = exc
+                    self._cond.notify_all()
+                raise
+            with self._lock:
+                if ticket > self._durable:
+                    self._durable = ticket
+                self._cond.notify_all()
+
+    def close(self) -> None:
+        """
+        Commit pending entries, stop the commit thread and close all logs.
+
+        Raises:
+            OSError: If a commit has failed; the logs are closed without
+                writing the pending entries
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+        try:
+            self.commit()
+        finally:
+            with self._commit_lock:
+                for trace in self._open_traces.values():
+                    trace.close()
+                self._open_traces.clear()
+
+    def __enter__(self) -> ExecutionLogWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _open(self, trace_id: str) -> _Trace:
+        """Create or recover a trace's chain state; called with the lock held."""
+        path = self.log_path(trace_id)
+        if path.exists():
+            next_seq, prev, size = _recover(path)
+        else:
+            next_seq, prev, size = 0, GENESIS_DIGEST, 0
+            path.touch()
+            _index_path(path).write_bytes(b"")
+        trace = _Trace(path, next_seq, prev, size)
+        self._traces[trace_id] = trace
+        return trace
+
+    def _activate(self, trace_id: str, trace: _Trace) -> None:
+        """Open a trace's files, closing the least recently used; called with the commit lock held."""
+        if trace_id in self._open_traces:
+            self._open_traces.move_to_end(trace_id)
+        else:
+            while len(self._open_traces) >= self.max_open_traces:
+                _, evicted = self._open_traces.popitem(last=False)
+                evicted.close()  # unbuffered, so nothing is left to flush
+            self._open_traces[trace_id] = trace
+        trace.open()
+
+    def _raise_if_failed(self) -> None:
+        """Called with the lock held."""
+        if self._error is not None:
+            raise OSError("execution log commit failed") from self._error
+
+    def _wait_durable(self, ticket: int) -> None:
+        if self._thread is None:
+            self.commit()  # may already cover this ticket through another thread
+            return
+        with self._lock:
+            while self._durable < ticket:
+                self._raise_if_failed()
+                self._cond.wait()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._closed and self._pending < self.max_batch:
+                    self._cond.wait(self.commit_interval)
+                if self._closed:
+                    return
+                idle = not self._dirty
+            if not idle:
+                try:
+                    self.commit()
+                except BaseException:
+                    return  # recorded in self._error for waiting producers
+
+
+class ExecutionLogReader:
+    """
+    Random access to an execution log through its sequence index.
+
+    Both files are memory-mapped when the reader is opened; entries
+    appended later are not visible until a new reader is opened.
+
+    Args:
+        path: Log file written by ``ExecutionLogWriter``
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = Path(path)
+        self._log = self._map(self.path)
+        self._index = self._map(_index_path(self.path))
+        count = len(self._index) // 8
+        # Index entries past the end of the log belong to an unfinished commit.
+        while count and _OFFSET.unpack_from(self._index, 8 * (count - 1))[0] >= len(self._log):
+            count -= 1
+        self._count = count
+
+    @staticmethod
+    def _map(path: Path) -> Any:
+        try:
+            with open(path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return b""
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return b""
+
+    def __len__(self) -> int:
+        return self._count
+
+    def offset(self, sequence_number: int) -> int:
+        """
+        Return the byte offset of entry ``sequence_number`` in the log.
+
+        Raises:
+            IndexError: If there is no such entry
+        """
+        if not 0 <= sequence_number < self._count:
+            raise IndexError(f"no execution log entry {sequence_number}")
+        offset: int = _OFFSET.unpack_from(self._index, 8 * sequence_number)[0]
+        return offset
+
+    def raw(self, sequence_number: int) -> bytes:
+        """
+        Return the canonical JSON line of entry ``sequence_number``, without its newline.
+
+        Raises:
+            IndexError: If there is no such entry
+        """
+        start = self.offset(sequence_number)
+        if sequence_number + 1 < self._count:
+            end = _OFFSET.unpack_from(self._index, 8 * (sequence_number + 1))[0] - 1
+        else:
+            end = self._log.find(b"\n", start)
+            if end < 0:
+                raise IndexError(f"execution log entry {sequence_number} is incomplete")
+        return bytes(self._log[start:end])
+
+    def __getitem__(self, sequence_number: int) -> ExecutionLogEntry:
+        entry: ExecutionLogEntry = json.loads(self.raw(sequence_number))
+        return entry
+
+    def entries(self, start: int = 0) -> Iterator[ExecutionLogEntry]:
+        """Yield entries from ``start`` to the end of the log, in order."""
+        for sequence_number in range(start, self._count):
+            yield self[sequence_number]
+
+    def close(self) -> None:
+        for mapped in (self._log, self._index):
+            if isinstance(mapped, mmap.mmap):
+                mapped.close()
+        self._log = self._index = b""
+        self._count = 0
+
+    def __enter__(self) -> ExecutionLogReader:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,327 @@
+"""Domain logic: checkpoint-plus-replay recovery of TGA execution state.
+
+``execution_state`` (schemas/tga/v1/execution_state.schema.json) is derived
+by replaying an execution log: each entry becomes the last applied entry,
+and an entry whose payload carries ``to_state`` (as state-transition entries
+do) moves ``current_state``. ``state_digest`` is the SHA-256 of the JCS of
+the state without ``state_digest``.
+
+Producers periodically store an ``execution_checkpoint``, whose
+``checkpoint_digest`` is the SHA-256 of the JCS of its ``checkpoint_state``.
+Recovery starts from the newest checkpoint that is intact and agrees with
+the log (the checkpointed entry is present and hashes to the checkpointed
+``last_entry_digest``) and replays only the entries after it, checking the
+hash chain as it goes; the log's sequence index gives direct access to the
+checkpointed entry, and the entries after it are read from the log. Recovery
+time is therefore bounded by the checkpoint interval rather than by the
+length of the log.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import suppress
+from typing import Any
+
+from talos_contracts.domain.logic._shared import GENESIS_DIGEST, utc_now
+from talos_contracts.domain.logic.execution_log import execution_log_entry_digest
+from talos_contracts.domain.logic.execution_log_store import ExecutionLogReader
+from talos_contracts.domain.types.execution_log_types import (
+    ExecutionCheckpoint,
+    ExecutionCheckpointState,
+    ExecutionLogBreak,
+    ExecutionLogBreakReason,
+    ExecutionRecovery,
+    ExecutionState,
+    ExecutionStateName,
+)
+from talos_contracts.infrastructure.canonical import calculate_digest
+
+_STATE_DIGEST_EXCLUDE = ["state_digest"]
+_STATES = frozenset({"PENDING", "AUTHORIZED", "EXECUTING", "COMPLETED", "FAILED", "DENIED"})
+
+
+def execution_state_digest(state: Mapping[str, Any]) -> str:
+    """
+    Calculate the ``state_digest`` of an execution state.
+
+    Args:
+        state: Execution state; an existing 'state_digest' field is ignored
+
+    Returns:
+        Lowercase hex SHA-256 of the JCS of the state without 'state_digest'
+    """
+    return calculate_digest(state, _STATE_DIGEST_EXCLUDE)
+
+
+def _state(
+    trace_id: str, plan_id: str, current_state: ExecutionStateName, last_sequence_number: int, last_entry_digest: str
+) -> ExecutionState:
+    state: ExecutionState = {
+        "schema_id": "talos.tga.execution_state",
+        "schema_version": "v1",
+        "trace_id": trace_id,
+        "plan_id": plan_id,
+        "current_state": current_state,
+        "last_sequence_number": last_sequence_number,
+        "last_entry_digest": last_entry_digest,
+        "state_digest": "",
+    }
+    state["state_digest"] = execution_state_digest(state)
+    return state
+
+
+def _next_state(current_state: ExecutionStateName, entry: Mapping[str, Any]) -> ExecutionStateName:
+    payload = entry.get("payload")
+    if isinstance(payload, dict):
+        to_state = payload.get("to_state")
+        if to_state in _STATES:
+            new_state: ExecutionStateName = to_state
+            return new_state
+    return current_state
+
+
+def initial_execution_state(trace_id: str, plan_id: str) -> ExecutionState:
+    """
+    Execution state of a trace whose log is empty.
+
+    Returns:
+        ExecutionState in PENDING with sequence number 0 and the genesis
+        (64 zeros) last_entry_digest
+    """
+    return _state(trace_id, plan_id, "PENDING", 0, GENESIS_DIGEST)
+
+
+def apply_execution_log_entry(state: ExecutionState, entry: Mapping[str, Any]) -> ExecutionState:
+    """
+    Apply one execution log entry to a state.
+
+    The entry is not verified; ``recover_execution_state`` checks the chain.
+
+    Args:
+        state: State before the entry
+        entry: Log entry with 'sequence_number' and 'entry_digest'; a
+            'to_state' in its payload moves 'current_state'
+
+    Returns:
+        New ExecutionState with its state_digest recalculated
+    """
+    return _state(
+        state["trace_id"],
+        state["plan_id"],
+        _next_state(state["current_state"], entry),
+        entry["sequence_number"],
+        entry["entry_digest"],
+    )
+
+
+def execution_checkpoint(state: ExecutionState, *, ts: str | None = None) -> ExecutionCheckpoint:
+    """
+    Build the ``execution_checkpoint`` of a state.
+
+    Args:
+        state: State after the last applied entry
+        ts: RFC 3339 UTC timestamp (default: now, millisecond precision)
+
+    Returns:
+        ExecutionCheckpoint whose 'checkpoint_digest' is the SHA-256 of the
+        canonical JSON of its 'checkpoint_state'
+    """
+    checkpoint_state: ExecutionCheckpointState = {
+        "trace_id": state["trace_id"],
+        "plan_id": state["plan_id"],
+        "current_state": state["current_state"],
+        "last_sequence_number": state["last_sequence_number"],
+        "last_entry_digest": state["last_entry_digest"],
+    }
+    if ts is None:
+        ts = utc_now()
+    return {
+        "schema_id": "talos.tga.execution_checkpoint",
+        "schema_version": "v1",
+        "trace_id": state["trace_id"],
+        "checkpoint_sequence_number": state["last_sequence_number"],
+        "checkpoint_state": checkpoint_state,
+        "checkpoint_digest": calculate_digest(checkpoint_state, []),
+        "ts": ts,
+    }
+
+
+def _checkpoint_order(checkpoint: Any) -> int:
+    sequence_number = checkpoint.get("checkpoint_sequence_number") if isinstance(checkpoint, dict) else None
+    return sequence_number if type(sequence_number) is int else -1
+
+
+def _first_sequence_number(reader: ExecutionLogReader) -> int:
+    """Sequence number of the log's first entry; the index holds entry ``base + i`` at position i."""
+    try:
+        first = reader[0]["sequence_number"] if len(reader) else 0
+    except (KeyError, TypeError, ValueError):
+        return 0
+    return first if type(first) is int else 0
+
+
+def _complete_lines(path: str | os.PathLike[str], offset: int) -> Iterator[tuple[int, bytes]]:
+    """
+    Yield ``(offset, line)`` for the non-blank lines from ``offset`` on.
+
+    A torn last line ends the log, and a missing log is an empty one.
+    """
+    try:
+        with open(path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    return
+                if line.strip():
+                    yield offset, line
+                offset += len(line)
+    except FileNotFoundError:
+        return
+
+
+def _usable(checkpoint: Any, trace_id: str, plan_id: str, reader: ExecutionLogReader, base: int) -> bool:
+    """Whether a checkpoint is intact, belongs to this trace and plan and matches the log."""
+    try:
+        state = checkpoint["checkpoint_state"]
+        sequence_number = checkpoint["checkpoint_sequence_number"]
+        if not (
+            checkpoint["schema_id"] == "talos.tga.execution_checkpoint"
+            and checkpoint["trace_id"] == state["trace_id"] == trace_id
+            and state["plan_id"] == plan_id
+            and state["current_state"] in _STATES
+            and type(sequence_number) is int
+            and state["last_sequence_number"] == sequence_number
+            and calculate_digest(state, []) == checkpoint["checkpoint_digest"]
+            and 0 <= sequence_number - base < len(reader)
+        ):
+            return False
+        entry = reader[sequence_number - base]
+        return bool(
+            entry["sequence_number"] == sequence_number
+            and entry["trace_id"] == trace_id
+            and entry["entry_digest"] == state["last_entry_digest"]
+            and execution_log_entry_digest(entry) == state["last_entry_digest"]
+        )
+    except (KeyError, TypeError, ValueError, IndexError):
+        return False
+
+
+def recover_execution_state(
+    path: str | os.PathLike[str],
+    trace_id: str,
+    plan_id: str,
+    *,
+    checkpoints: Iterable[ExecutionCheckpoint] = (),
+    stored_state: Mapping[str, Any] | None = None,
+) -> ExecutionRecovery:
+    """
+    Rebuild the execution state of a trace from its newest usable checkpoint.
+
+    Checkpoints are tried newest first; one is used only if its digest
+    matches its state, its trace and plan match and the log entry it names
+    is present and hashes to its ``last_entry_digest``. The entries after
+    it are replayed and their chain (trace, sequence, previous digest,
+    entry digest) verified; replay stops at the first break, and the state
+    is the one after the last valid entry. Without a usable checkpoint the
+    whole log is replayed from genesis; as in ``verify_execution_log``,
+    the first entry then sets the sequence numbering. The index only
+    locates checkpointed entries: the replayed suffix is read from the log
+    itself, so entries the index missed in a crash are not lost. A torn
+    last line (a crash during append) ends the log without being reported
+    as a break.
+
+    Args:
+        path: Log file written by ``ExecutionLogWriter`` (with its index)
+        trace_id: Trace being recovered
+        plan_id: Plan the trace executes
+        checkpoints: Stored ``execution_checkpoint`` objects, in any order
+        stored_state: The persisted execution_state, compared against the
+            recovered one
+
+    Returns:
+        ExecutionRecovery with the recovered state, the checkpoint used,
+        the number of rejected (newer) checkpoints and of replayed entries,
+        the first chain break, if any, and whether the stored state diverges
+        from the recovered one (different or self-inconsistent state_digest)
+    """
+    with ExecutionLogReader(path) as reader:
+        base = _first_sequence_number(reader)
+        start: ExecutionCheckpointState | None = None
+        offset = 0
+        rejected = 0
+        for checkpoint in sorted(checkpoints, key=_checkpoint_order, reverse=True):
+            if _usable(checkpoint, trace_id, plan_id, reader, base):
+                start = checkpoint["checkpoint_state"]
+                position = start["last_sequence_number"] - base
+                offset = reader.offset(position) + len(reader.raw(position)) + 1
+                break
+            rejected += 1
+
+    current: ExecutionStateName = "PENDING"
+    last_sequence_number = 0
+    prev = GENESIS_DIGEST
+    expected: int | None = None  # like verify_execution_log, the first entry sets the numbering
+    if start is not None:
+        current = start["current_state"]
+        last_sequence_number = start["last_sequence_number"]
+        prev = start["last_entry_digest"]
+        expected = last_sequence_number + 1
+
+    replayed = 0
+    first_break: ExecutionLogBreak | None = None
+    # The index is not fsynced and may stop short of the log, so the suffix
+    # is read from the log itself.
+    for line_offset, line in _complete_lines(path, offset):
+        try:
+            entry: Any = json.loads(line)
+        except ValueError:
+            entry = None
+        reason: ExecutionLogBreakReason | None = None
+        computed: str | None = None
+        if (
+            isinstance(entry, dict)
+            and type(entry.get("sequence_number")) is int
+            and isinstance(entry.get("entry_digest"), str)
+        ):
+            with suppress(TypeError, ValueError):
+                computed = execution_log_entry_digest(entry)
+        if computed is None:
+            reason = "INVALID_FRAME"
+        elif entry.get("trace_id") != trace_id:
+            reason = "TRACE_MISMATCH"
+        elif expected is not None and entry["sequence_number"] != expected:
+            reason = "SEQUENCE_GAP"
+        elif entry.get("prev_entry_digest") != prev:
+            reason = "PREV_DIGEST_MISMATCH"
+        elif computed != entry["entry_digest"]:
+            reason = "ENTRY_DIGEST_MISMATCH"
+        if reason is not None:
+            first_break = {
+                "offset": line_offset,
+                "sequence_number": entry["sequence_number"] if computed is not None else None,
+                "reason": reason,
+            }
+            break
+        current = _next_state(current, entry)
+        last_sequence_number = entry["sequence_number"]
+        expected = last_sequence_number + 1
+        prev = entry["entry_digest"]
+        replayed += 1
+
+    state = _state(trace_id, plan_id, current, last_sequence_number, prev)
+    diverged = stored_state is not None and (
+        stored_state.get("state_digest") != state["state_digest"]
+        or execution_state_digest(stored_state) != state["state_digest"]
+    )
+    return {
+        "state": state,
+        "checkpoint_sequence_number": start["last_sequence_number"] if start is not None else None,
+        "rejected_checkpoints": rejected,
+        "replayed": replayed,
+        "chain_valid": first_break is None,
+        "first_break": first_break,
+        "state_diverged": diverged,
+    }
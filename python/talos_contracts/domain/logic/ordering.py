@@ -5,7 +5,10 @@ Ordering: (timestamp DESC, event_id DESC)
 
 from __future__ import annotations
 
-from typing import Literal
+import heapq
+from collections.abc import Iterable, Iterator
+from operator import itemgetter
+from typing import Any, Literal
 
 from talos_contracts.domain.types.cursor_types import Event
 
@@ -48,3 +51,62 @@ def ordering_compare(
         return 1
 
     return 0
+
+
+# UTF-8 preserves code point order bytewise and never uses bytes 0xF8-0xFF.
+# Mapping b -> 0xFE - b reverses the order of the remaining bytes, leaving
+# 0xFF free as a terminator that sorts a string after its extensions.
+_REVERSE_UTF8 = bytes(0xFE - b if b <= 0xFE else 0xFF for b in range(256))
+
+
+def ordering_key(event: Event) -> tuple[Any, bytes]:
+    """
+    Sort key giving the same order as ``ordering_compare``.
+
+    ``sorted(events, key=ordering_key)`` equals
+    ``sorted(events, key=cmp_to_key(ordering_compare))`` but computes one key
+    per event, and keys compare entirely in C: the event id is turned into
+    bytes whose ascending order is the descending order of the id.
+
+    Args:
+        event: Event dict with 'timestamp' and 'event_id'
+
+    Returns:
+        Key tuple, ascending in contract order
+    """
+    eid = event["event_id"].encode("utf-8", "surrogatepass").translate(_REVERSE_UTF8)
+    return -event["timestamp"], eid + b"\xff"
+
+
+def merge_ordered(
+    *streams: Iterable[Event],
+    dedupe: bool = False,
+) -> Iterator[Event]:
+    """
+    Lazily merge event streams that are each already in contract order.
+
+    Memory is proportional to the number of streams. Events comparing equal
+    keep the order of the streams they came from.
+
+    Args:
+        *streams: Iterables of events, each ordered (timestamp DESC, event_id DESC)
+        dedupe: If True, yield only the first of several events with the same
+            (timestamp, event_id), e.g. one event delivered by two shards
+
+    Returns:
+        Iterator over all events in contract order
+
+    Raises:
+        ValueError: While iterating, if an input stream is out of order
+    """
+    # Decorate once so each key is computed a single time per event.
+    keyed = [((ordering_key(e), e) for e in stream) for stream in streams]
+    last: tuple[Any, bytes] | None = None
+    for key, event in heapq.merge(*keyed, key=itemgetter(0)):
+        if last is not None:
+            if key < last:
+                raise ValueError("stream is not in contract order")
+            if dedupe and key == last:
+                continue
+        last = key
+        yield event
@@ -0,0 +1,172 @@
+"""Domain logic: watermarked reorder buffer for near-ordered live streams.
+
+Live events arrive slightly out of order. The buffer holds them until the
+event-time watermark (highest timestamp seen minus the allowed lateness)
+passes, then releases them sorted by (timestamp, event_id), so released
+cursors only move forward under ``compare_cursor``. That is the reverse of
+the ``ordering_compare`` page order, which lists the newest event first.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterable
+from typing import Any
+
+from talos_contracts.domain.logic.cursor import cursor_sort_key
+from talos_contracts.domain.types.stream_types import ReorderOutput, ReorderStats
+
+
+class ReorderBuffer:
+    """
+    Bounded event-time reorder buffer.
+
+    An item is released once its timestamp is below the watermark
+    ``max_timestamp - lateness``; memory is proportional to the number of
+    items inside that window. An arrival whose (timestamp, event_id) is not
+    greater than the last released one can no longer be placed in order and
+    is returned in ``late`` instead of being buffered; so is a duplicate of
+    an item that is still buffered.
+
+    Args:
+        lateness: Allowed lateness in seconds of event time
+        max_buffered: If set, release the oldest items early whenever more
+            than this many are buffered (bounds memory during bursts)
+        by_cursor: Take (timestamp, event_id) from the item's ``cursor``
+            instead of its 'timestamp' and 'event_id' keys, e.g. for
+            WebSocket ``EventMessage`` frames
+    """
+
+    def __init__(
+        self,
+        lateness: int = 5,
+        *,
+        max_buffered: int | None = None,
+        by_cursor: bool = False,
+    ) -> None:
+        if lateness < 0:
+            raise ValueError("lateness must be non-negative")
+        if max_buffered is not None and max_buffered <= 0:
+            raise ValueError("max_buffered must be a positive integer")
+        self.lateness = lateness
+        self.max_buffered = max_buffered
+        self.by_cursor = by_cursor
+        self._pending: list[tuple[int, str, int, Any]] = []
+        self._pending_keys: set[tuple[int, str]] = set()
+        self._seq = 0
+        self._max_ts: int | None = None
+        self._last: tuple[int, str] | None = None
+        self.stats: ReorderStats = {"received": 0, "released": 0, "late": 0, "max_buffered": 0}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @property
+    def watermark(self) -> int | None:
+        """Items with a timestamp below this are released; None before the first item."""
+        return None if self._max_ts is None else self._max_ts - self.lateness
+
+    @property
+    def last_released(self) -> tuple[int, str] | None:
+        """(timestamp, event_id) of the most recently released item."""
+        return self._last
+
+    def _key(self, item: Any) -> tuple[int, str]:
+        if self.by_cursor:
+            return cursor_sort_key(item["cursor"])
+        return item["timestamp"], item["event_id"]
+
+    def push(self, item: Any) -> ReorderOutput:
+        """
+        Add one item.
+
+        Returns:
+            ReorderOutput with the items released by this step, in order, and
+            the item itself under 'late' if it arrived too late
+        """
+        released: list[Any] = []
+        late: list[Any] = []
+        self._push(item, released, late)
+        return {"released": released, "late": late}
+
+    def push_many(self, items: Iterable[Any]) -> ReorderOutput:
+        """
+        Add several items, releasing as the watermark advances.
+
+        Returns:
+            ReorderOutput with released items in order and late arrivals in
+            arrival order
+        """
+        released: list[Any] = []
+        late: list[Any] = []
+        push = self._push
+        for item in items:
+            push(item, released, late)
+        return {"released": released, "late": late}
+
+    def advance(self, timestamp: int) -> list[Any]:
+        """
+        Move event time forward without an event, e.g. on a heartbeat.
+
+        Args:
+            timestamp: Current event time in unix seconds
+
+        Returns:
+            Items released, in order
+        """
+        released: list[Any] = []
+        if self._max_ts is None or timestamp > self._max_ts:
+            self._max_ts = timestamp
+        self._release(self._max_ts - self.lateness, released)
+        return released
+
+    def flush(self) -> list[Any]:
+        """Release every buffered item, in order (end of stream)."""
+        released: list[Any] = []
+        self._release_count(len(self._pending), released)
+        return released
+
+    def _push(self, item: Any, released: list[Any], late: list[Any]) -> None:
+        key = self._key(item)
+        ts, eid = key
+        stats = self.stats
+        stats["received"] += 1
+        if (self._last is not None and key <= self._last) or key in self._pending_keys:
+            late.append(item)
+            stats["late"] += 1
+            return
+        pending = self._pending
+        pending.append((ts, eid, self._seq, item))
+        self._pending_keys.add(key)
+        self._seq += 1
+        # Pending items are sorted lazily, only when something may be released:
+        # the watermark moved, or the new item is already below it.
+        if self._max_ts is None or ts > self._max_ts:
+            self._max_ts = ts
+            self._release(ts - self.lateness, released)
+        elif ts < self._max_ts - self.lateness:
+            self._release(self._max_ts - self.lateness, released)
+        if self.max_buffered is not None and len(pending) > self.max_buffered:
+            self._release_count(len(pending) - self.max_buffered, released)
+        if len(pending) > stats["max_buffered"]:
+            stats["max_buffered"] = len(pending)
+
+    def _release(self, watermark: int, out: list[Any]) -> None:
+        pending = self._pending
+        if not pending:
+            return
+        # Timsort is near-linear on the mostly ordered pending list; (ts,) sorts
+        # before every entry with that timestamp.
+        pending.sort()
+        self._release_count(bisect_left(pending, (watermark,)), out)
+
+    def _release_count(self, n: int, out: list[Any]) -> None:
+        if n <= 0:
+            return
+        pending = self._pending
+        pending.sort()
+        out.extend([entry[3] for entry in pending[:n]])
+        self._pending_keys.difference_update([entry[:2] for entry in pending[:n]])
+        self._last = pending[n - 1][:2]
+        del pending[:n]
+        self.stats["released"] = self._seq - len(pending)
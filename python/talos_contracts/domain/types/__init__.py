@@ -1,12 +1,41 @@
 """Domain layer types barrel export."""
 
+from talos_contracts.domain.types.audit_types import (
+    AuditHashMismatch,
+    AuditHashMismatchReason,
+    AuditHashSummary,
+)
 from talos_contracts.domain.types.cursor_types import (
     CursorBad,
     CursorOk,
+    CursorStreamFailure,
+    CursorStreamSummary,
     CursorValidationReason,
     CursorValidationResult,
     DecodedCursor,
     Event,
+    EventPage,
+)
+from talos_contracts.domain.types.execution_log_types import (
+    ExecutionCheckpoint,
+    ExecutionCheckpointState,
+    ExecutionLogBreak,
+    ExecutionLogBreakReason,
+    ExecutionLogCheckpoint,
+    ExecutionLogEntry,
+    ExecutionLogEntryType,
+    ExecutionLogVerification,
+    ExecutionRecovery,
+    ExecutionState,
+    ExecutionStateName,
+    MerkleCheckpoint,
+)
+from talos_contracts.domain.types.stream_types import ReorderOutput, ReorderStats
+from talos_contracts.domain.types.trace_chain_types import (
+    TraceChainArtifact,
+    TraceChainBreak,
+    TraceChainBreakReason,
+    TraceChainSummary,
 )
 
 __all__ = [
@@ -15,5 +44,29 @@ __all__ = [
     "CursorBad",
     "CursorValidationResult",
     "DecodedCursor",
+    "CursorStreamFailure",
+    "CursorStreamSummary",
     "Event",
+    "EventPage",
+    "ReorderOutput",
+    "ReorderStats",
+    "ExecutionLogEntryType",
+    "ExecutionLogEntry",
+    "ExecutionLogBreakReason",
+    "ExecutionLogBreak",
+    "ExecutionLogCheckpoint",
+    "ExecutionLogVerification",
+    "MerkleCheckpoint",
+    "ExecutionStateName",
+    "ExecutionState",
+    "ExecutionCheckpointState",
+    "ExecutionCheckpoint",
+    "ExecutionRecovery",
+    "TraceChainArtifact",
+    "TraceChainBreakReason",
+    "TraceChainBreak",
+    "TraceChainSummary",
+    "AuditHashMismatchReason",
+    "AuditHashMismatch",
+    "AuditHashSummary",
 ]
@@ -0,0 +1,26 @@
+"""Domain layer types: audit event hash verification."""
+
+from __future__ import annotations
+
+from typing import Literal, TypedDict
+
+AuditHashMismatchReason = Literal["INVALID_EVENT", "MISSING_HASH", "HASH_MISMATCH"]
+
+
+class AuditHashMismatch(TypedDict):
+    """One audit event whose event_hash is missing or wrong."""
+
+    index: int  # position among the events (non-blank lines of an NDJSON file)
+    reason: AuditHashMismatchReason
+    event_hash: str | None  # as stored in the event
+    computed: str | None  # None for an INVALID_EVENT
+
+
+class AuditHashSummary(TypedDict):
+    """Running counts of an audit event hash verification."""
+
+    total: int
+    ok: int
+    hash_mismatch: int
+    missing_hash: int
+    invalid_event: int
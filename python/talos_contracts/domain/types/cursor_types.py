@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Literal, TypedDict, Union
+from typing import Any, Literal, TypedDict, Union
 
 CursorValidationReason = Literal["CURSOR_MISMATCH", "INVALID_FRAME"]
 
@@ -37,3 +37,27 @@ class Event(TypedDict):
 
     timestamp: int
     event_id: str
+
+
+class CursorStreamFailure(TypedDict):
+    """One failing event reported by cursor stream validation."""
+
+    index: int
+    reason: CursorValidationReason
+    derived: str
+
+
+class CursorStreamSummary(TypedDict):
+    """Running counts of a cursor stream validation."""
+
+    total: int
+    ok: int
+    invalid_frame: int
+    cursor_mismatch: int
+
+
+class EventPage(TypedDict):
+    """One page of events in contract order."""
+
+    events: list[dict[str, Any]]
+    next_cursor: str | None
@@ -0,0 +1,121 @@
+"""Domain layer types: TGA execution log entries and hash-chain verification."""
+
+from __future__ import annotations
+
+from typing import Any, Literal, TypedDict
+
+ExecutionLogEntryType = Literal["plan", "tool_call", "tool_effect", "error", "observation"]
+
+ExecutionLogBreakReason = Literal[
+    "INVALID_FRAME",
+    "CHECKPOINT_MISMATCH",
+    "TRACE_MISMATCH",
+    "SEQUENCE_GAP",
+    "PREV_DIGEST_MISMATCH",
+    "ENTRY_DIGEST_MISMATCH",
+]
+
+
+class ExecutionLogEntry(TypedDict):
+    """One TGA execution log entry (schemas/tga/execution_log.schema.json)."""
+
+    trace_id: str
+    sequence_number: int
+    type: ExecutionLogEntryType
+    payload: dict[str, Any]
+    ts: str
+    prev_entry_digest: str
+    entry_digest: str
+
+
+class ExecutionLogCheckpoint(TypedDict):
+    """Last verified entry of an execution log, for incremental re-verification."""
+
+    trace_id: str
+    sequence_number: int
+    entry_digest: str
+    offset: int  # byte offset just past the entry's line
+
+
+class ExecutionLogBreak(TypedDict):
+    """First entry at which an execution log stops being a valid chain."""
+
+    offset: int
+    sequence_number: int | None
+    reason: ExecutionLogBreakReason
+
+
+class ExecutionLogVerification(TypedDict):
+    """Result of verifying an execution log."""
+
+    ok: bool
+    entries: int
+    checkpoint: ExecutionLogCheckpoint | None
+    first_break: ExecutionLogBreak | None
+
+
+class MerkleCheckpoint(TypedDict):
+    """
+    Merkle checkpoint over the first ``tree_size`` entries of an execution log
+    (schemas/tga/v1/merkle_checkpoint.schema.json).
+
+    ``merkle_root`` is the RFC 9162 root of the entry digests and
+    ``checkpoint_digest`` the SHA-256 of the canonical JSON of the other
+    fields.
+    """
+
+    trace_id: str
+    checkpoint_sequence_number: int
+    tree_size: int
+    merkle_root: str
+    checkpoint_digest: str
+
+
+ExecutionStateName = Literal["PENDING", "AUTHORIZED", "EXECUTING", "COMPLETED", "FAILED", "DENIED"]
+
+
+class ExecutionState(TypedDict):
+    """Execution state derived by replaying a log (schemas/tga/v1/execution_state.schema.json)."""
+
+    schema_id: str
+    schema_version: str
+    trace_id: str
+    plan_id: str
+    current_state: ExecutionStateName
+    last_sequence_number: int
+    last_entry_digest: str
+    state_digest: str
+
+
+class ExecutionCheckpointState(TypedDict):
+    """Execution state snapshot stored in a checkpoint (no schema ids or state_digest)."""
+
+    trace_id: str
+    plan_id: str
+    current_state: ExecutionStateName
+    last_sequence_number: int
+    last_entry_digest: str
+
+
+class ExecutionCheckpoint(TypedDict):
+    """Recovery checkpoint (schemas/tga/v1/execution_checkpoint.schema.json)."""
+
+    schema_id: str
+    schema_version: str
+    trace_id: str
+    checkpoint_sequence_number: int
+    checkpoint_state: ExecutionCheckpointState
+    checkpoint_digest: str
+    ts: str
+
+
+class ExecutionRecovery(TypedDict):
+    """Result of recovering execution state from checkpoints and a log."""
+
+    state: ExecutionState
+    checkpoint_sequence_number: int | None  # None when replayed from genesis
+    rejected_checkpoints: int
+    replayed: int
+    chain_valid: bool
+    first_break: ExecutionLogBreak | None
+    state_diverged: bool
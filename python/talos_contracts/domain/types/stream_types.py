@@ -0,0 +1,21 @@
+"""Domain layer types: live event stream types."""
+
+from __future__ import annotations
+
+from typing import Any, TypedDict
+
+
+class ReorderOutput(TypedDict):
+    """Events released by a reorder buffer step, and arrivals that were too late."""
+
+    released: list[Any]
+    late: list[Any]
+
+
+class ReorderStats(TypedDict):
+    """Running counts of a reorder buffer."""
+
+    received: int
+    released: int
+    late: int
+    max_buffered: int
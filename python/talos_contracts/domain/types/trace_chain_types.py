@@ -0,0 +1,37 @@
+"""Domain layer types: TGA trace-chain (AR -> SD -> TC -> TE) verification."""
+
+from __future__ import annotations
+
+from typing import Literal, TypedDict
+
+TraceChainArtifact = Literal["action_request", "supervisor_decision", "tool_call", "tool_effect"]
+
+TraceChainBreakReason = Literal[
+    "INVALID_OBJECT",
+    "TRACE_SPLIT",
+    "DUPLICATE_ID",
+    "DIGEST_MISMATCH",
+    "MISSING_PARENT",
+    "PLAN_MISMATCH",
+    "LINK_DIGEST_MISMATCH",
+    "NOT_APPROVED",
+]
+
+
+class TraceChainBreak(TypedDict):
+    """One broken object or link reported by trace-chain verification."""
+
+    index: int  # position of the object in the input stream
+    trace_id: str | None
+    artifact: TraceChainArtifact | None
+    field: str | None  # field that failed the check, if any
+    reason: TraceChainBreakReason
+
+
+class TraceChainSummary(TypedDict):
+    """Running counts of a trace-chain verification."""
+
+    traces: int
+    ok_traces: int
+    objects: int
+    breaks: int
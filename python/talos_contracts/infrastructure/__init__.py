@@ -1,25 +1,79 @@
 """Infrastructure layer barrel exports."""
 
 from talos_contracts.infrastructure.base64url import (
+    Base64UrlDecodeManyResult,
+    Base64UrlDecoder,
+    Base64UrlEncoder,
     Base64UrlError,
     base64url_decode,
+    base64url_decode_into,
+    base64url_decode_many,
     base64url_encode,
+    base64url_encode_many,
+)
+from talos_contracts.infrastructure.canonical import (
+    FrozenDict,
+    FrozenList,
+    calculate_digest,
+    calculate_digest_streaming,
+    canonical_json_bytes,
+    canonical_json_write,
+    freeze_json,
+)
+from talos_contracts.infrastructure.canonical_batch import digest_many
+from talos_contracts.infrastructure.canonical_verify import (
+    CanonicalJsonCheck,
+    CanonicalJsonViolation,
+    is_canonical_json,
 )
 from talos_contracts.infrastructure.uuidv7 import (
+    UUIDv7Generator,
     is_canonical_lower_uuid,
+    is_canonical_uuid_v7,
     is_uuid_v7,
-)
-from talos_contracts.infrastructure.canonical import (
-    canonical_json_bytes,
-    calculate_digest,
+    pack_uuid7,
+    pack_uuid7_many,
+    sort_packed_uuid7,
+    unpack_uuid7,
+    unpack_uuid7_many,
+    uuid7,
+    uuid7_batch,
+    uuid7_timestamp_ms,
+    validate_uuid_v7_many,
 )
 
 __all__ = [
     "Base64UrlError",
     "base64url_encode",
     "base64url_decode",
+    "base64url_encode_many",
+    "base64url_decode_many",
+    "Base64UrlDecodeManyResult",
+    "base64url_decode_into",
+    "Base64UrlEncoder",
+    "Base64UrlDecoder",
     "is_uuid_v7",
     "is_canonical_lower_uuid",
+    "is_canonical_uuid_v7",
+    "validate_uuid_v7_many",
+    "UUIDv7Generator",
+    "uuid7",
+    "uuid7_batch",
+    "uuid7_timestamp_ms",
+    "pack_uuid7",
+    "unpack_uuid7",
+    "pack_uuid7_many",
+    "unpack_uuid7_many",
+    "sort_packed_uuid7",
     "canonical_json_bytes",
+    "canonical_json_write",
     "calculate_digest",
+    "calculate_digest_streaming",
+    "digest_many",
+    "FrozenDict",
+    "FrozenList",
+    "freeze_json",
+    "is_canonical_json",
+    "CanonicalJsonCheck",
+    "CanonicalJsonViolation",
 ]
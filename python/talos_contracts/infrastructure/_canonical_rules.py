@@ -0,0 +1,46 @@
+"""Infrastructure (internal): RFC 8785 formatting rules shared by the encoder and the verifier."""
+
+from __future__ import annotations
+
+_INFINITY = float("inf")
+
+
+def utf16_key(key: str) -> bytes:
+    """Sort key that orders strings by UTF-16 code units (RFC 8785 section 3.2.3)."""
+    return key.encode("utf-16-be", "surrogatepass")
+
+
+def format_float(value: float) -> str:
+    """Format a float as ES6 ``Number.prototype.toString`` (RFC 8785 section 3.2.2.3)."""
+    if value != value or value == _INFINITY or value == -_INFINITY:
+        raise ValueError("NaN and Infinity are not allowed in canonical JSON")
+    if value == 0:
+        return "0"
+    text = float.__repr__(value)
+    if "e" not in text:
+        # repr uses plain notation for 1e-4 <= |x| < 1e16, inside the ES6
+        # plain range, so only an integral ".0" suffix differs.
+        return text[:-2] if text.endswith(".0") else text
+
+    # repr and ES6 agree on the shortest round-trip digits; only the layout
+    # differs. ``digits`` is the significand, ``point`` the decimal point
+    # position: value = 0.<digits> * 10**point.
+    sign = ""
+    if text[0] == "-":
+        sign = "-"
+        text = text[1:]
+    mantissa, _, exponent = text.partition("e")
+    whole, _, fraction = mantissa.partition(".")
+    digits = (whole + fraction).rstrip("0")
+    point = int(exponent) + 1
+    count = len(digits)
+    if count <= point <= 21:
+        body = digits + "0" * (point - count)
+    elif 0 < point <= 21:
+        body = digits[:point] + "." + digits[point:]
+    elif -6 < point <= 0:
+        body = "0." + "0" * -point + digits
+    else:
+        exp = point - 1
+        body = digits[0] + ("." + digits[1:] if count > 1 else "") + ("e+" if exp >= 0 else "e-") + str(abs(exp))
+    return sign + body
@@ -0,0 +1,77 @@
+"""Infrastructure (internal): chunked, order-preserving pool execution for the bulk verifiers."""
+
+from __future__ import annotations
+
+import marshal
+from collections import deque
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+from typing import Any, TypeVar
+
+_R = TypeVar("_R")
+
+
+def chunks(items: Iterable[Any], size: int) -> Iterator[tuple[list[Any], int]]:
+    """Yield ``(chunk, start_index)`` pairs of at most ``size`` items, consuming ``items`` lazily."""
+    it = iter(items)
+    start = 0
+    while chunk := list(islice(it, size)):
+        yield chunk, start
+        start += len(chunk)
+
+
+def pack_chunk(chunk: list[Any]) -> bytes | list[Any]:
+    """
+    Prepare a chunk for shipping to a worker process.
+
+    A chunk of plain JSON values becomes one ``marshal`` blob, which is
+    several times cheaper to produce than the pickle of the list; anything
+    marshal refuses (such as ``FrozenDict`` or str subclasses) is left to
+    pickle.
+    """
+    try:
+        return marshal.dumps(chunk)
+    except ValueError:
+        return chunk
+
+
+def unpack_chunk(payload: bytes | list[Any]) -> list[Any]:
+    """Inverse of :func:`pack_chunk`; a chunk that was never packed is returned as is."""
+    if isinstance(payload, bytes):
+        chunk: list[Any] = marshal.loads(payload)
+        return chunk
+    return payload
+
+
+def ordered_map(
+    fn: Callable[..., _R],
+    tasks: Iterable[tuple[Any, ...]],
+    workers: int,
+    *,
+    threads: bool = False,
+) -> Generator[_R, None, None]:
+    """
+    Yield ``fn(*args)`` for every argument tuple of ``tasks``, in task order.
+
+    With ``workers`` > 0 the calls run in a process pool (or a thread pool)
+    of that size. Tasks are drawn lazily and at most ``2 * workers`` are in
+    flight, so memory stays bounded however long the input is. Closing the
+    generator early cancels the tasks that have not started. With 0 workers
+    every call runs in the calling thread as its result is requested.
+    """
+    if not workers:
+        for args in tasks:
+            yield fn(*args)
+        return
+    pool: Executor = ThreadPoolExecutor(workers) if threads else ProcessPoolExecutor(workers)
+    pending: deque[Future[_R]] = deque()
+    try:
+        for args in tasks:
+            pending.append(pool.submit(fn, *args))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        pool.shutdown(cancel_futures=True)
@@ -1,11 +1,18 @@
 """Infrastructure layer: base64url encoding/decoding.
 
 Strict base64url encoding/decoding - NO padding allowed.
+
+The codec runs on top of ``binascii`` so every byte is handled by C-level
+primitives; the strictness rules (no padding, no ``len % 4 == 1``, zero
+trailing bits) are enforced up front on the encoded text, which makes the
+canonical check O(1) instead of a full re-encode.
 """
 
 from __future__ import annotations
 
-import re
+import binascii
+from collections.abc import Iterable
+from typing import Any, TypedDict, cast
 
 
 class Base64UrlError(ValueError):
@@ -14,18 +21,53 @@ class Base64UrlError(ValueError):
     pass
 
 
-_RE_VALID = re.compile(r"^[A-Za-z0-9\-_]*$")
-
 _ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+_ALPHABET_BYTES = _ALPHABET.encode("ascii")
 _INV = {c: i for i, c in enumerate(_ALPHABET)}
 
+# Translation tables between the standard (RFC 4648 §4) and url-safe (§5) alphabets.
+_TO_URL = bytes.maketrans(b"+/", b"-_")
+_FROM_URL = bytes.maketrans(b"-_", b"+/")
+
+# Padding needed by binascii for each valid unpadded length class.
+_PAD = {0: b"", 2: b"==", 3: b"="}
+
+# Bits of the final sextet that carry no data for each length class. They must
+# be zero for the encoding to be canonical.
+_TAIL_MASK = {2: 0x0F, 3: 0x03}
+
+
+def _check_text(s: str) -> bytes:
+    """
+    Validate strict base64url text and return it as ASCII bytes.
+
+    Raises:
+        Base64UrlError: With the same messages, in the same order, as the
+            historical pure-Python decoder.
+    """
+    if "=" in s:
+        raise Base64UrlError("Padding is not allowed")
+    try:
+        raw = s.encode("ascii")
+    except UnicodeEncodeError:
+        raise Base64UrlError("Non-base64url characters present") from None
+    if raw.translate(None, _ALPHABET_BYTES):
+        raise Base64UrlError("Non-base64url characters present")
+
+    rem = len(raw) % 4
+    if rem == 1:
+        raise Base64UrlError("Invalid base64url length")
+    if rem and _INV[s[-1]] & _TAIL_MASK[rem]:
+        raise Base64UrlError("Non-canonical base64url form")
+    return raw
+
 
-def base64url_encode(data: bytes) -> str:
+def base64url_encode(data: bytes | bytearray | memoryview) -> str:
     """
     Encode bytes to base64url string without padding.
 
     Args:
-        data: Bytes to encode
+        data: Bytes-like value to encode
 
     Returns:
         Base64url encoded string (no padding)
@@ -33,37 +75,8 @@ def base64url_encode(data: bytes) -> str:
     if not data:
         return ""
 
-    out: list[str] = []
-    i = 0
-    n = len(data)
-
-    while i + 3 <= n:
-        x = (data[i] << 16) | (data[i + 1] << 8) | data[i + 2]
-        out.append(_ALPHABET[(x >> 18) & 63])
-        out.append(_ALPHABET[(x >> 12) & 63])
-        out.append(_ALPHABET[(x >> 6) & 63])
-        out.append(_ALPHABET[x & 63])
-        i += 3
-
-    rem = n - i
-    if rem == 1:
-        x = data[i]
-        out.append(_ALPHABET[(x >> 2) & 63])
-        out.append(_ALPHABET[(x << 4) & 63])
-    elif rem == 2:
-        x = (data[i] << 8) | data[i + 1]
-        out.append(_ALPHABET[(x >> 10) & 63])
-        out.append(_ALPHABET[(x >> 4) & 63])
-        out.append(_ALPHABET[(x << 2) & 63])
-
-    return "".join(out)
-
-
-def _decode_char(c: str) -> int:
-    """Decode a single base64url character."""
-    if c not in _INV:
-        raise Base64UrlError(f"Invalid base64url character: {c}")
-    return _INV[c]
+    out = binascii.b2a_base64(data, newline=False).translate(_TO_URL)
+    return out.rstrip(b"=").decode("ascii")
 
 
 def base64url_decode(s: str) -> bytes:
@@ -84,45 +97,424 @@ def base64url_decode(s: str) -> bytes:
     if s == "":
         return b""
 
-    if "=" in s:
-        raise Base64UrlError("Padding is not allowed")
-    if not _RE_VALID.match(s):
-        raise Base64UrlError("Non-base64url characters present")
-    if len(s) % 4 == 1:
-        raise Base64UrlError("Invalid base64url length")
+    if len(s) > _CHUNK:
+        # Large payloads decode slice by slice to avoid full-size temporaries.
+        out = bytearray(len(s) * 3 // 4)
+        base64url_decode_into(s, out)
+        return bytes(out)
+
+    raw = _check_text(s)
+    return binascii.a2b_base64(raw.translate(_FROM_URL) + _PAD[len(raw) % 4])
+
+
+# --- Batch API -------------------------------------------------------------
+#
+# Many short values are decoded/encoded with a single binascii call over one
+# joined buffer. Every record is padded up to a whole base64 quantum with
+# zero bits ("A" sextets / NUL bytes), which decode/encode to data that is
+# sliced away again, so records never bleed into each other.
+
+_FILL = {0: "", 2: "AA", 3: "A"}
+_ZERO_FILL = {0: b"", 1: b"\0\0", 2: b"\0"}
+
+# Final characters whose unused low bits are zero, per length class.
+_CANONICAL_TAILS = {
+    rem: bytes(c for c in _ALPHABET_BYTES if not _INV[chr(c)] & mask)
+    for rem, mask in _TAIL_MASK.items()
+}
+
+
+class Base64UrlDecodeManyResult(TypedDict):
+    """Result of :func:`base64url_decode_many`."""
+
+    values: list[bytes | None]
+    errors: list[int]
+
+
+def _interleave(buffer: Any, width: int, fill: bytes) -> Any:
+    """
+    Insert ``fill`` after every ``width``-sized record of ``buffer``.
+
+    Uses one strided copy per byte column, so the cost is O(width) C-level
+    copies rather than one Python-level slice per record.
+    """
+    if not fill:
+        return buffer
+    count = len(buffer) // width
+    stride = width + len(fill)
+    out = bytearray(fill[:1]) * (stride * count)
+    for col in range(width):
+        out[col::stride] = buffer[col::width]
+    return out
+
+
+def _buffer_bytes(buffer: Any) -> bytes:
+    """Copy any C-contiguous buffer (bytes, bytearray, memoryview, mmap, array) to bytes."""
+    return memoryview(buffer).cast("B").tobytes()
+
+
+def _split_encoded(text: str, stride: int, size: int) -> list[str]:
+    """Cut ``size`` chars out of every ``stride``-char encoded record."""
+    return [text[i : i + size] for i in range(0, len(text), stride)]
+
+
+def _split_decoded(out: bytes, stride: int, size: int) -> list[bytes | None]:
+    """Cut ``size`` bytes out of every ``stride``-byte decoded record."""
+    return [out[i : i + size] for i in range(0, len(out), stride)]
+
+
+def base64url_encode_many(
+    items: Iterable[bytes] | bytes | bytearray | memoryview,
+    *,
+    width: int | None = None,
+) -> list[str]:
+    """
+    Encode many byte strings to base64url in one pass.
+
+    Args:
+        items: Iterable of bytes-like values, or (with ``width``) one
+            contiguous buffer of fixed-width records
+        width: Record width in bytes when ``items`` is a single buffer
+
+    Returns:
+        Base64url strings (no padding), in input order
+
+    Raises:
+        ValueError: If the buffer length is not a multiple of ``width``
+    """
+    if width is not None:
+        if width <= 0:
+            raise ValueError("width must be a positive integer")
+        buffer = _buffer_bytes(items)
+        if len(buffer) % width:
+            raise ValueError("buffer length is not a multiple of width")
+        if not buffer:
+            return []
+        joined = _interleave(buffer, width, _ZERO_FILL[width % 3])
+    else:
+        datas: list[Any] = list(items)
+        if not datas:
+            return []
+        lens = [len(d) for d in datas]
+        width = lens[0]
+        if min(lens) != max(lens):
+            return _encode_ragged(datas, lens)
+        if width == 0:
+            return [""] * len(datas)
+        fill = _ZERO_FILL[width % 3]
+        joined = fill.join(datas) + fill
+
+    text = binascii.b2a_base64(joined, newline=False).translate(_TO_URL).decode("ascii")
+    return _split_encoded(text, (width + 2) // 3 * 4, (4 * width + 2) // 3)
+
+
+def _encode_ragged(datas: list[Any], lens: list[int]) -> list[str]:
+    """Batch-encode records of differing lengths."""
+    joined = b"".join([bytes(d) + _ZERO_FILL[n % 3] for d, n in zip(datas, lens, strict=True)])
+    text = binascii.b2a_base64(joined, newline=False).translate(_TO_URL).decode("ascii")
+    result = []
+    pos = 0
+    for n in lens:
+        result.append(text[pos : pos + (4 * n + 2) // 3])
+        pos += (n + 2) // 3 * 4
+    return result
+
+
+def _decode_uniform(
+    raw: bytes, width: int, texts: list[str] | None = None
+) -> list[bytes | None] | None:
+    """
+    Decode a contiguous ASCII buffer of ``width``-char records.
+
+    ``texts`` optionally carries the same records as separate strings, which
+    makes inserting the fill a plain ``join``.
 
-    out = bytearray()
-    i = 0
-
-    while i < len(s):
-        remain = len(s) - i
-
-        if remain >= 4:
-            a = _decode_char(s[i])
-            b = _decode_char(s[i + 1])
-            c = _decode_char(s[i + 2])
-            d = _decode_char(s[i + 3])
-            x = (a << 18) | (b << 12) | (c << 6) | d
-            out.extend([(x >> 16) & 255, (x >> 8) & 255, x & 255])
-            i += 4
-        elif remain == 2:
-            a = _decode_char(s[i])
-            b = _decode_char(s[i + 1])
-            x = (a << 18) | (b << 12)
-            out.append((x >> 16) & 255)
-            i += 2
-        elif remain == 3:
-            a = _decode_char(s[i])
-            b = _decode_char(s[i + 1])
-            c = _decode_char(s[i + 2])
-            x = (a << 18) | (b << 12) | (c << 6)
-            out.extend([(x >> 16) & 255, (x >> 8) & 255])
-            i += 3
+    Returns None if any record is invalid, leaving error attribution to the
+    per-item path.
+    """
+    rem = width % 4
+    if rem == 1 or b"=" in raw or raw.translate(None, _ALPHABET_BYTES):
+        return None
+    if rem and raw[width - 1 :: width].translate(None, _CANONICAL_TAILS[rem]):
+        return None
+    fill = _FILL[rem]
+    if texts is None:
+        filled = _interleave(raw, width, fill.encode("ascii"))
+    else:
+        filled = (fill.join(texts) + fill).encode("ascii")
+    out = binascii.a2b_base64(filled.translate(_FROM_URL))
+    return _split_decoded(out, (width + 3) // 4 * 3, width * 3 // 4)
+
+
+def _ragged_valid(texts: list[str], lens: list[int], joined: str) -> bool:
+    """Check records of differing lengths, scanning the alphabet only once."""
+    if not joined.isascii() or "=" in joined:
+        return False
+    if joined.encode("ascii").translate(None, _ALPHABET_BYTES):
+        return False
+    for s, n in zip(texts, lens, strict=True):
+        rem = n % 4
+        if rem == 1 or (rem and _INV[s[-1]] & _TAIL_MASK[rem]):
+            return False
+    return True
+
+
+def _decode_ragged(texts: list[str], lens: list[int]) -> list[bytes | None]:
+    """Batch-decode canonical records of differing lengths."""
+    raw = "".join([s + _FILL[n % 4] for s, n in zip(texts, lens, strict=True)]).encode("ascii")
+    out = binascii.a2b_base64(raw.translate(_FROM_URL))
+    result: list[bytes | None] = []
+    pos = 0
+    for n in lens:
+        result.append(out[pos : pos + n * 3 // 4])
+        pos += (n + 3) // 4 * 3
+    return result
+
+
+def _decode_per_item(texts: list[str]) -> Base64UrlDecodeManyResult:
+    """Slow path: validate each item to attribute errors, then batch-decode the rest."""
+    values: list[bytes | None] = [None] * len(texts)
+    errors: list[int] = []
+    good: list[int] = []
+    for i, s in enumerate(texts):
+        try:
+            _check_text(s)
+        except Base64UrlError:
+            errors.append(i)
         else:
-            raise Base64UrlError("Invalid base64url length")
+            good.append(i)
+
+    decoded = _decode_ragged([texts[i] for i in good], [len(texts[i]) for i in good])
+    for i, value in zip(good, decoded, strict=True):
+        values[i] = value
+    return {"values": values, "errors": errors}
+
+
+def base64url_decode_many(
+    items: Iterable[str] | str | bytes | bytearray | memoryview,
+    *,
+    width: int | None = None,
+) -> Base64UrlDecodeManyResult:
+    """
+    Decode many base64url strings in one pass.
+
+    Invalid items do not raise: their slot in ``values`` is ``None`` and
+    their index is listed in ``errors`` (ascending).
+
+    Args:
+        items: Iterable of base64url strings, or (with ``width``) one
+            contiguous ASCII buffer of fixed-width encoded records
+        width: Record width in characters when ``items`` is a single buffer
+
+    Returns:
+        Base64UrlDecodeManyResult with ``values`` and ``errors``
+
+    Raises:
+        ValueError: If the buffer length is not a multiple of ``width``
+    """
+    if width is not None:
+        if width <= 0:
+            raise ValueError("width must be a positive integer")
+        text = items if isinstance(items, str) else _buffer_bytes(items).decode("latin-1")
+        if len(text) % width:
+            raise ValueError("buffer length is not a multiple of width")
+        if not text:
+            return {"values": [], "errors": []}
+        if text.isascii():
+            values = _decode_uniform(text.encode("ascii"), width)
+            if values is not None:
+                return {"values": values, "errors": []}
+        return _decode_per_item([text[i : i + width] for i in range(0, len(text), width)])
+
+    # Without ``width``, ``items`` is an iterable of strings.
+    texts = list(cast("Iterable[str]", items))
+    if not texts:
+        return {"values": [], "errors": []}
+    lens = [len(t) for t in texts]
+    joined = "".join(texts)
+
+    if min(lens) == max(lens):
+        if lens[0] == 0:
+            return {"values": [b""] * len(texts), "errors": []}
+        if joined.isascii():
+            values = _decode_uniform(joined.encode("ascii"), lens[0], texts)
+            if values is not None:
+                return {"values": values, "errors": []}
+        return _decode_per_item(texts)
+
+    if _ragged_valid(texts, lens, joined):
+        return {"values": _decode_ragged(texts, lens), "errors": []}
+    return _decode_per_item(texts)
+
+
+# --- Bounded-memory API ----------------------------------------------------
+#
+# Large payloads (e.g. secret envelope ciphertexts) are processed in
+# fixed-size slices so the working set stays at O(_CHUNK) on top of the
+# caller's input and output buffers.
+
+_CHUNK = 64 * 1024  # encoded characters per slice; a multiple of 4
+
+
+def _ascii_chunk(chunk: Any) -> bytes:
+    """Return a slice of encoded text as alphabet-checked ASCII bytes."""
+    if isinstance(chunk, str):
+        try:
+            chunk = chunk.encode("ascii")
+        except UnicodeEncodeError:
+            raise Base64UrlError("Non-base64url characters present") from None
+    if chunk.translate(None, _ALPHABET_BYTES):
+        raise Base64UrlError("Non-base64url characters present")
+    return bytes(chunk)
+
+
+def _tail_value(text: Any) -> int | None:
+    """Sextet value of the last character of ``text``, or None if invalid."""
+    last = text[-1]
+    return _INV.get(last if isinstance(last, str) else chr(last))
+
 
-    # Strict canonical check: re-encode must match exactly
-    if base64url_encode(bytes(out)) != s:
+def base64url_decode_into(s: str | bytes | bytearray, out: Any) -> int:
+    """
+    Decode base64url text directly into a caller-supplied buffer.
+
+    The input is processed in fixed-size slices, so no full-size
+    intermediate copy of the text or of the decoded bytes is made. ``s``
+    may be any sliceable text or bytes-like object with ``find`` (``str``,
+    ``bytes``, ``bytearray``, ``mmap.mmap``). The same strictness rules and
+    error messages as :func:`base64url_decode` apply; on error the contents
+    of ``out`` are unspecified.
+
+    Args:
+        s: Base64url encoded text (no padding)
+        out: Writable buffer with room for the decoded bytes
+
+    Returns:
+        Number of bytes written to ``out``
+
+    Raises:
+        Base64UrlError: If input is not valid canonical base64url
+        ValueError: If ``out`` is too small
+    """
+    n = len(s)
+    if n == 0:
+        return 0
+
+    padded = s.find("=") if isinstance(s, str) else s.find(b"=")
+    if padded != -1:
+        raise Base64UrlError("Padding is not allowed")
+
+    rem = n % 4
+    tail = _tail_value(s)
+    if rem == 1 or tail is None or (rem and tail & _TAIL_MASK[rem]):
+        # Error path: report character problems first, as base64url_decode does.
+        for i in range(0, n, _CHUNK):
+            _ascii_chunk(s[i : i + _CHUNK])
+        if rem == 1:
+            raise Base64UrlError("Invalid base64url length")
         raise Base64UrlError("Non-canonical base64url form")
 
-    return bytes(out)
+    view = memoryview(out).cast("B")
+    size = n * 3 // 4
+    if view.nbytes < size:
+        raise ValueError(f"output buffer too small: need {size} bytes, got {view.nbytes}")
+
+    pos = 0
+    for i in range(0, n, _CHUNK):
+        raw = _ascii_chunk(s[i : i + _CHUNK])
+        if i + _CHUNK >= n:
+            raw += _PAD[rem]
+        decoded = binascii.a2b_base64(raw.translate(_FROM_URL))
+        view[pos : pos + len(decoded)] = decoded
+        pos += len(decoded)
+    return pos
+
+
+class Base64UrlEncoder:
+    """
+    Incremental base64url encoder (no padding).
+
+    ``update`` returns the text for every complete 3-byte group seen so far;
+    ``finalize`` flushes the remaining 0-2 bytes. Concatenating all returned
+    strings equals ``base64url_encode`` of the concatenated input.
+    """
+
+    def __init__(self) -> None:
+        self._pending = b""
+        self._done = False
+
+    def update(self, data: bytes | bytearray | memoryview) -> str:
+        """Feed ``data`` and return the encoded text that is now final."""
+        if self._done:
+            raise ValueError("encoder already finalized")
+        view = memoryview(data).cast("B")
+        head = ""
+        if self._pending:
+            need = 3 - len(self._pending)
+            group = self._pending + view[:need].tobytes()
+            view = view[need:]
+            if len(group) < 3:
+                self._pending = group
+                return ""
+            head = base64url_encode(group)
+        k = len(view) // 3 * 3
+        self._pending = view[k:].tobytes()
+        if not k:
+            return head
+        return head + base64url_encode(view[:k])
+
+    def finalize(self) -> str:
+        """Return the encoding of the trailing partial group."""
+        if self._done:
+            raise ValueError("encoder already finalized")
+        self._done = True
+        tail, self._pending = self._pending, b""
+        return base64url_encode(tail)
+
+
+class Base64UrlDecoder:
+    """
+    Incremental strict base64url decoder.
+
+    ``update`` accepts text (``str`` or ASCII bytes) in chunks of any size
+    and returns the bytes for every complete 4-character group seen so far.
+    ``finalize`` applies the end-of-input rules (length class and canonical
+    trailing bits) and returns the last 0-2 bytes. Chunk boundaries do not
+    affect the result. Padding and foreign characters are rejected as soon
+    as the chunk containing them is seen, so for multi-chunk input the first
+    error reported may differ from the one-shot :func:`base64url_decode`.
+    """
+
+    def __init__(self) -> None:
+        self._pending = b""
+        self._done = False
+
+    def update(self, chunk: str | bytes | bytearray | memoryview) -> bytes:
+        """Feed ``chunk`` and return the decoded bytes that are now final."""
+        if self._done:
+            raise ValueError("decoder already finalized")
+        if not isinstance(chunk, str):
+            chunk = memoryview(chunk).cast("B").tobytes()
+        if (chunk.find("=") if isinstance(chunk, str) else chunk.find(b"=")) != -1:
+            raise Base64UrlError("Padding is not allowed")
+        raw = self._pending + _ascii_chunk(chunk)
+        k = len(raw) // 4 * 4
+        self._pending = raw[k:]
+        if not k:
+            return b""
+        return binascii.a2b_base64(raw[:k].translate(_FROM_URL))
+
+    def finalize(self) -> bytes:
+        """Validate the end of input and return the remaining bytes."""
+        if self._done:
+            raise ValueError("decoder already finalized")
+        self._done = True
+        tail, self._pending = self._pending, b""
+        rem = len(tail)
+        if rem == 0:
+            return b""
+        if rem == 1:
+            raise Base64UrlError("Invalid base64url length")
+        if _INV[chr(tail[-1])] & _TAIL_MASK[rem]:
+            raise Base64UrlError("Non-canonical base64url form")
+        return binascii.a2b_base64(tail.translate(_FROM_URL) + _PAD[rem])
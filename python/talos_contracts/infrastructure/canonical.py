@@ -1,43 +1,499 @@
+"""Infrastructure: RFC 8785 (JCS) canonical JSON and digests.
+
+The encoder walks the value once and appends text fragments to a single
+output buffer that is joined and UTF-8 encoded at the end. There is no
+normalised copy of the input, floats are formatted like ES6
+``Number.prototype.toString`` and object keys are ordered by UTF-16 code
+units, as RFC 8785 requires. The streaming variant flushes that buffer to a
+sink whenever it grows past a fixed number of fragments, so the canonical
+bytes are never held in full.
+
+``FrozenDict``/``FrozenList`` subtrees cache their canonical text, so a
+document that is re-hashed after small edits only re-encodes the nodes on
+the edited path.
+"""
+
+from __future__ import annotations
+
 import hashlib
-import json
-from typing import Any, Optional, List
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from json.encoder import encode_basestring
+from typing import Any
+
+from talos_contracts.infrastructure._canonical_rules import format_float, utf16_key
+
+# Fragments buffered before a streaming flush; at a few bytes per fragment
+# this gives sink writes of some tens of KiB.
+_FLUSH_FRAGMENTS = 8192
+
+
+def _sorted_keys(obj: dict[str, Any]) -> list[str]:
+    keys = sorted(obj)
+    try:
+        joined = "".join(keys)
+    except TypeError:
+        raise TypeError("canonical JSON object keys must be strings") from None
+    # Code point order equals UTF-16 code unit order for ASCII keys.
+    if not joined.isascii():
+        keys.sort(key=utf16_key)
+    return keys
+
+
+def _encode_object(
+    obj: dict[str, Any],
+    keys: list[str],
+    out: list[str],
+    flush: Callable[[], None] | None,
+    drop_nulls: bool,
+) -> None:
+    """Append the members ``keys`` (already in canonical order) of ``obj``."""
+    append = out.append
+    sep = "{"
+    for key in keys:
+        item = obj[key]
+        if item is None and drop_nulls:
+            continue
+        append(sep)
+        append(encode_basestring(key))
+        item_cls = type(item)
+        if item_cls is str:
+            append(":")
+            append(encode_basestring(item))
+        elif item_cls is int:
+            append(":")
+            append(int.__repr__(item))
+        elif item_cls is float:
+            append(":")
+            append(format_float(item))
+        else:
+            append(":")
+            _encode(item, out, flush, drop_nulls)
+        sep = ","
+        if flush is not None and len(out) > _FLUSH_FRAGMENTS:
+            flush()
+    append("{}" if sep == "{" else "}")
+
 
+def _encode(
+    value: Any,
+    out: list[str],
+    flush: Callable[[], None] | None = None,
+    drop_nulls: bool = False,
+) -> None:
+    """
+    Append the canonical JSON text of ``value`` to ``out``.
+
+    When ``flush`` is given it is called after a container item once ``out``
+    holds more than ``_FLUSH_FRAGMENTS`` fragments; it must empty ``out``.
+    With ``drop_nulls``, object members whose value is None are skipped at
+    every depth (array items are kept), like ``strip_nulls``.
+    """
+    append = out.append
+    cls = type(value)
+    if cls is str:
+        append(encode_basestring(value))
+    elif cls is dict:
+        if value:
+            _encode_object(value, _sorted_keys(value), out, flush, drop_nulls)
+        else:
+            append("{}")
+    elif cls is list or cls is tuple:
+        if not value:
+            append("[]")
+            return
+        sep = "["
+        for item in value:
+            append(sep)
+            item_cls = type(item)
+            if item_cls is str:
+                append(encode_basestring(item))
+            elif item_cls is int:
+                append(int.__repr__(item))
+            elif item_cls is float:
+                append(format_float(item))
+            else:
+                _encode(item, out, flush, drop_nulls)
+            sep = ","
+            if flush is not None and len(out) > _FLUSH_FRAGMENTS:
+                flush()
+        append("]")
+    elif cls is int:
+        append(int.__repr__(value))
+    elif value is None:
+        append("null")
+    elif value is True:
+        append("true")
+    elif value is False:
+        append("false")
+    elif cls is float:
+        append(format_float(value))
+    elif cls is FrozenDict or cls is FrozenList:
+        # The cached text keeps nulls, so dropping them walks the subtree.
+        if drop_nulls:
+            _encode(value._data, out, flush, True)
+        else:
+            append(value._canonical_text())
+    # Subclasses (str enums, IntEnum, OrderedDict, ...) take the slow path.
+    elif isinstance(value, str):
+        append(encode_basestring(value))
+    elif isinstance(value, int):
+        append(int.__repr__(value))
+    elif isinstance(value, float):
+        append(format_float(value))
+    elif isinstance(value, dict):
+        _encode(dict(value), out, flush, drop_nulls)
+    elif isinstance(value, (list, tuple)):
+        _encode(list(value), out, flush, drop_nulls)
+    else:
+        raise TypeError(f"Object of type {cls.__name__} is not JSON serializable")
 
-def _normalize_numbers(data: Any) -> Any:
-    if isinstance(data, dict):
-        return {key: _normalize_numbers(value) for key, value in data.items()}
-    if isinstance(data, list):
-        return [_normalize_numbers(value) for value in data]
-    if isinstance(data, float) and data.is_integer():
-        return int(data)
-    return data
 
+def freeze_json(value: Any) -> Any:
+    """
+    Deep-convert dicts and lists/tuples into ``FrozenDict``/``FrozenList``.
 
-def canonical_json_bytes(data: Any) -> bytes:
+    Frozen nodes and scalars are returned unchanged, so freezing a document
+    that already shares frozen subtrees keeps their cached encodings.
+    """
+    cls = type(value)
+    if cls is FrozenDict or cls is FrozenList:
+        return value
+    if isinstance(value, dict):
+        return FrozenDict(value)
+    if isinstance(value, (list, tuple)):
+        return FrozenList(value)
+    return value
+
+
+class FrozenDict(Mapping[str, Any]):
+    """
+    Immutable JSON object that caches its canonical encoding.
+
+    The canonical text is computed on first use by any of the canonical
+    functions and reused afterwards. Edits return a new object that shares
+    every untouched child, so only the edited path is re-encoded. Cached
+    text is kept for every frozen node, so memory grows with the nesting
+    depth as well as the document size.
+
+    Args:
+        data: Mapping or key/value pairs; nested dicts and lists are frozen
+    """
+
+    __slots__ = ("_data", "_canonical")
+    _data: dict[str, Any]
+    _canonical: str | None
+
+    def __init__(self, data: Mapping[str, Any] | Iterable[tuple[str, Any]] = ()) -> None:
+        self._data = {k: freeze_json(v) for k, v in dict(data).items()}
+        self._canonical = None
+
+    @classmethod
+    def _wrap(cls, data: dict[str, Any]) -> FrozenDict:
+        frozen = cls.__new__(cls)
+        frozen._data = data
+        frozen._canonical = None
+        return frozen
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"FrozenDict({self._data!r})"
+
+    def _canonical_text(self) -> str:
+        text = self._canonical
+        if text is None:
+            out: list[str] = []
+            _encode(self._data, out)
+            text = self._canonical = "".join(out)
+        return text
+
+    def set(self, key: str, value: Any) -> FrozenDict:
+        """Return a copy with ``key`` set to ``value`` (frozen)."""
+        data = dict(self._data)
+        data[key] = freeze_json(value)
+        return FrozenDict._wrap(data)
+
+    def delete(self, key: str) -> FrozenDict:
+        """
+        Return a copy without ``key``.
+
+        Raises:
+            KeyError: If key is absent
+        """
+        data = dict(self._data)
+        del data[key]
+        return FrozenDict._wrap(data)
+
+    def set_in(self, path: Sequence[str | int], value: Any) -> FrozenDict:
+        """
+        Return a copy with the value at ``path`` replaced.
+
+        Args:
+            path: Keys and list indices from this object to the edited value
+
+        Raises:
+            KeyError: If an intermediate key is absent
+            IndexError: If a list index is out of range
+            TypeError: If an intermediate value is not a frozen container, or
+                a key does not match its container (str for objects, int
+                for arrays)
+            ValueError: If path is empty
+        """
+        if not path:
+            raise ValueError("path must not be empty")
+        key = path[0]
+        if not isinstance(key, str):
+            raise TypeError(f"object key {key!r} is not a string")
+        if len(path) > 1:
+            value = _set_in_child(self._data[key], key, path[1:], value)
+        return self.set(key, value)
+
+    def thaw(self) -> dict[str, Any]:
+        """Deep-convert back to plain dicts and lists."""
+        return {k: _thaw(v) for k, v in self._data.items()}
+
+
+class FrozenList(Sequence[Any]):
+    """
+    Immutable JSON array that caches its canonical encoding.
+
+    See ``FrozenDict``; edits return a new list sharing untouched items.
+
+    Args:
+        items: Array items; nested dicts and lists are frozen
+    """
+
+    __slots__ = ("_data", "_canonical")
+    _data: tuple[Any, ...]
+    _canonical: str | None
+
+    def __init__(self, items: Iterable[Any] = ()) -> None:
+        self._data = tuple(freeze_json(v) for v in items)
+        self._canonical = None
+
+    @classmethod
+    def _wrap(cls, data: tuple[Any, ...]) -> FrozenList:
+        frozen = cls.__new__(cls)
+        frozen._data = data
+        frozen._canonical = None
+        return frozen
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return FrozenList._wrap(self._data[index])
+        return self._data[index]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FrozenList):
+            return self._data == other._data
+        if isinstance(other, (list, tuple)):
+            return self._data == tuple(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"FrozenList({list(self._data)!r})"
+
+    def _canonical_text(self) -> str:
+        text = self._canonical
+        if text is None:
+            out: list[str] = []
+            _encode(self._data, out)
+            text = self._canonical = "".join(out)
+        return text
+
+    def set(self, index: int, value: Any) -> FrozenList:
+        """
+        Return a copy with item ``index`` replaced by ``value`` (frozen).
+
+        Raises:
+            IndexError: If index is out of range
+        """
+        data = list(self._data)
+        data[index] = freeze_json(value)
+        return FrozenList._wrap(tuple(data))
+
+    def set_in(self, path: Sequence[str | int], value: Any) -> FrozenList:
+        """Return a copy with the value at ``path`` replaced; see ``FrozenDict.set_in``."""
+        if not path:
+            raise ValueError("path must not be empty")
+        index = path[0]
+        if not isinstance(index, int):
+            raise TypeError(f"array index {index!r} is not an integer")
+        if len(path) > 1:
+            value = _set_in_child(self._data[index], index, path[1:], value)
+        return self.set(index, value)
+
+    def thaw(self) -> list[Any]:
+        """Deep-convert back to plain dicts and lists."""
+        return [_thaw(v) for v in self._data]
+
+
+def _set_in_child(child: Any, key: str | int, path: Sequence[str | int], value: Any) -> Any:
+    """Apply ``set_in`` to the frozen container ``child`` found at ``key``."""
+    if type(child) is not FrozenDict and type(child) is not FrozenList:
+        raise TypeError(f"value at {key!r} is not a frozen container")
+    return child.set_in(path, value)
+
+
+def _thaw(value: Any) -> Any:
+    cls = type(value)
+    if cls is FrozenDict or cls is FrozenList:
+        return value.thaw()
+    return value
+
+
+def _encode_root(
+    data: Any,
+    out: list[str],
+    flush: Callable[[], None] | None,
+    exclude_fields: Iterable[str] | None,
+    drop_nulls: bool,
+) -> None:
+    """Encode ``data``, leaving top-level members in ``exclude_fields`` out."""
+    if not exclude_fields or not isinstance(data, Mapping):
+        _encode(data, out, flush, drop_nulls)
+        return
+    obj: dict[str, Any]
+    if type(data) is FrozenDict:
+        obj = data._data
+    elif type(data) is dict:
+        obj = data
+    else:
+        obj = dict(data)
+    excluded = exclude_fields if isinstance(exclude_fields, (set, frozenset)) else frozenset(exclude_fields)
+    keys = [k for k in _sorted_keys(obj) if k not in excluded]
+    _encode_object(obj, keys, out, flush, drop_nulls)
+
+
+def canonical_json_bytes(
+    data: Any,
+    *,
+    exclude_fields: Iterable[str] | None = None,
+    drop_nulls: bool = False,
+) -> bytes:
     """
     Serializes a value to canonical JSON bytes according to RFC 8785.
-    - Keys sorted alphabetically.
+    - Object keys sorted by UTF-16 code units.
     - No whitespace in separators.
+    - Floats in ES6 shortest round-trip form; integral floats have no ".0".
     - UTF-8 encoding.
+
+    Integers are written exactly, including ones beyond 2**53.
+    ``FrozenDict``/``FrozenList`` nodes use their cached encoding.
+
+    Args:
+        data: JSON-compatible value
+        exclude_fields: Top-level object members to leave out, as if deleted
+            from a copy first
+        drop_nulls: Leave out object members whose value is None at every
+            depth, as if ``strip_nulls`` had been applied first
+
+    Raises:
+        TypeError: If a value or object key is not JSON-serializable
+        ValueError: If a float is NaN or infinite, or a string is not valid Unicode
     """
-    normalized = _normalize_numbers(data)
-    return json.dumps(normalized, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode(
-        "utf-8"
-    )
+    out: list[str] = []
+    _encode_root(data, out, None, exclude_fields, drop_nulls)
+    return "".join(out).encode("utf-8")
 
 
-def calculate_digest(data: dict[str, Any], exclude_fields: Optional[List[str]] = None) -> str:
+def canonical_json_write(
+    data: Any,
+    write: Callable[[bytes], Any],
+    *,
+    exclude_fields: Iterable[str] | None = None,
+    drop_nulls: bool = False,
+) -> int:
+    """
+    Stream the RFC 8785 canonical JSON of a value into a sink.
+
+    The output is ``canonical_json_bytes(data, ...)`` split into chunks of
+    some tens of KiB, so the extra memory is bounded by the chunk size and
+    the nesting depth rather than the output size. A single string value is
+    still encoded in one piece.
+
+    Args:
+        data: JSON-compatible value
+        write: Called with each chunk in order, e.g. ``hasher.update``,
+            ``file.write`` or ``socket.sendall``
+        exclude_fields: Top-level object members to leave out
+        drop_nulls: Leave out object members whose value is None
+
+    Returns:
+        Total number of bytes written
+
+    Raises:
+        TypeError: If a value or object key is not JSON-serializable
+        ValueError: If a float is NaN or infinite, or a string is not valid Unicode
+    """
+    out: list[str] = []
+    written = 0
+
+    def flush() -> None:
+        nonlocal written
+        chunk = "".join(out).encode("utf-8")
+        out.clear()
+        write(chunk)
+        written += len(chunk)
+
+    _encode_root(data, out, flush, exclude_fields, drop_nulls)
+    if out:
+        flush()
+    return written
+
+
+def calculate_digest(
+    data: Mapping[str, Any],
+    exclude_fields: list[str] | None = None,
+    *,
+    drop_nulls: bool = False,
+) -> str:
     """
     Calculates SHA-256 digest of an object after canonicalization.
     Optionally excludes specific fields (e.g., '_digest').
+
+    Exclusion and ``drop_nulls`` happen during serialization; the input is
+    not copied. ``calculate_digest(obj, drop_nulls=True)`` equals
+    ``calculate_digest(strip_nulls(obj))``.
     """
     if exclude_fields is None:
         exclude_fields = ["_digest"]
+    bytes_data = canonical_json_bytes(data, exclude_fields=exclude_fields, drop_nulls=drop_nulls)
+    return hashlib.sha256(bytes_data).hexdigest()
 
-    clean_data = data.copy()
-    for field in exclude_fields:
-        if field in clean_data:
-            del clean_data[field]
 
-    bytes_data = canonical_json_bytes(clean_data)
-    return hashlib.sha256(bytes_data).hexdigest()
+def calculate_digest_streaming(
+    data: Mapping[str, Any],
+    exclude_fields: list[str] | None = None,
+    *,
+    drop_nulls: bool = False,
+) -> str:
+    """
+    Calculate the same digest as ``calculate_digest`` without building the
+    canonical bytes: chunks from ``canonical_json_write`` are fed straight
+    into the SHA-256 state.
+
+    Args:
+        data: Object to digest
+        exclude_fields: Top-level fields left out of the digest
+            (default ``["_digest"]``)
+        drop_nulls: Leave out object members whose value is None
+
+    Returns:
+        Lowercase hex SHA-256 digest
+    """
+    if exclude_fields is None:
+        exclude_fields = ["_digest"]
+    hasher = hashlib.sha256()
+    canonical_json_write(data, hasher.update, exclude_fields=exclude_fields, drop_nulls=drop_nulls)
+    return hasher.hexdigest()
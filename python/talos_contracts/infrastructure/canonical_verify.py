@@ -0,0 +1,298 @@
+"""Infrastructure: check that serialized bytes are already RFC 8785 canonical.
+
+``is_canonical_json`` never builds an encoding to compare against. The
+rules are exactly those of
+``canonical_json_bytes``: no insignificant whitespace, object keys strictly
+increasing in UTF-16 code unit order, numbers as the encoder writes them
+and strings with only the escapes the encoder emits.
+
+Accepting a payload runs mostly at C speed: string-level checks find
+whitespace outside strings, bare "-0" and non-canonical escapes, then one
+``json.JSONDecoder.decode`` pass checks structure, with hooks for key order
+and float form (the decoded value is discarded). Only a rejected
+payload is re-scanned token by token with an explicit container stack to
+find the offset and reason of the first violation.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from typing import Any, Literal, TypedDict
+
+from talos_contracts.infrastructure._canonical_rules import format_float, utf16_key
+
+CanonicalJsonViolation = Literal[
+    "INVALID_UTF8",
+    "INVALID_JSON",
+    "WHITESPACE",
+    "KEY_ORDER",
+    "DUPLICATE_KEY",
+    "NUMBER_FORMAT",
+    "STRING_ESCAPE",
+]
+
+
+class CanonicalJsonCheck(TypedDict):
+    """Result of :func:`is_canonical_json`."""
+
+    ok: bool
+    offset: int | None
+    reason: CanonicalJsonViolation | None
+    digest: str | None
+
+
+# A string exactly as the encoder writes it: raw characters except '"', '\'
+# and controls; short escapes for the controls that have one and lowercase
+# \u00xx for the rest. Written as "run (escape run)*": runs cannot contain
+# a backslash and escapes start with one, so there is exactly one way to
+# match and a rejected string is scanned in linear time.
+_CANONICAL_CHARS = r'[^"\\\x00-\x1f]*(?:(?:\\["\\bfnrt]|\\u00(?:0[0-7bef]|1[0-9a-f]))[^"\\\x00-\x1f]*)*'
+_CANONICAL_STRING = re.compile(f'"{_CANONICAL_CHARS}"')
+_CANONICAL_PREFIX = re.compile(_CANONICAL_CHARS)
+# Any JSON string and escape, used only to classify a non-canonical string.
+_JSON_STRING = re.compile(r'"(?:[^"\\\x00-\x1f]|\\["\\/bfnrt]|\\u[0-9a-fA-F]{4})*"')
+_JSON_ESCAPE = re.compile(r'\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4})')
+_NUMBER = re.compile(r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?")
+# A backslash not starting an escape the encoder writes (after dropping "\\\\" pairs).
+_NON_CANONICAL_ESCAPE = re.compile(r'\\(?!["\\bfnrt]|u00(?:0[0-7bef]|1[0-9a-f]))')
+_BARE_NEGATIVE_ZERO = re.compile(r"-0(?![.eE0-9])")
+_WHITESPACE = " \t\n\r"
+_NUMBER_START = "-0123456789"
+
+_Violation = tuple[int, CanonicalJsonViolation]
+
+
+def _string_violation(text: str, pos: int) -> _Violation:
+    """Locate why the string starting at ``pos`` is not canonical."""
+    if not _JSON_STRING.match(text, pos):
+        # Report the first character the JSON grammar rejects.
+        i = pos + 1
+        while i < len(text):
+            c = text[i]
+            if c == '"' or c < " ":
+                break
+            if c == "\\":
+                m = _JSON_ESCAPE.match(text, i)
+                if not m:
+                    break
+                i = m.end()
+            else:
+                i += 1
+        return i, "INVALID_JSON"
+    # Valid JSON, so the first escape the encoder would not write is the culprit.
+    m = _CANONICAL_PREFIX.match(text, pos + 1)
+    return m.end(), "STRING_ESCAPE"  # type: ignore[union-attr]
+
+
+def _number_violation(token: str) -> bool:
+    """True if a JSON number token is not in the encoder's form."""
+    if "." not in token and "e" not in token and "E" not in token:
+        # Integers are written exactly; only "-0" has a shorter form.
+        return token == "-0"
+    try:
+        return format_float(float(token)) != token
+    except ValueError:
+        return True  # overflows to infinity
+
+
+def _key_violation(prev: str, key: str) -> CanonicalJsonViolation | None:
+    if prev.isascii() and key.isascii():
+        if prev < key:
+            return None
+    elif utf16_key(prev) < utf16_key(key):
+        return None
+    return "DUPLICATE_KEY" if prev == key else "KEY_ORDER"
+
+
+class _NotCanonical(Exception):
+    pass
+
+
+def _check_pairs(pairs: list[tuple[str, Any]]) -> None:
+    keys = [k for k, _ in pairs]
+    # Strictly increasing exactly when equal to its own sorted set.
+    expected = sorted(set(keys)) if "".join(keys).isascii() else sorted(set(keys), key=utf16_key)
+    if expected != keys:
+        raise _NotCanonical
+
+
+def _check_float(token: str) -> None:
+    if format_float(float(token)) != token:
+        raise _NotCanonical
+
+
+def _reject_constant(token: str) -> None:
+    raise _NotCanonical  # NaN, Infinity, -Infinity
+
+
+_CHECKING_DECODER = json.JSONDecoder(
+    object_pairs_hook=_check_pairs,
+    parse_float=_check_float,
+    parse_constant=_reject_constant,
+)
+
+
+def _fast_accept(text: str) -> bool:
+    """True if ``text`` is canonical; False means "run the exact scanner"."""
+    if "\\" in text:
+        # Dropping escaped backslashes pairs every remaining backslash with
+        # the character it escapes; dropping escaped quotes then leaves only
+        # string delimiters.
+        text_outside = text.replace("\\\\", "")
+        if _NON_CANONICAL_ESCAPE.search(text_outside):
+            return False
+        text_outside = text_outside.replace('\\"', "")
+    else:
+        text_outside = text
+    # The even pieces between delimiters are everything outside strings: no
+    # whitespace and no bare "-0" allowed there.
+    outside = "".join(text_outside.split('"')[::2])
+    if " " in outside or "\n" in outside or "\t" in outside or "\r" in outside:
+        return False
+    if "-0" in outside and _BARE_NEGATIVE_ZERO.search(outside):
+        return False
+    try:
+        _CHECKING_DECODER.decode(text)
+    except (ValueError, RecursionError, _NotCanonical):
+        return False
+    return True
+
+
+def _scan(text: str) -> _Violation | None:
+    """Return the first violation in ``text`` as (character offset, reason), or None."""
+    n = len(text)
+    string_match = _CANONICAL_STRING.match
+    number_match = _NUMBER.match
+    # One entry per open container: the last key of an object, or None for an array.
+    stack: list[str | None] = []
+    objects: list[bool] = []
+    pos = 0
+    expect_key = False
+    while True:
+        if expect_key:
+            # An object member: key, colon, then fall through to its value.
+            if pos >= n:
+                return pos, "INVALID_JSON"
+            if text[pos] != '"':
+                return pos, "WHITESPACE" if text[pos] in _WHITESPACE else "INVALID_JSON"
+            m = string_match(text, pos)
+            if m is None:
+                return _string_violation(text, pos)
+            raw = m.group()
+            key = json.loads(raw) if "\\" in raw else raw[1:-1]
+            prev = stack[-1]
+            if prev is not None:
+                reason = _key_violation(prev, key)
+                if reason is not None:
+                    return pos, reason
+            stack[-1] = key
+            pos = m.end()
+            if pos >= n or text[pos] != ":":
+                return pos, "WHITESPACE" if pos < n and text[pos] in _WHITESPACE else "INVALID_JSON"
+            pos += 1
+            expect_key = False
+
+        # A value.
+        if pos >= n:
+            return pos, "INVALID_JSON"
+        c = text[pos]
+        if c == '"':
+            m = string_match(text, pos)
+            if m is None:
+                return _string_violation(text, pos)
+            pos = m.end()
+        elif c == "{":
+            pos += 1
+            if pos < n and text[pos] == "}":
+                pos += 1
+            else:
+                stack.append(None)
+                objects.append(True)
+                expect_key = True
+                continue
+        elif c == "[":
+            pos += 1
+            if pos < n and text[pos] == "]":
+                pos += 1
+            else:
+                stack.append(None)
+                objects.append(False)
+                continue
+        elif c in _NUMBER_START:
+            m = number_match(text, pos)
+            if m is None:
+                return pos, "INVALID_JSON"
+            if _number_violation(m.group()):
+                return pos, "NUMBER_FORMAT"
+            pos = m.end()
+        elif text.startswith("true", pos):
+            pos += 4
+        elif text.startswith("false", pos):
+            pos += 5
+        elif text.startswith("null", pos):
+            pos += 4
+        else:
+            return pos, "WHITESPACE" if c in _WHITESPACE else "INVALID_JSON"
+
+        # After a value: close finished containers, then find the next value.
+        while True:
+            if not stack:
+                if pos == n:
+                    return None
+                return pos, "WHITESPACE" if text[pos] in _WHITESPACE else "INVALID_JSON"
+            if pos >= n:
+                return pos, "INVALID_JSON"
+            c = text[pos]
+            is_object = objects[-1]
+            if c == ",":
+                pos += 1
+                expect_key = is_object
+                break
+            if c == ("}" if is_object else "]"):
+                pos += 1
+                stack.pop()
+                objects.pop()
+                continue
+            return pos, "WHITESPACE" if c in _WHITESPACE else "INVALID_JSON"
+
+
+def is_canonical_json(data: bytes | bytearray | memoryview, *, digest: bool = False) -> CanonicalJsonCheck:
+    """
+    Check that ``data`` is exactly what ``canonical_json_bytes`` would write
+    for the value it encodes.
+
+    The input is decoded as UTF-8, screened with string-level checks and
+    then decoded once by the C JSON decoder, whose hooks check key order
+    and float form; no canonical encoding is built for comparison. Only
+    rejected input is re-scanned token by token to locate the violation.
+    With ``digest=True`` the SHA-256 is a separate pass over the raw bytes.
+
+    Args:
+        data: Serialized JSON bytes
+        digest: Also return the SHA-256 hex digest of ``data`` when it is
+            canonical, i.e. ``calculate_digest`` of the decoded value with
+            no exclusions
+
+    Returns:
+        CanonicalJsonCheck with 'ok', and for failures the byte 'offset' and
+        'reason' of the first violation; 'digest' is set only when requested
+        and ok
+    """
+    raw = bytes(data)
+    try:
+        text = raw.decode("utf-8")
+    except UnicodeDecodeError as exc:
+        return {"ok": False, "offset": exc.start, "reason": "INVALID_UTF8", "digest": None}
+    violation = None if _fast_accept(text) else _scan(text)
+    if violation is not None:
+        pos, reason = violation
+        offset = pos if len(text) == len(raw) else len(text[:pos].encode("utf-8"))
+        return {"ok": False, "offset": offset, "reason": reason, "digest": None}
+    return {
+        "ok": True,
+        "offset": None,
+        "reason": None,
+        "digest": hashlib.sha256(raw).hexdigest() if digest else None,
+    }
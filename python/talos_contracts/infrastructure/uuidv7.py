@@ -1,15 +1,22 @@
-"""Infrastructure layer: UUIDv7 validation.
+"""Infrastructure layer: UUIDv7 validation, generation and binary packing.
 
-Pure regex-based UUIDv7 validation with no external dependencies.
+Regex-free validation, monotonic generation and 16-byte packing of UUIDv7
+strings, with no external dependencies. Structure is checked by position
+(length, dashes, version and variant nibbles) and the hex digits with a
+single C-level ``bytes.translate`` pass.
 """
 
 from __future__ import annotations
 
-import re
+import os
+import random
+import secrets
+import threading
+import time
+from collections.abc import Callable, Iterable
 
-_RE_UUID = re.compile(
-    r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
-)
+_HEX = b"0123456789abcdefABCDEF"
+_LOWER_HEX = b"0123456789abcdef"
 
 
 def is_uuid_v7(value: str) -> bool:
@@ -27,17 +34,17 @@ def is_uuid_v7(value: str) -> bool:
     Returns:
         True if valid UUIDv7, False otherwise
     """
-    if not _RE_UUID.match(value):
-        return False
-
-    # Version nibble is first nibble of 3rd group (position 14)
-    version = value[14]
-    if version.lower() != "7":
-        return False
-
-    # Variant is first nibble of 4th group (position 19): 8, 9, a, b
-    variant = value[19].lower()
-    return variant in ("8", "9", "a", "b")
+    return (
+        len(value) == 36
+        # Version nibble is first nibble of 3rd group (position 14)
+        and value[14] == "7"
+        # Variant is first nibble of 4th group (position 19): 8, 9, a, b
+        and value[19] in "89abAB"
+        # Dashes at 8, 13, 18, 23 and nowhere else; everything else is hex
+        and value[8:24:5] == "----"
+        and value.isascii()
+        and value.encode("ascii").translate(None, _HEX) == b"----"
+    )
 
 
 def is_canonical_lower_uuid(value: str) -> bool:
@@ -51,3 +58,336 @@ def is_canonical_lower_uuid(value: str) -> bool:
         True if all lowercase, False otherwise
     """
     return value == value.lower()
+
+
+def is_canonical_uuid_v7(value: str) -> bool:
+    """
+    Check if a string is a UUIDv7 in canonical lowercase form.
+
+    Equivalent to ``is_uuid_v7(value) and is_canonical_lower_uuid(value)``
+    in a single pass.
+
+    Args:
+        value: String to validate
+
+    Returns:
+        True if valid lowercase UUIDv7, False otherwise
+    """
+    return (
+        len(value) == 36
+        and value[14] == "7"
+        and value[19] in "89ab"
+        and value[8:24:5] == "----"
+        and value.isascii()
+        and value.encode("ascii").translate(None, _LOWER_HEX) == b"----"
+    )
+
+
+# Ids validated per vectorised block; one bad id only sends its own block
+# down the per-item path.
+_BLOCK = 256
+
+
+def _block_valid(block: list[str], canonical: bool) -> bool:
+    """Vectorised check over a block of ids; True only if all are valid."""
+    n = len(block)
+    if set(map(len, block)) != {36}:
+        return False
+    joined = "".join(block)
+    if not joined.isascii():
+        return False
+    raw = joined.encode("ascii")
+    return (
+        raw[14::36].count(b"7") == n
+        and not raw[19::36].translate(None, b"89ab" if canonical else b"89abAB")
+        and raw[8::36].count(b"-") == n
+        and raw[13::36].count(b"-") == n
+        and raw[18::36].count(b"-") == n
+        and raw[23::36].count(b"-") == n
+        and raw.translate(None, _LOWER_HEX if canonical else _HEX) == b"----" * n
+    )
+
+
+def validate_uuid_v7_many(values: Iterable[str], *, canonical: bool = True) -> bytes:
+    """
+    Validate a column of UUIDv7 strings.
+
+    Args:
+        values: Iterable of strings to validate
+        canonical: Require lowercase canonical form (``is_canonical_uuid_v7``);
+            if False, apply ``is_uuid_v7`` semantics
+
+    Returns:
+        One byte per input, ``1`` if valid and ``0`` otherwise
+    """
+    items = values if isinstance(values, list) else list(values)
+    check = is_canonical_uuid_v7 if canonical else is_uuid_v7
+    out = bytearray()
+    for i in range(0, len(items), _BLOCK):
+        block = items[i : i + _BLOCK]
+        if _block_valid(block, canonical):
+            out += b"\x01" * len(block)
+        else:
+            out += bytes(map(check, block))
+    return bytes(out)
+
+
+# --- Generation ------------------------------------------------------------
+#
+# RFC 9562 §6.2 "Method 2" (monotonic random): the 74 bits of rand_a/rand_b
+# form one counter that is seeded randomly for every new millisecond and
+# advanced by a random increment within the same millisecond. Batches reserve
+# a dense run of counter values under a single clock read and lock. If the
+# counter would overflow, or the clock steps backwards, the generator keeps
+# running on the last timestamp (+1 ms on overflow) so output stays strictly
+# increasing.
+
+_COUNTER_BITS = 74
+_COUNTER_MAX = (1 << _COUNTER_BITS) - 1
+# Seeds leave the top counter bit clear so every millisecond has at least
+# 2**73 values of headroom.
+_SEED_BITS = _COUNTER_BITS - 1
+_INCREMENT_BITS = 32
+_RAND_B_BITS = 62
+_RAND_B_MASK = (1 << _RAND_B_BITS) - 1
+_MAX_UNIX_MS = (1 << 48) - 1
+
+
+def _format(value: int) -> str:
+    """Format a 128-bit integer as a canonical lowercase UUID string."""
+    h = f"{value:032x}"
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def _pack(unix_ms: int, counter: int) -> int:
+    """Lay out timestamp, version, counter and variant as a 128-bit integer."""
+    return (
+        (unix_ms << 80)
+        | (0x7 << 76)
+        | ((counter >> _RAND_B_BITS) << 64)
+        | (0b10 << 62)
+        | (counter & _RAND_B_MASK)
+    )
+
+
+class UUIDv7Generator:
+    """
+    Thread-safe monotonic UUIDv7 generator.
+
+    Every id returned by one generator (from any thread, via ``uuid7`` or
+    ``uuid7_batch``) compares strictly greater than every id it returned
+    before, both as a string and as an integer.
+
+    Args:
+        clock_ms: Returns the current Unix time in milliseconds
+            (defaults to ``time.time_ns() // 1_000_000``)
+        randbits: Returns ``k`` random bits for per-millisecond seeds
+            (defaults to ``secrets.randbits``)
+    """
+
+    def __init__(
+        self,
+        *,
+        clock_ms: Callable[[], int] | None = None,
+        randbits: Callable[[int], int] | None = None,
+    ) -> None:
+        self._clock_ms = clock_ms or (lambda: time.time_ns() // 1_000_000)
+        self._randbits = randbits or secrets.randbits
+        # Increments only need to be unpredictable enough to avoid dense
+        # runs, so they come from a fast PRNG seeded from the OS.
+        self._increments = random.Random(self._randbits(64))
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._counter = 0
+
+    def _reserve(self, n: int) -> tuple[int, int]:
+        """Reserve ``n`` counter values; return ``(unix_ms, first_counter)``."""
+        now = self._clock_ms()
+        with self._lock:
+            if now > self._last_ms:
+                self._last_ms = now
+                first = self._randbits(_SEED_BITS)
+            else:
+                first = self._counter + self._increments.getrandbits(_INCREMENT_BITS) + 1
+                if first + n - 1 > _COUNTER_MAX:
+                    self._last_ms += 1
+                    first = self._randbits(_SEED_BITS)
+            if self._last_ms > _MAX_UNIX_MS:
+                raise OverflowError("unix_ms does not fit in 48 bits")
+            self._counter = first + n - 1
+            return self._last_ms, first
+
+    def uuid7(self) -> str:
+        """Return a new UUIDv7 string."""
+        unix_ms, counter = self._reserve(1)
+        return _format(_pack(unix_ms, counter))
+
+    def uuid7_batch(self, n: int) -> list[str]:
+        """
+        Return ``n`` new UUIDv7 strings in ascending order.
+
+        The whole batch costs one clock read and one lock acquisition; the
+        ids share a timestamp and carry consecutive counter values.
+        """
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        if n == 0:
+            return []
+        unix_ms, counter = self._reserve(n)
+        last = counter + n - 1
+        if counter >> _RAND_B_BITS == last >> _RAND_B_BITS:
+            # rand_a is constant, so the first 19 characters are shared and
+            # the low 64 bits simply count up.
+            first = _pack(unix_ms, counter)
+            prefix = _format(first)[:19]
+            low = first & 0xFFFF_FFFF_FFFF_FFFF
+            return [f"{prefix}{h[:4]}-{h[4:]}" for h in map("{:016x}".format, range(low, low + n))]
+        return [_format(_pack(unix_ms, c)) for c in range(counter, last + 1)]
+
+
+_default_generator = UUIDv7Generator()
+
+
+def _reset_after_fork() -> None:
+    global _default_generator
+    _default_generator = UUIDv7Generator()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def uuid7() -> str:
+    """Return a new monotonic UUIDv7 string from the process-wide generator."""
+    return _default_generator.uuid7()
+
+
+def uuid7_batch(n: int) -> list[str]:
+    """Return ``n`` new ascending UUIDv7 strings from the process-wide generator."""
+    return _default_generator.uuid7_batch(n)
+
+
+def uuid7_timestamp_ms(value: str) -> int:
+    """
+    Extract the Unix timestamp in milliseconds from a UUIDv7.
+
+    Args:
+        value: UUIDv7 string
+
+    Returns:
+        The 48-bit ``unix_ts_ms`` field
+
+    Raises:
+        ValueError: If value is not a UUIDv7
+    """
+    if not is_uuid_v7(value):
+        raise ValueError("value is not uuidv7")
+    return int(value[:8] + value[9:13], 16)
+
+
+# --- Packed form -------------------------------------------------------------
+#
+# A canonical lowercase UUID string and its 16 big-endian bytes order the
+# same way (hex digits sort as their values in ASCII), so packed ids can be
+# compared, sorted and indexed as bytes with the same result as the
+# ``event_id`` tiebreak in ``ordering_compare``.
+
+_PACKED_SIZE = 16
+# Position of each of the 32 hex digits within the 36-character string.
+_HEX_POSITIONS = [i for i in range(36) if i not in (8, 13, 18, 23)]
+
+
+def pack_uuid7(value: str) -> bytes:
+    """
+    Pack a canonical UUIDv7 string into 16 bytes.
+
+    Args:
+        value: Lowercase canonical UUIDv7 string
+
+    Returns:
+        16-byte big-endian representation
+
+    Raises:
+        ValueError: If value is not a lowercase canonical UUIDv7
+    """
+    if not is_canonical_uuid_v7(value):
+        raise ValueError("value must be a lowercase canonical uuidv7")
+    return bytes.fromhex(value.replace("-", ""))
+
+
+def unpack_uuid7(data: bytes | bytearray | memoryview) -> str:
+    """
+    Unpack 16 bytes into a canonical lowercase UUID string.
+
+    Raises:
+        ValueError: If data is not exactly 16 bytes
+    """
+    if len(data) != _PACKED_SIZE:
+        raise ValueError("packed uuid must be 16 bytes")
+    h = bytes(data).hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def pack_uuid7_many(values: Iterable[str]) -> bytes:
+    """
+    Pack a column of canonical UUIDv7 strings into one contiguous buffer.
+
+    Args:
+        values: Lowercase canonical UUIDv7 strings
+
+    Returns:
+        ``16 * len(values)`` bytes; record ``i`` is ``pack_uuid7(values[i])``
+
+    Raises:
+        ValueError: If any value is not a lowercase canonical UUIDv7
+    """
+    items = values if isinstance(values, list) else list(values)
+    flags = validate_uuid_v7_many(items)
+    if 0 in flags:
+        raise ValueError(f"value at index {flags.index(0)} is not a lowercase canonical uuidv7")
+    return bytes.fromhex("".join(items).replace("-", ""))
+
+
+def unpack_uuid7_many(buffer: bytes | bytearray | memoryview) -> list[str]:
+    """
+    Unpack a contiguous buffer of 16-byte records into UUID strings.
+
+    Raises:
+        ValueError: If the buffer length is not a multiple of 16
+    """
+    raw = memoryview(buffer).cast("B")
+    if raw.nbytes % _PACKED_SIZE:
+        raise ValueError("buffer length is not a multiple of 16")
+    count = raw.nbytes // _PACKED_SIZE
+    hex_digits = raw.hex().encode("ascii")
+    # One strided copy per hex-digit column instead of slicing every record.
+    text = bytearray(b"-") * (36 * count)
+    for col, pos in enumerate(_HEX_POSITIONS):
+        text[pos::36] = hex_digits[col::32]
+    joined = text.decode("ascii")
+    return [joined[i : i + 36] for i in range(0, len(joined), 36)]
+
+
+def sort_packed_uuid7(
+    buffer: bytes | bytearray | memoryview, *, descending: bool = True
+) -> bytes:
+    """
+    Sort a buffer of packed ids.
+
+    Args:
+        buffer: Contiguous 16-byte records (see ``pack_uuid7_many``)
+        descending: Default matches the ``event_id DESC`` tiebreak of
+            ``ordering_compare``; pass False for ascending order
+
+    Returns:
+        A new buffer with the records sorted
+
+    Raises:
+        ValueError: If the buffer length is not a multiple of 16
+    """
+    raw = bytes(buffer)
+    if len(raw) % _PACKED_SIZE:
+        raise ValueError("buffer length is not a multiple of 16")
+    records = [raw[i : i + _PACKED_SIZE] for i in range(0, len(raw), _PACKED_SIZE)]
+    records.sort(reverse=descending)
+    return b"".join(records)
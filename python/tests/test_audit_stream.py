@@ -0,0 +1,152 @@
+"""Bulk audit event hash verification over event streams and NDJSON exports."""
+
+import copy
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from talos_contracts import (
+    AuditEventVerifier,
+    audit_event_hash,
+    calculate_digest,
+    canonical_json_bytes,
+    verify_audit_events,
+)
+
+ROOT = Path(__file__).resolve().parents[2]
+VECTORS = json.loads((ROOT / "test_vectors" / "audit_event_vectors.json").read_text())["tests"]
+
+
+def _hashed(event):
+    return dict(event, event_hash=audit_event_hash(event))
+
+
+def _expected(events):
+    """Reference result: recompute every hash with calculate_digest."""
+    mismatches = []
+    for index, event in enumerate(events):
+        try:
+            computed = calculate_digest(event, ["event_hash"]) if isinstance(event, dict) else None
+        except (TypeError, ValueError):
+            computed = None
+        claimed = event.get("event_hash") if isinstance(event, dict) else None
+        if computed is None:
+            reason = "INVALID_EVENT"
+        elif claimed is None:
+            reason = "MISSING_HASH"
+        elif claimed != computed:
+            reason = "HASH_MISMATCH"
+        else:
+            continue
+        mismatches.append({"index": index, "reason": reason, "event_hash": claimed, "computed": computed})
+    return mismatches
+
+
+def test_vectors(tmp_path):
+    events = []
+    for case in VECTORS:
+        event = case["event_without_hash"]
+        assert canonical_json_bytes(event).hex() == case["canonical_bytes_hex"]
+        assert audit_event_hash(dict(event, event_hash="x")) == case["event_hash"]
+        events.append(dict(event, event_hash=case["event_hash"]))
+    path = tmp_path / "audit.ndjson"
+    path.write_text("".join(json.dumps(e) + "\n" for e in events))
+    verifier = AuditEventVerifier()
+    assert list(verifier.verify_ndjson(path)) == []
+    assert list(verifier.verify(events)) == []
+    assert verifier.summary == {
+        "total": 2 * len(events),
+        "ok": 2 * len(events),
+        "hash_mismatch": 0,
+        "missing_hash": 0,
+        "invalid_event": 0,
+    }
+
+
+def test_reports_only_mismatches_with_running_totals(tmp_path):
+    events = [_hashed(dict(case["event_without_hash"], request_id=f"req-{i}")) for i, case in enumerate(VECTORS * 3)]
+    events[2]["outcome"] = "success" if events[2]["outcome"] != "success" else "denied"
+    del events[4]["event_hash"]
+    path = tmp_path / "audit.ndjson"
+    lines = [json.dumps(e) for e in events]
+    lines.insert(6, "")
+    lines.insert(7, "[1, 2]")
+    # The last line has no trailing newline.
+    path.write_text("\n".join(lines))
+
+    verifier = AuditEventVerifier(block_size=256)
+    mismatches = list(verifier.verify_ndjson(path))
+    assert [(m["index"], m["reason"]) for m in mismatches] == [(2, "HASH_MISMATCH"), (4, "MISSING_HASH"), (6, "INVALID_EVENT")]
+    assert mismatches[0]["computed"] == audit_event_hash(events[2]) != mismatches[0]["event_hash"]
+    assert mismatches[1]["event_hash"] is None and mismatches[1]["computed"] == audit_event_hash(events[4])
+    assert verifier.summary == {
+        "total": len(events) + 1,
+        "ok": len(events) - 2,
+        "hash_mismatch": 1,
+        "missing_hash": 1,
+        "invalid_event": 1,
+    }
+
+
+def _tricky_events(count):
+    """Events mixing the C-encoder fast path with floats, escapes and astral keys."""
+    rng = random.Random(25)
+    base = VECTORS[0]["event_without_hash"]
+    values = [
+        "plain",
+        "café €",
+        "line\nbreak \"quoted\" \\ back\\u-slash",
+        "\U0001f600 astral",
+        "\u0007 control",
+        1.5,
+        1e21,
+        -0.0,
+        2**70,
+        True,
+        None,
+        [1, "two", {"b": 1, "a": 2}],
+    ]
+    keys = ["z", "a", "ﬁ", "\U0001f600", "é", "A"]
+    events = []
+    for i in range(count):
+        meta = {rng.choice(keys) + str(k): rng.choice(values) for k in range(rng.randrange(4))}
+        event = _hashed(dict(copy.deepcopy(base), request_id=f"req-{i}", meta=meta))
+        if rng.random() < 0.2:
+            event["meta"]["tampered"] = 1
+        events.append(event)
+    return events
+
+
+@pytest.mark.parametrize("ensure_ascii", [False, True])
+def test_fast_path_agrees_with_calculate_digest(tmp_path, ensure_ascii):
+    events = _tricky_events(400)
+    path = tmp_path / "audit.ndjson"
+    with open(path, "w", encoding="utf-8") as f:
+        for event in events:
+            f.write(json.dumps(event, ensure_ascii=ensure_ascii) + "\n")
+        f.write('{"event_hash": "x", "meta": NaN}\n')
+    expected = _expected(events) + [{"index": len(events), "reason": "INVALID_EVENT", "event_hash": "x", "computed": None}]
+    assert len(expected) > 50
+    assert list(AuditEventVerifier(block_size=4096).verify_ndjson(path)) == expected
+    assert list(AuditEventVerifier(block_size=4096, workers=2).verify_ndjson(path)) == expected
+
+
+def test_event_stream_serial_and_parallel():
+    events = _tricky_events(300) + [{"meta": float("nan"), "event_hash": "x"}, "not an event"]
+    expected = _expected(events)
+    assert list(verify_audit_events(events, chunk_size=64)) == expected
+    verifier = AuditEventVerifier(chunk_size=64, workers=2)
+    assert list(verifier.verify(events)) == expected
+    assert verifier.summary["total"] == len(events)
+    assert verifier.summary["ok"] == len(events) - len(expected)
+
+
+def test_rejects_bad_arguments():
+    with pytest.raises(ValueError):
+        AuditEventVerifier(chunk_size=0)
+    with pytest.raises(ValueError):
+        AuditEventVerifier(block_size=0)
+    with pytest.raises(ValueError):
+        AuditEventVerifier(workers=-1)
@@ -0,0 +1,218 @@
+"""Strictness and parity tests for the base64url codec."""
+
+import base64
+import itertools
+import mmap
+import os
+
+import pytest
+
+from talos_contracts import (
+    Base64UrlDecoder,
+    Base64UrlEncoder,
+    Base64UrlError,
+    base64url_decode,
+    base64url_decode_into,
+    base64url_decode_many,
+    base64url_encode,
+    base64url_encode_many,
+)
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+
+
+def _stdlib_encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 3, 4, 5, 16, 31, 32, 33, 1024, 4099, 100_001])
+def test_roundtrip_matches_stdlib(size):
+    data = os.urandom(size)
+    encoded = base64url_encode(data)
+    assert encoded == _stdlib_encode(data)
+    assert base64url_decode(encoded) == data
+
+
+def test_encode_accepts_bytes_like():
+    assert base64url_encode(bytearray(b"\xfb\xff")) == "-_8"
+    assert base64url_encode(memoryview(b"\xfb\xff")) == "-_8"
+
+
+@pytest.mark.parametrize(
+    "value, message",
+    [
+        ("AQID=", "Padding is not allowed"),
+        ("A+B/", "Non-base64url characters present"),
+        ("Zm9v ", "Non-base64url characters present"),
+        ("Zm9é", "Non-base64url characters present"),
+        ("A", "Invalid base64url length"),
+        ("AAAAA", "Invalid base64url length"),
+        ("Zh", "Non-canonical base64url form"),
+        ("Zm9", "Non-canonical base64url form"),
+    ],
+)
+def test_error_messages(value, message):
+    with pytest.raises(Base64UrlError, match=f"^{message}$"):
+        base64url_decode(value)
+
+
+@pytest.mark.parametrize("width", [2, 3])
+def test_tail_bits_exhaustive(width):
+    """Every 2/3-char tail is accepted iff it re-encodes to itself."""
+    for chars in itertools.product("AQgw", ALPHABET):
+        s = "A" * (width - 2) + "".join(chars)
+        canonical = _stdlib_encode(base64.urlsafe_b64decode(s + "=" * (-len(s) % 4))) == s
+        if canonical:
+            assert base64url_encode(base64url_decode(s)) == s
+        else:
+            with pytest.raises(Base64UrlError):
+                base64url_decode(s)
+
+
+class TestBatch:
+    """base64url_encode_many / base64url_decode_many."""
+
+    @pytest.mark.parametrize("width", [0, 1, 2, 3, 32, 46])
+    def test_uniform_roundtrip(self, width):
+        items = [os.urandom(width) for _ in range(50)]
+        encoded = base64url_encode_many(items)
+        assert encoded == [base64url_encode(b) for b in items]
+        assert base64url_decode_many(encoded) == {"values": items, "errors": []}
+
+    def test_mixed_lengths(self):
+        items = [os.urandom(n) for n in (0, 1, 2, 3, 4, 5, 32, 33, 100)]
+        encoded = base64url_encode_many(items)
+        assert encoded == [base64url_encode(b) for b in items]
+        assert base64url_decode_many(encoded)["values"] == items
+
+    @pytest.mark.parametrize("width", [1, 2, 3, 32])
+    def test_contiguous_buffer(self, width):
+        buffer = os.urandom(width * 20)
+        records = [buffer[i : i + width] for i in range(0, len(buffer), width)]
+        encoded = base64url_encode_many(memoryview(buffer), width=width)
+        assert encoded == [base64url_encode(r) for r in records]
+
+        text = "".join(encoded)
+        result = base64url_decode_many(text.encode("ascii"), width=len(encoded[0]))
+        assert result == {"values": records, "errors": []}
+        assert base64url_decode_many(text, width=len(encoded[0]))["values"] == records
+
+    def test_buffer_width_mismatch(self):
+        with pytest.raises(ValueError):
+            base64url_encode_many(b"abcde", width=2)
+        with pytest.raises(ValueError):
+            base64url_decode_many("AAAAA", width=2)
+
+    def test_errors_are_reported_per_item(self):
+        items = ["AQID", "A", "Zh", "", "Zg", "Zg==", "Zm9v", "A+B/", "Zm9é"]
+        result = base64url_decode_many(items)
+        assert result["errors"] == [1, 2, 5, 7, 8]
+        assert result["values"] == [b"\x01\x02\x03", None, None, b"", b"f", None, b"foo", None, None]
+
+    def test_errors_in_uniform_batch(self):
+        items = ["Zg", "Zh", "Zg", "Z="]
+        result = base64url_decode_many(items)
+        assert result["errors"] == [1, 3]
+        assert result["values"] == [b"f", None, b"f", None]
+
+    def test_matches_single_decode(self):
+        items = ["".join(chars) for chars in itertools.product("Az_-", repeat=3)]
+        items += ["AAAA" + s for s in items]
+        result = base64url_decode_many(items)
+        for i, s in enumerate(items):
+            try:
+                expected = base64url_decode(s)
+            except Base64UrlError:
+                assert i in result["errors"]
+                assert result["values"][i] is None
+            else:
+                assert result["values"][i] == expected
+
+    def test_empty(self):
+        assert base64url_encode_many([]) == []
+        assert base64url_decode_many([]) == {"values": [], "errors": []}
+
+
+class TestBoundedMemory:
+    """base64url_decode_into and the incremental encoder/decoder."""
+
+    # Larger than the internal slice size so chunking is exercised.
+    SIZES = [0, 1, 2, 3, 47, 64 * 1024 * 3 // 4 + 5, 200_001]
+
+    @pytest.mark.parametrize("size", SIZES)
+    def test_decode_into(self, size):
+        data = os.urandom(size)
+        text = base64url_encode(data)
+        out = bytearray(size + 7)
+        assert base64url_decode_into(text, out) == size
+        assert out[:size] == data
+        assert base64url_decode_into(text.encode("ascii"), memoryview(out)[:size]) == size
+        assert out[:size] == data
+
+    def test_decode_into_mmap(self, tmp_path):
+        data = os.urandom(100_000)
+        path = tmp_path / "payload.b64u"
+        path.write_text(base64url_encode(data))
+        with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            out = bytearray(len(data))
+            assert base64url_decode_into(m, out) == len(data)
+        assert out == data
+
+    def test_decode_into_small_buffer(self):
+        with pytest.raises(ValueError, match="too small"):
+            base64url_decode_into("AQID", bytearray(2))
+
+    @pytest.mark.parametrize(
+        "value, message",
+        [
+            ("AQID=", "Padding is not allowed"),
+            ("A+B/", "Non-base64url characters present"),
+            ("AAA+A", "Non-base64url characters present"),
+            ("Zm9é", "Non-base64url characters present"),
+            ("A", "Invalid base64url length"),
+            ("Zh", "Non-canonical base64url form"),
+        ],
+    )
+    def test_decode_into_errors(self, value, message):
+        with pytest.raises(Base64UrlError, match=f"^{message}$"):
+            base64url_decode_into(value, bytearray(16))
+
+    @pytest.mark.parametrize("step", [1, 2, 3, 4, 5, 7, 1000])
+    def test_streaming_roundtrip(self, step):
+        data = os.urandom(4099)
+        encoder = Base64UrlEncoder()
+        text = "".join(encoder.update(data[i : i + step]) for i in range(0, len(data), step))
+        text += encoder.finalize()
+        assert text == base64url_encode(data)
+
+        decoder = Base64UrlDecoder()
+        out = b"".join(decoder.update(text[i : i + step]) for i in range(0, len(text), step))
+        out += decoder.finalize()
+        assert out == data
+
+    @pytest.mark.parametrize(
+        "chunks, message",
+        [
+            (["Zm", "9v="], "Padding is not allowed"),
+            (["Zm", "+v"], "Non-base64url characters present"),
+            (["Zm9v", "A"], "Invalid base64url length"),
+            (["Z", "h"], "Non-canonical base64url form"),
+            (["Zm", "9"], "Non-canonical base64url form"),
+        ],
+    )
+    def test_streaming_strictness_across_chunks(self, chunks, message):
+        decoder = Base64UrlDecoder()
+        with pytest.raises(Base64UrlError, match=f"^{message}$"):
+            for chunk in chunks:
+                decoder.update(chunk)
+            decoder.finalize()
+
+    def test_finalized_objects_reject_use(self):
+        encoder = Base64UrlEncoder()
+        encoder.finalize()
+        with pytest.raises(ValueError):
+            encoder.update(b"x")
+        decoder = Base64UrlDecoder()
+        decoder.finalize()
+        with pytest.raises(ValueError):
+            decoder.update("AA")
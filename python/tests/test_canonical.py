@@ -0,0 +1,336 @@
+"""RFC 8785 canonical JSON encoder tests."""
+
+import hashlib
+import importlib.util
+import io
+import json
+import math
+import struct
+from collections import OrderedDict
+from enum import Enum, IntEnum
+from pathlib import Path
+
+import pytest
+
+from talos_contracts import (
+    FrozenDict,
+    FrozenList,
+    calculate_digest,
+    calculate_digest_streaming,
+    canonical_json_bytes,
+    canonical_json_write,
+    digest_many,
+    freeze_json,
+)
+from talos_contracts.domain.logic.canonical import strip_nulls
+
+ROOT = Path(__file__).resolve().parents[2]
+V = ROOT / "test_vectors"
+
+# RFC 8785 appendix B: IEEE 754 bit patterns and their ES6 serialization.
+RFC8785_NUMBERS = [
+    ("0000000000000000", "0"),
+    ("8000000000000000", "0"),
+    ("0000000000000001", "5e-324"),
+    ("8000000000000001", "-5e-324"),
+    ("7fefffffffffffff", "1.7976931348623157e+308"),
+    ("ffefffffffffffff", "-1.7976931348623157e+308"),
+    ("4340000000000000", "9007199254740992"),
+    ("c340000000000000", "-9007199254740992"),
+    ("4430000000000000", "295147905179352830000"),
+    ("44b52d02c7e14af5", "9.999999999999997e+22"),
+    ("44b52d02c7e14af6", "1e+23"),
+    ("44b52d02c7e14af7", "1.0000000000000001e+23"),
+    ("444b1ae4d6e2ef4e", "999999999999999700000"),
+    ("444b1ae4d6e2ef4f", "999999999999999900000"),
+    ("444b1ae4d6e2ef50", "1e+21"),
+    ("3eb0c6f7a0b5ed8c", "9.999999999999997e-7"),
+    ("3eb0c6f7a0b5ed8d", "0.000001"),
+    ("41b3de4355555553", "333333333.3333332"),
+    ("41b3de4355555554", "333333333.33333325"),
+    ("41b3de4355555555", "333333333.3333333"),
+    ("41b3de4355555556", "333333333.3333334"),
+    ("41b3de4355555557", "333333333.33333343"),
+    ("becbf647612f3696", "-0.0000033333333333333333"),
+    ("43143ff3c1cb0959", "1424953923781206.2"),
+]
+
+
+def test_sdk_canonical_json_vectors():
+    data = json.loads((V / "sdk" / "canonical_json.json").read_text())
+    for case in data["vectors"]:
+        inputs, expected = case["inputs"], case["expected"]
+        if "canonical_number" in expected:
+            assert canonical_json_bytes(inputs["value"]).decode() == expected["canonical_number"]
+            continue
+        (value,) = inputs.values()
+        if isinstance(value, str):
+            value = json.loads(value)
+        assert canonical_json_bytes(value).decode() == expected["canonical"], case["test_id"]
+
+
+def test_crypto_canonical_hash_vectors():
+    data = json.loads((V / "crypto" / "canonical_hash.json").read_text())
+    for case in data["tests"]:
+        assert canonical_json_bytes(case["input"]).decode() == case["expected_json"], case["name"]
+
+
+@pytest.mark.parametrize("bits, expected", RFC8785_NUMBERS)
+def test_rfc8785_number_serialization(bits, expected):
+    value = struct.unpack(">d", bytes.fromhex(bits))[0]
+    assert canonical_json_bytes(value) == expected.encode()
+    assert float(expected) == value
+
+
+def test_integers_and_integral_floats():
+    assert canonical_json_bytes([1.0, -2.0, 1e20, 1e21, 0.5, 10, 2**64]) == b"[1,-2,100000000000000000000,1e+21,0.5,10,18446744073709551616]"
+
+
+def test_keys_sorted_by_utf16_code_units():
+    # RFC 8785 section 3.2.3: U+1F600 is a surrogate pair and sorts before U+FB33.
+    data = {"€": "Euro Sign", "\r": "Carriage Return", "דּ": "Hebrew Letter Dalet With Dagesh",
+            "1": "One", "\U0001f600": "Emoji: Grinning Face", "\u0080": "Control", "ö": "Latin Small Letter O With Diaeresis"}
+    keys = list(json.loads(canonical_json_bytes(data)))
+    assert keys == ["\r", "1", "\u0080", "ö", "€", "\U0001f600", "דּ"]
+
+
+def test_string_escaping():
+    text = "\"\\/\b\f\n\r\t\x00\x1f\x7f é"
+    assert canonical_json_bytes(text) == '"\\"\\\\/\\b\\f\\n\\r\\t\\u0000\\u001f\x7f é"'.encode()
+
+
+def test_nested_document_round_trips_to_sorted_json():
+    doc = {"b": [1, {"z": None, "a": [True, False]}, "x"], "a": {"c": {}, "b": []}, "c": (1, 2)}
+    expected = json.dumps(doc, sort_keys=True, separators=(",", ":")).encode()
+    assert canonical_json_bytes(doc) == expected
+
+
+def test_subclasses_encode_as_their_base_type():
+    class Color(str, Enum):
+        RED = "red"
+
+    class Level(IntEnum):
+        HIGH = 3
+
+    doc = OrderedDict([("b", Level.HIGH), ("a", Color.RED)])
+    assert canonical_json_bytes(doc) == b'{"a":"red","b":3}'
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf, "\ud800"])
+def test_rejects_values_outside_i_json(value):
+    with pytest.raises(ValueError):
+        canonical_json_bytes({"v": [value]})
+
+
+@pytest.mark.parametrize("value", [{1: "a"}, {"a": 1, 2: "b"}, {"s": {1, 2}}, b"bytes", object()])
+def test_rejects_non_json_types(value):
+    with pytest.raises(TypeError):
+        canonical_json_bytes(value)
+
+
+def test_root_jcs_helper_matches():
+    # The root contracts package carries its own copy of the encoder.
+    spec = importlib.util.spec_from_file_location("root_jcs", ROOT / "jcs.py")
+    jcs = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(jcs)
+    values = [struct.unpack(">d", bytes.fromhex(bits))[0] for bits, _ in RFC8785_NUMBERS]
+    values += [case["input"] for case in json.loads((V / "crypto" / "canonical_hash.json").read_text())["tests"]]
+    values.append({"€": 1, "\U0001f600": [2.5, None, True], "דּ": "\x00\u2028", "1": {"b": 1e-7, "a": 2**70}})
+    for value in values:
+        assert jcs.canonicalize(value) == canonical_json_bytes(value)
+    for bad in (math.nan, "\ud800"):
+        with pytest.raises(ValueError):
+            jcs.canonicalize([bad])
+    with pytest.raises(TypeError):
+        jcs.canonicalize({1: "a"})
+
+
+class TestCanonicalJsonWrite:
+    """Streaming output must be the one-shot bytes, split into chunks."""
+
+    def _large(self):
+        return {"rows": [{"id": i, "name": f"row-{i}", "score": i / 7, "tags": ["a", "é"]} for i in range(20_000)]}
+
+    def test_chunks_concatenate_to_canonical_bytes(self):
+        doc = self._large()
+        chunks: list[bytes] = []
+        written = canonical_json_write(doc, chunks.append)
+        expected = canonical_json_bytes(doc)
+        assert len(chunks) > 1
+        assert b"".join(chunks) == expected
+        assert written == len(expected)
+        assert max(map(len, chunks)) < len(expected) // 4
+
+    def test_file_and_hash_sinks(self):
+        doc = self._large()
+        buf = io.BytesIO()
+        canonical_json_write(doc, buf.write)
+        assert buf.getvalue() == canonical_json_bytes(doc)
+        hasher = hashlib.sha256()
+        canonical_json_write(doc, hasher.update)
+        assert hasher.hexdigest() == calculate_digest_streaming(doc) == calculate_digest(doc)
+
+    @pytest.mark.parametrize("value", [None, 1.5, "x", [], {}, [[[]]]])
+    def test_scalars_and_empty_containers(self, value):
+        chunks: list[bytes] = []
+        canonical_json_write(value, chunks.append)
+        assert b"".join(chunks) == canonical_json_bytes(value)
+
+    def test_exclude_fields(self):
+        doc = {"a": 1, "_digest": "x", "sig": "y"}
+        assert calculate_digest_streaming(doc, ["sig", "_digest"]) == calculate_digest({"a": 1}, [])
+
+
+class TestFrozenCache:
+    """Frozen subtrees reuse their cached encoding without changing any digest."""
+
+    @pytest.fixture
+    def action_request(self):
+        golden = json.loads((V / "tga" / "golden_trace_chain.json").read_text())
+        return golden["action_request"]
+
+    def test_frozen_digest_unchanged(self, action_request):
+        frozen = freeze_json(action_request)
+        assert calculate_digest(frozen) == calculate_digest_streaming(frozen) == action_request["_digest"]
+        partly = dict(action_request, proposal=freeze_json(action_request["proposal"]))
+        assert calculate_digest(partly) == action_request["_digest"]
+        # A second pass hits the cache.
+        assert calculate_digest(frozen) == action_request["_digest"]
+
+    def test_edit_matches_plain_edit_and_shares_siblings(self, action_request):
+        frozen = freeze_json(action_request)
+        canonical_json_bytes(frozen)
+        edited = frozen.set_in(["proposal", "args", "name"], "fix/other").set_in(["resources", 0, "id"], "x/y")
+        plain = json.loads(json.dumps(action_request))
+        plain["proposal"]["args"]["name"] = "fix/other"
+        plain["resources"][0]["id"] = "x/y"
+        assert canonical_json_bytes(edited) == canonical_json_bytes(plain)
+        assert edited.thaw() == plain
+        assert frozen.thaw() == action_request
+        assert edited["proposal"]["tool_name"] is frozen["proposal"]["tool_name"]
+        assert frozen.set("ts", "t")["resources"] is frozen["resources"]
+
+    def test_mapping_and_sequence_behaviour(self):
+        frozen = freeze_json({"b": [1, {"c": None}], "a": 2.0})
+        assert frozen == {"b": [1, {"c": None}], "a": 2.0}
+        assert isinstance(frozen["b"], FrozenList) and isinstance(frozen["b"][1], FrozenDict)
+        assert freeze_json(frozen) is frozen
+        assert list(frozen["b"][:1]) == [1]
+        assert canonical_json_bytes(frozen) == b'{"a":2,"b":[1,{"c":null}]}'
+        assert canonical_json_bytes(frozen.delete("b")) == b'{"a":2}'
+        with pytest.raises(TypeError):
+            frozen["a"] = 3  # type: ignore[index]
+
+    def test_set_in_errors(self):
+        frozen = freeze_json({"a": {"b": 1}, "l": [1]})
+        with pytest.raises(ValueError):
+            frozen.set_in([], 1)
+        with pytest.raises(TypeError):
+            frozen.set_in(["a", "b", "c"], 1)
+        with pytest.raises(KeyError):
+            frozen.set_in(["x", "y"], 1)
+        with pytest.raises(IndexError):
+            frozen.set_in(["l", 5], 1)
+        with pytest.raises(TypeError):
+            frozen.set_in([0], 1)
+        with pytest.raises(TypeError):
+            frozen.set_in(["l", "0"], 1)
+
+
+class TestFusedExclusionAndNulls:
+    """exclude_fields/drop_nulls must equal copying, deleting and strip_nulls by hand."""
+
+    DOC = {
+        "_digest": "x",
+        "sig": None,
+        "a": None,
+        "b": {"c": None, "d": [None, {"e": None, "f": 1}], "g": {"h": None}},
+        "i": [],
+        "j": 0,
+    }
+
+    def _by_hand(self, doc, exclude, drop_nulls):
+        clean = doc.copy()
+        for field in exclude:
+            clean.pop(field, None)
+        return canonical_json_bytes(strip_nulls(clean) if drop_nulls else clean)
+
+    @pytest.mark.parametrize("exclude", [[], ["_digest"], ["_digest", "sig", "missing"], {"b"}])
+    @pytest.mark.parametrize("drop_nulls", [False, True])
+    def test_matches_compose_by_hand(self, exclude, drop_nulls):
+        expected = self._by_hand(self.DOC, exclude, drop_nulls)
+        assert canonical_json_bytes(self.DOC, exclude_fields=exclude, drop_nulls=drop_nulls) == expected
+        chunks: list[bytes] = []
+        canonical_json_write(self.DOC, chunks.append, exclude_fields=exclude, drop_nulls=drop_nulls)
+        assert b"".join(chunks) == expected
+        for frozen in (False, True):
+            doc = freeze_json(self.DOC) if frozen else self.DOC
+            assert canonical_json_bytes(doc, exclude_fields=exclude, drop_nulls=drop_nulls) == expected
+
+    def test_drop_nulls_output(self):
+        assert canonical_json_bytes(self.DOC, exclude_fields=["_digest"], drop_nulls=True) == (
+            b'{"b":{"d":[null,{"f":1}],"g":{}},"i":[],"j":0}'
+        )
+
+    def test_digests_match_and_input_untouched(self):
+        golden = json.loads((V / "tga" / "golden_trace_chain.json").read_text())
+        before = json.dumps(golden, sort_keys=True)
+        for obj in golden.values():
+            with_nulls = dict(obj, extra=None, nested={"k": None, "v": [None]})
+            expected = calculate_digest(strip_nulls(with_nulls))
+            assert calculate_digest(with_nulls, drop_nulls=True) == expected
+            assert calculate_digest_streaming(with_nulls, drop_nulls=True) == expected
+            assert calculate_digest(obj, drop_nulls=True) == obj["_digest"]
+        assert json.dumps(golden, sort_keys=True) == before
+
+
+class TestDigestMany:
+    """digest_many must equal calculate_digest per record, in input order."""
+
+    @pytest.fixture
+    def audit_events(self):
+        tests = json.loads((V / "audit_event_vectors.json").read_text())["tests"]
+        events = []
+        for i in range(500):
+            event = dict(tests[i % len(tests)]["event_without_hash"], request_id=f"req-{i}", error=None)
+            event["event_hash"] = "stale"
+            events.append(event)
+        return events
+
+    @pytest.mark.parametrize(
+        "workers,use_threads,chunk_size", [(0, False, 1024), (0, False, 7), (2, False, 64), (3, True, 50)]
+    )
+    def test_matches_serial_calculate_digest(self, audit_events, workers, use_threads, chunk_size):
+        for drop_nulls in (False, True):
+            expected = [calculate_digest(e, ["event_hash"], drop_nulls=drop_nulls) for e in audit_events]
+            result = digest_many(
+                iter(audit_events),
+                ["event_hash"],
+                drop_nulls=drop_nulls,
+                workers=workers,
+                use_threads=use_threads,
+                chunk_size=chunk_size,
+            )
+            assert list(result) == expected
+
+    def test_audit_event_hash_vectors(self):
+        tests = json.loads((V / "audit_event_vectors.json").read_text())["tests"]
+        events = [dict(tc["event_without_hash"], event_hash=tc["event_hash"]) for tc in tests]
+        assert list(digest_many(events, ["event_hash"])) == [tc["event_hash"] for tc in tests]
+
+    def test_default_exclusion_and_unmarshallable_chunks(self):
+        golden = json.loads((V / "tga" / "golden_trace_chain.json").read_text())
+        docs = list(golden.values())
+        frozen = [freeze_json(d) for d in docs]
+        expected = [d["_digest"] for d in docs]
+        assert list(digest_many(docs, workers=2, chunk_size=1)) == expected
+        assert list(digest_many(frozen, workers=2, chunk_size=2)) == expected
+
+    def test_errors_propagate(self):
+        with pytest.raises(ValueError):
+            list(digest_many([{"a": 1}, {"b": float("nan")}], workers=2))
+        with pytest.raises(ValueError):
+            digest_many([], workers=-1)
+        with pytest.raises(ValueError):
+            digest_many([], chunk_size=0)
+        assert list(digest_many([], workers=2)) == []
@@ -0,0 +1,110 @@
+"""is_canonical_json: single-pass canonical-form verification."""
+
+import json
+import random
+import time
+from pathlib import Path
+
+import pytest
+
+from talos_contracts import calculate_digest, canonical_json_bytes, is_canonical_json
+
+ROOT = Path(__file__).resolve().parents[2]
+VECTORS = json.loads((ROOT / "test_vectors" / "sdk" / "canonical_json_verify.json").read_text())
+
+
+def _input(case):
+    return bytes.fromhex(case["input_hex"]) if "input_hex" in case else case["input"].encode("utf-8")
+
+
+@pytest.mark.parametrize("case", VECTORS["valid"], ids=lambda c: c["test_id"])
+def test_valid_vectors(case):
+    data = _input(case)
+    assert is_canonical_json(data, digest=True) == {"ok": True, "offset": None, "reason": None, "digest": case["sha256_hex"]}
+    assert is_canonical_json(data)["digest"] is None
+    assert canonical_json_bytes(json.loads(data)) == data
+
+
+@pytest.mark.parametrize("case", VECTORS["invalid"], ids=lambda c: c["test_id"])
+def test_invalid_vectors(case):
+    result = is_canonical_json(_input(case), digest=True)
+    assert result == {"ok": False, "offset": case["offset"], "reason": case["reason"], "digest": None}
+
+
+def test_every_rejection_class_has_a_vector():
+    reasons = {c["reason"] for c in VECTORS["invalid"]}
+    assert reasons == {"INVALID_UTF8", "INVALID_JSON", "WHITESPACE", "KEY_ORDER", "DUPLICATE_KEY", "NUMBER_FORMAT", "STRING_ESCAPE"}
+
+
+def test_agrees_with_encoder_on_golden_and_random_documents():
+    golden = json.loads((ROOT / "test_vectors" / "tga" / "golden_trace_chain.json").read_text())
+    for obj in golden.values():
+        body = dict(obj)
+        del body["_digest"]
+        data = canonical_json_bytes(body)
+        assert is_canonical_json(bytearray(data), digest=True)["digest"] == obj["_digest"] == calculate_digest(obj)
+        assert not is_canonical_json(json.dumps(body, indent=1).encode())["ok"]
+
+    rng = random.Random(5)
+    alphabet = ["a", "b", "é", "€", "\U0001f600", "דּ", "\n", "\x01", '"', "\\", "/"]
+
+    def value(depth):
+        kind = rng.randrange(7 if depth < 4 else 4)
+        if kind == 0:
+            return rng.choice([None, True, False])
+        if kind == 1:
+            return rng.choice([0, -7, 2**70, 0.1, -1.5e-9, 1e21, 123.456, 5e-324])
+        if kind in (2, 3):
+            return "".join(rng.choices(alphabet, k=rng.randrange(5)))
+        if kind == 4:
+            return [value(depth + 1) for _ in range(rng.randrange(4))]
+        return {"".join(rng.choices(alphabet, k=rng.randrange(1, 4))): value(depth + 1) for _ in range(rng.randrange(4))}
+
+    for _ in range(300):
+        doc = value(0)
+        data = canonical_json_bytes(doc)
+        assert is_canonical_json(data)["ok"], data
+        # Python's own serialization is canonical exactly when it matches.
+        other = json.dumps(doc, ensure_ascii=False).encode()
+        assert is_canonical_json(other)["ok"] == (other == data), other
+
+
+def test_deep_nesting_has_no_recursion_limit():
+    data = b"[" * 50_000 + b"]" * 50_000
+    assert is_canonical_json(data)["ok"]
+    assert is_canonical_json(data + b" ")["offset"] == 100_000
+
+
+@pytest.mark.parametrize(
+    "data, offset, reason",
+    [
+        (b'"' + b"a" * 5000, 5001, "INVALID_JSON"),
+        (b'{"k":"' + b"a" * 5000 + b'\\/"}', 5006, "STRING_ESCAPE"),
+        (b'["' + b"x" * 5000 + b'\x01"]', 5002, "INVALID_JSON"),
+    ],
+)
+def test_rejected_long_strings_take_linear_time(data, offset, reason):
+    # A string pattern with nested repetition backtracks exponentially on these.
+    started = time.perf_counter()
+    result = is_canonical_json(data)
+    assert time.perf_counter() - started < 0.5
+    assert (result["offset"], result["reason"]) == (offset, reason)
+
+
+def test_fast_path_agrees_with_exact_scanner_on_mutations():
+    from talos_contracts.infrastructure.canonical_verify import _fast_accept, _scan
+
+    rng = random.Random(11)
+    base = canonical_json_bytes(
+        {"a": [1, -0.5, 1e21, "x\\\"y\né"], "b": {"c": None, "d": True}, "e": -3, "f": "\\u"}
+    ).decode()
+    pieces = [" ", "-0", "0", ".0", "E5", "\\", '"', "\\/", "\\u0041", ",", ":", "{", "}", "[", "]", "\t", "a", "é"]
+    for _ in range(3000):
+        text = base
+        for _ in range(rng.randrange(1, 3)):
+            i = rng.randrange(len(text) + 1)
+            if rng.random() < 0.5:
+                text = text[:i] + rng.choice(pieces) + text[i:]
+            else:
+                text = text[:i] + text[i + rng.randrange(1, 3):]
+        assert _fast_accept(text) == (_scan(text) is None), text
@@ -0,0 +1,224 @@
+"""Cursor helper tests beyond the shared golden vectors."""
+
+import json
+import random
+from functools import cmp_to_key
+from pathlib import Path
+
+import pytest
+
+from talos_contracts import (
+    CursorCodec,
+    CursorStreamValidator,
+    assert_cursor_invariant,
+    base64url_decode,
+    base64url_encode,
+    compare_cursor,
+    cursor_sort_key,
+    decode_cursor,
+    derive_cursor,
+    uuid7_batch,
+    validate_cursor_stream,
+)
+
+GOLDEN = Path(__file__).parent / "vectors" / "golden.json"
+
+
+@pytest.fixture
+def golden():
+    return json.loads(GOLDEN.read_text())["cursor"]
+
+
+def _cursors(count: int, seed: int = 5) -> list[str]:
+    rng = random.Random(seed)
+    ids = uuid7_batch(count)
+    return [derive_cursor(rng.randrange(1_700_000_000, 1_700_000_050), eid) for eid in ids]
+
+
+class TestCursorCodec:
+    def test_matches_module_functions(self, golden):
+        codec = CursorCodec()
+        for tc in golden["decode"]:
+            assert codec.decode(tc["input"]) == decode_cursor(tc["input"])
+        for tc in golden["compare"]:
+            assert codec.compare(tc["a"], tc["b"]) == tc["expected"]
+        for tc in golden["derive"]:
+            assert codec.derive(tc["timestamp"], tc["event_id"]) == tc["expected"]
+
+    def test_sort_key_matches_compare_cursor(self):
+        cursors = _cursors(500)
+        codec = CursorCodec()
+        expected = sorted(cursors, key=cmp_to_key(compare_cursor))
+        assert sorted(cursors, key=codec.sort_key) == expected
+        assert sorted(cursors, key=cursor_sort_key) == expected
+        assert sorted(cursors, key=cmp_to_key(codec.compare)) == expected
+
+    def test_hit_miss_counters_and_eviction(self):
+        cursors = _cursors(10)
+        codec = CursorCodec(maxsize=4)
+        for c in cursors[:4]:
+            codec.sort_key(c)
+        for c in cursors[:4]:
+            codec.sort_key(c)
+        assert (codec.hits, codec.misses, codec.size) == (4, 4, 4)
+
+        for c in cursors[4:]:
+            codec.sort_key(c)
+        assert codec.size == 4
+        codec.sort_key(cursors[0])  # evicted
+        assert codec.misses == 11
+
+        codec.cache_clear()
+        assert (codec.hits, codec.misses, codec.size) == (0, 0, 0)
+
+    def test_invalid_cursors_raise_and_are_not_cached(self):
+        codec = CursorCodec()
+        for bad in ("", "not*base64", derive_cursor(1, "not-a-uuid")):
+            with pytest.raises(ValueError):
+                codec.decode(bad)
+        assert codec.size == 0
+
+    def test_rejects_bad_maxsize(self):
+        with pytest.raises(ValueError):
+            CursorCodec(maxsize=0)
+
+
+class TestCursorV2:
+    """Compact binary cursor format."""
+
+    def test_roundtrip_and_length(self):
+        for eid in uuid7_batch(50):
+            for ts in (0, 1_700_000_000, (1 << 64) - 1):
+                cursor = derive_cursor(ts, eid, version=2)
+                assert len(cursor) == 34
+                assert decode_cursor(cursor) == {"timestamp": ts, "event_id": eid}
+
+    def test_frame_order_matches_compare_cursor(self):
+        rng = random.Random(13)
+        keys = [(rng.choice([0, 255, 256, 1_700_000_000, 1 << 40]), eid) for eid in uuid7_batch(300)]
+        v1 = [derive_cursor(t, e) for t, e in keys]
+        v2 = [derive_cursor(t, e, version=2) for t, e in keys]
+        by_v1 = sorted(range(len(keys)), key=cmp_to_key(lambda i, j: compare_cursor(v1[i], v1[j])))
+        assert sorted(range(len(keys)), key=lambda i: base64url_decode(v2[i])) == by_v1
+        assert sorted(range(len(keys)), key=cmp_to_key(lambda i, j: compare_cursor(v2[i], v2[j]))) == by_v1
+        # Mixed formats compare by decoded value.
+        assert all(compare_cursor(v1[i], v2[i]) == 0 for i in range(len(keys)))
+
+    def test_derive_rejects_unrepresentable_values(self):
+        with pytest.raises(ValueError):
+            derive_cursor(1 << 64, "0190a5e0-7c3a-7000-8000-000000000001", version=2)
+        with pytest.raises(ValueError):
+            derive_cursor(1, "0190A5E0-7C3A-7000-8000-000000000001", version=2)
+        with pytest.raises(ValueError):
+            derive_cursor(1, "0190a5e0-7c3a-7000-8000-000000000001", version=3)
+
+    def test_invariant_uses_the_cursor_format(self):
+        eid = "0190a5e0-7c3a-7000-8000-000000000001"
+        event = {"timestamp": 5, "event_id": eid, "cursor": derive_cursor(5, eid, version=2)}
+        assert assert_cursor_invariant(event) == {"ok": True, "derived": event["cursor"]}
+
+        moved = dict(event, timestamp=6)
+        result = assert_cursor_invariant(moved)
+        assert result == {"ok": False, "derived": derive_cursor(6, eid, version=2), "reason": "CURSOR_MISMATCH"}
+
+        upper = dict(event, event_id=eid.upper())
+        assert assert_cursor_invariant(upper)["reason"] == "INVALID_FRAME"
+        assert list(validate_cursor_stream([event, moved, upper])) == [
+            {"index": 1, "reason": "CURSOR_MISMATCH", "derived": derive_cursor(6, eid, version=2)},
+            {"index": 2, "reason": "INVALID_FRAME", "derived": derive_cursor(5, eid.upper())},
+        ]
+
+    def test_codec_accepts_both_formats(self):
+        codec = CursorCodec()
+        eid = "0190a5e0-7c3a-7000-8000-000000000001"
+        assert codec.sort_key(derive_cursor(7, eid, version=2)) == codec.sort_key(derive_cursor(7, eid)) == (7, eid)
+        assert codec.derive(7, eid, version=2) == derive_cursor(7, eid, version=2)
+        assert codec.decode(codec.derive(7, eid, version=2)) == {"timestamp": 7, "event_id": eid}
+
+
+def _events(count: int, seed: int = 11) -> list[dict]:
+    """Valid events with a sprinkling of every kind of failure."""
+    rng = random.Random(seed)
+    events = []
+    for eid in uuid7_batch(count):
+        ts = rng.randrange(1_700_000_000, 1_800_000_000)
+        events.append({"timestamp": ts, "event_id": eid, "cursor": derive_cursor(ts, eid)})
+    mutations = [
+        lambda e: e.update(cursor=e["cursor"][:-1] + "A"),
+        lambda e: e.update(event_id=e["event_id"].upper()),
+        lambda e: e.update(timestamp=True),
+        lambda e: e.update(timestamp=-1, cursor=base64url_encode(f"-1:{e['event_id']}".encode())),
+        lambda e: e.update(timestamp=str(e["timestamp"])),
+        lambda e: e.update(event_id=None),
+        lambda e: e.update(cursor=123),
+        lambda e: e.pop("cursor"),
+        lambda e: e.update(event_id="not-a-uuid", cursor=derive_cursor(e["timestamp"], "not-a-uuid")),
+    ]
+    for i in range(0, count, 7):
+        rng.choice(mutations)(events[i])
+    return events
+
+
+def _expected_failures(events: list[dict]) -> list[dict]:
+    failures = []
+    for i, event in enumerate(events):
+        result = assert_cursor_invariant(event)
+        if not result["ok"]:
+            failures.append({"index": i, "reason": result["reason"], "derived": result["derived"]})
+    return failures
+
+
+class TestCursorStream:
+    """CursorStreamValidator / validate_cursor_stream."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 64, 4096])
+    def test_matches_assert_cursor_invariant(self, chunk_size):
+        events = _events(300)
+        expected = _expected_failures(events)
+        assert expected
+        assert list(validate_cursor_stream(events, chunk_size=chunk_size)) == expected
+
+    def test_golden_invariant_vectors(self, golden):
+        events = [tc["event"] for tc in golden["invariant"]]
+        failures = {f["index"]: f for f in validate_cursor_stream(events)}
+        for i, tc in enumerate(golden["invariant"]):
+            if tc["expected"]["ok"]:
+                assert i not in failures
+            else:
+                assert failures[i]["reason"] == tc["expected"]["reason"]
+
+    def test_summary(self):
+        events = _events(200)
+        expected = _expected_failures(events)
+        validator = CursorStreamValidator(chunk_size=32)
+        assert list(validator.validate(events)) == expected
+        summary = validator.summary
+        assert summary["total"] == 200
+        assert summary["ok"] == 200 - len(expected)
+        assert summary["invalid_frame"] == sum(f["reason"] == "INVALID_FRAME" for f in expected)
+        assert summary["cursor_mismatch"] == sum(f["reason"] == "CURSOR_MISMATCH" for f in expected)
+
+    def test_jsonl(self, tmp_path):
+        events = _events(50)
+        path = tmp_path / "events.jsonl"
+        lines = [json.dumps(e) for e in events]
+        lines[3] = "{not json"
+        lines[4] = "[1, 2]"
+        path.write_text("\n".join(lines) + "\n\n")
+
+        expected = _expected_failures(events[:3] + [{}, {}] + events[5:])
+        validator = CursorStreamValidator(chunk_size=8)
+        assert list(validator.validate_jsonl(path)) == expected
+        assert validator.summary["total"] == 50
+
+    def test_process_pool(self):
+        events = _events(500)
+        validator = CursorStreamValidator(chunk_size=50, workers=2)
+        assert list(validator.validate(events)) == _expected_failures(events)
+        assert validator.summary["total"] == 500
+
+    def test_rejects_bad_arguments(self):
+        with pytest.raises(ValueError):
+            CursorStreamValidator(chunk_size=0)
+        with pytest.raises(ValueError):
+            CursorStreamValidator(workers=-1)
@@ -0,0 +1,122 @@
+"""EventBatch parity with ordering_compare and derive_cursor on both back ends."""
+
+import random
+from functools import cmp_to_key
+
+import pytest
+
+from talos_contracts import EventBatch, decode_cursor, derive_cursor, ordering_compare, uuid7_batch
+
+try:
+    import numpy  # noqa: F401
+
+    HAVE_NUMPY = True
+except ImportError:
+    HAVE_NUMPY = False
+
+BACKENDS = [
+    pytest.param(True, id="numpy", marks=pytest.mark.skipif(not HAVE_NUMPY, reason="numpy not installed")),
+    pytest.param(False, id="python"),
+]
+
+# Ids whose complemented halves contain zero bytes, and boundary timestamps.
+EDGE_IDS = [
+    "ffffffff-ffff-7fff-bfff-ffffffffffff",
+    "ffffffff-ffff-7fff-bfff-fffffffffffe",
+    "ffffffff-ffff-7fff-bfff-ff00ffffffff",
+    "00000000-0000-7000-8000-000000000000",
+]
+EDGE_TS = [0, 9, 10, 1_700_000_000, 10**12, (1 << 63) - 1]
+
+
+def _rows(count: int, seed: int = 1) -> tuple[list[int], list[str]]:
+    rng = random.Random(seed)
+    ids = uuid7_batch(count) + EDGE_IDS
+    ts = [rng.choice(EDGE_TS) for _ in ids]
+    ids.append(ids[3])  # duplicate key: order must stay stable
+    ts.append(ts[3])
+    return ts, ids
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+class TestEventBatch:
+    def test_order_matches_ordering_compare(self, use_numpy):
+        ts, ids = _rows(500)
+        batch = EventBatch(ts, ids, use_numpy=use_numpy)
+        assert batch.backend == ("numpy" if use_numpy else "python")
+        events = [{"timestamp": t, "event_id": e, "row": i} for i, (t, e) in enumerate(zip(ts, ids, strict=True))]
+        expected = [e["row"] for e in sorted(events, key=cmp_to_key(ordering_compare))]
+        assert batch.order() == expected
+
+        ordered = batch.sorted()
+        assert ordered.timestamps == [ts[i] for i in expected]
+        assert ordered.event_ids == [ids[i] for i in expected]
+        assert batch.to_events() == [{"timestamp": t, "event_id": e} for t, e in zip(ts, ids, strict=True)]
+
+    def test_derive_cursors_matches_derive_cursor(self, use_numpy):
+        ts, ids = _rows(300, seed=2)
+        batch = EventBatch(ts, ids, use_numpy=use_numpy)
+        assert batch.derive_cursors() == [derive_cursor(t, e) for t, e in zip(ts, ids, strict=True)]
+        uniform = EventBatch([1_700_000_000] * 10, ids[:10], use_numpy=use_numpy)
+        assert uniform.derive_cursors() == [derive_cursor(1_700_000_000, e) for e in ids[:10]]
+
+    def test_seek(self, use_numpy):
+        ts, ids = _rows(400, seed=3)
+        ordered = EventBatch(ts, ids, use_numpy=use_numpy).sorted()
+        cursors = ordered.derive_cursors()
+        rows = [{"timestamp": t, "event_id": e} for t, e in zip(ordered.timestamps, ordered.event_ids, strict=True)]
+        # Cursors of rows in the batch and cursors between rows.
+        probes = cursors[::7] + [derive_cursor(t, e) for t in (0, 10, 1_700_000_000) for e in EDGE_IDS]
+        for probe, pos in zip(probes, ordered.seek_many(probes), strict=True):
+            after = decode_cursor(probe)
+            assert pos == sum(ordering_compare(row, after) <= 0 for row in rows)
+        assert ordered.seek(cursors[0]) == 1
+        assert ordered.seek_many([]) == []
+
+    def test_seek_requires_sorted_batch(self, use_numpy):
+        ts, ids = _rows(10)
+        batch = EventBatch(ts, ids, use_numpy=use_numpy)
+        with pytest.raises(ValueError, match="sorted"):
+            batch.seek(derive_cursor(ts[0], ids[0]))
+
+    @pytest.mark.parametrize(
+        "ts, eid",
+        [
+            (-1, EDGE_IDS[0]),
+            (True, EDGE_IDS[0]),
+            (1.5, EDGE_IDS[0]),
+            (1 << 63, EDGE_IDS[0]),
+            (1, EDGE_IDS[0].upper()),
+            (1, "not-a-uuid"),
+            (1, None),
+        ],
+    )
+    def test_rejects_invalid_rows(self, use_numpy, ts, eid):
+        with pytest.raises(ValueError):
+            EventBatch([0, ts], [EDGE_IDS[1], eid], use_numpy=use_numpy)
+
+    @pytest.mark.skipif(not HAVE_NUMPY, reason="numpy not installed")
+    def test_accepts_numpy_integer_timestamps(self, use_numpy):
+        import numpy as np
+
+        ts, ids = _rows(50, seed=4)
+        batch = EventBatch(np.array(ts, dtype=np.int64), ids, use_numpy=use_numpy)
+        assert batch.timestamps == ts
+        assert all(type(t) is int for t in batch.timestamps)
+        assert batch.derive_cursors() == EventBatch(ts, ids, use_numpy=use_numpy).derive_cursors()
+        with pytest.raises(ValueError):
+            EventBatch(np.array([True, False]), ids[:2], use_numpy=use_numpy)
+
+    def test_empty(self, use_numpy):
+        batch = EventBatch([], [], use_numpy=use_numpy)
+        assert len(batch) == 0
+        assert batch.order() == []
+        assert batch.derive_cursors() == []
+        assert batch.sorted().seek_many([]) == []
+
+
+def test_from_events_and_length_mismatch():
+    events = [{"timestamp": 1, "event_id": e} for e in EDGE_IDS]
+    assert EventBatch.from_events(events).to_events() == events
+    with pytest.raises(ValueError):
+        EventBatch([1, 2], EDGE_IDS[:1])
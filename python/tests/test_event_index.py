@@ -0,0 +1,150 @@
+"""EventIndex pagination tests against sort-and-slice with ordering_compare."""
+
+import random
+from functools import cmp_to_key
+
+import pytest
+
+from talos_contracts import EventIndex, derive_cursor, ordering_compare, uuid7_batch
+
+
+def _events(count: int, seed: int = 3, spread: int = 20) -> list[dict]:
+    """Events with many shared timestamps, so event_id tie-breaks matter."""
+    rng = random.Random(seed)
+    ids = uuid7_batch(count)
+    rng.shuffle(ids)
+    return [{"timestamp": rng.randrange(spread), "event_id": eid, "payload": i} for i, eid in enumerate(ids)]
+
+
+def _cursor(event: dict) -> str:
+    return derive_cursor(event["timestamp"], event["event_id"])
+
+
+def _reference_page(events: list[dict], after: str | None, limit: int) -> list[dict]:
+    ordered = sorted(events, key=cmp_to_key(ordering_compare))
+    start = 0
+    if after is not None:
+        start = [_cursor(e) for e in ordered].index(after) + 1
+    return ordered[start : start + limit]
+
+
+@pytest.mark.parametrize("limit", [1, 7, 50, 1000])
+def test_pages_match_sort_and_slice(limit):
+    events = _events(300)
+    index = EventIndex(events)
+    ordered = sorted(events, key=cmp_to_key(ordering_compare))
+    assert list(index) == ordered
+
+    seen = []
+    after = None
+    while True:
+        page = index.page(after=after, limit=limit)
+        assert page["events"] == _reference_page(events, after, limit)
+        seen.extend(page["events"])
+        if page["next_cursor"] is None:
+            break
+        assert page["next_cursor"] == _cursor(page["events"][-1])
+        after = page["next_cursor"]
+    assert seen == ordered
+
+
+def test_seek_from_cursor_not_in_index():
+    events = _events(100)
+    index = EventIndex(events)
+    ordered = list(index)
+    ts = ordered[40]["timestamp"]
+    # A cursor between existing keys lands on the next smaller event.
+    probe_id = "ffffffff-ffff-7fff-bfff-ffffffffffff"
+    probe = derive_cursor(ts, probe_id)
+    expected = [e for e in ordered if (e["timestamp"], e["event_id"]) < (ts, probe_id)]
+    assert index.page(after=probe, limit=10)["events"] == expected[:10]
+    assert index.seek(probe) == len(ordered) - len(expected)
+    assert index.seek(None) == 0
+    assert index.seek(_cursor(ordered[-1])) == len(ordered)
+
+
+def test_add_and_extend_agree():
+    events = _events(400)
+    ordered = sorted(events, key=cmp_to_key(ordering_compare))
+
+    one_by_one = EventIndex()
+    for e in events:
+        one_by_one.add(e)
+
+    batched = EventIndex()
+    # Newest batch first exercises the merge path, oldest batch first the append path.
+    batched.extend(ordered[100:200])
+    batched.extend(ordered[300:])
+    batched.extend(ordered[:100])
+    batched.extend(ordered[200:300])
+
+    assert list(one_by_one) == list(batched) == ordered
+    assert len(batched) == 400
+    assert ordered[5] in batched
+    assert {"timestamp": 1} not in batched
+
+
+def test_rejects_unsorted_batches_and_duplicates():
+    ordered = sorted(_events(10), key=cmp_to_key(ordering_compare))
+    index = EventIndex()
+    with pytest.raises(ValueError, match="contract order"):
+        index.extend(reversed(ordered))
+    index.extend(ordered)
+    with pytest.raises(ValueError, match="duplicate"):
+        index.add(ordered[3])
+    with pytest.raises(ValueError, match="duplicate"):
+        index.extend(ordered[2:4])
+    with pytest.raises(ValueError, match="duplicate"):
+        EventIndex(ordered + ordered[:1])
+    assert len(index) == 10
+
+
+@pytest.mark.parametrize(
+    "event",
+    [
+        {"timestamp": -1, "event_id": "0190a5e0-7c3a-7000-8000-000000000001"},
+        {"timestamp": 1, "event_id": "0190A5E0-7C3A-7000-8000-000000000001"},
+        {"timestamp": 1, "event_id": None},
+    ],
+)
+def test_rejects_invalid_frames(event):
+    with pytest.raises(ValueError):
+        EventIndex().add(event)
+
+
+def test_bounded_mode_evicts_oldest():
+    events = _events(500, spread=1000)
+    ordered = sorted(events, key=cmp_to_key(ordering_compare))
+    index = EventIndex(maxlen=64)
+    for e in events:
+        index.add(e)
+        assert len(index) <= 64
+    assert list(index) == ordered[:64]
+
+    page = index.page(limit=60)
+    assert page["events"] == ordered[:60]
+    tail = index.page(after=page["next_cursor"], limit=60)
+    assert tail == {"events": ordered[60:64], "next_cursor": None}
+    # Cursors for evicted events still seek correctly: nothing older is kept.
+    assert index.page(after=_cursor(ordered[100]))["events"] == []
+
+
+def test_bounded_extend_keeps_newest():
+    ordered = sorted(_events(300, spread=1000), key=cmp_to_key(ordering_compare))
+    index = EventIndex(maxlen=100)
+    for start in range(200, -1, -100):
+        index.extend(ordered[start : start + 100])
+    assert list(index) == ordered[:100]
+
+
+def test_invalid_arguments():
+    index = EventIndex(_events(5))
+    with pytest.raises(ValueError):
+        index.page(limit=0)
+    with pytest.raises(ValueError):
+        index.page(after="not*a*cursor")
+    with pytest.raises(ValueError):
+        EventIndex(maxlen=0)
+    index.clear()
+    assert len(index) == 0
+    assert index.page() == {"events": [], "next_cursor": None}
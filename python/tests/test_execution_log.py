@@ -0,0 +1,109 @@
+"""TGA execution log hash-chain verification tests."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from talos_contracts import execution_log_entry_digest, verify_execution_log
+
+ROOT = Path(__file__).resolve().parents[2]
+VECTORS = json.loads((ROOT / "test_vectors" / "tga" / "execution_log_chain.json").read_text())
+
+
+def _write(path, lines):
+    path.write_text("".join(line + "\n" for line in lines), encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("case", VECTORS["entry_digest"], ids=lambda c: c["test_id"])
+def test_entry_digest_vectors(case):
+    assert execution_log_entry_digest(case["entry"]) == case["entry_digest"]
+    assert execution_log_entry_digest(dict(case["entry"], entry_digest="x")) == case["entry_digest"]
+
+
+@pytest.mark.parametrize("workers,block_size", [(0, 1 << 20), (0, 100), (2, 300)])
+def test_valid_chain(tmp_path, workers, block_size):
+    valid = VECTORS["valid"]
+    log = _write(tmp_path / "log.jsonl", valid["lines"])
+    result = verify_execution_log(log, workers=workers, block_size=block_size)
+    assert result == {
+        "ok": True,
+        "entries": valid["expected_entries"],
+        "checkpoint": valid["expected_checkpoint"],
+        "first_break": None,
+    }
+    assert result["checkpoint"]["offset"] == log.stat().st_size
+
+
+@pytest.mark.parametrize("case", VECTORS["invalid"], ids=lambda c: c["test_id"])
+@pytest.mark.parametrize("workers", [0, 2])
+def test_invalid_chains_report_first_break(tmp_path, case, workers):
+    log = _write(tmp_path / "log.jsonl", case["lines"])
+    result = verify_execution_log(log, workers=workers, block_size=256)
+    assert not result["ok"]
+    assert result["entries"] == case["expected_entries"]
+    assert result["first_break"] == case["expected_break"]
+
+
+def test_resume_verifies_only_the_appended_suffix(tmp_path):
+    lines = VECTORS["valid"]["lines"]
+    log = _write(tmp_path / "log.jsonl", lines[:3])
+    first = verify_execution_log(log)
+    assert first["ok"] and first["entries"] == 3
+
+    # An append in progress (no newline yet) is left for the next run.
+    with open(log, "a", encoding="utf-8") as f:
+        f.write(lines[3] + "\n" + lines[4][:30])
+    second = verify_execution_log(log, resume_from=first["checkpoint"])
+    assert second["ok"] and second["entries"] == 1
+    assert second["checkpoint"]["sequence_number"] == 3
+
+    with open(log, "a", encoding="utf-8") as f:
+        f.write(lines[4][30:] + "\n" + lines[5] + "\n")
+    third = verify_execution_log(log, resume_from=second["checkpoint"], workers=2)
+    assert third["ok"] and third["entries"] == 2
+    assert third["checkpoint"] == VECTORS["valid"]["expected_checkpoint"]
+
+    # Nothing new: the checkpoint is returned unchanged.
+    assert verify_execution_log(log, resume_from=third["checkpoint"]) == {
+        "ok": True,
+        "entries": 0,
+        "checkpoint": third["checkpoint"],
+        "first_break": None,
+    }
+
+
+def test_resume_rejects_a_checkpoint_that_does_not_match_the_log(tmp_path):
+    lines = VECTORS["valid"]["lines"]
+    log = _write(tmp_path / "log.jsonl", lines)
+    checkpoint = verify_execution_log(log)["checkpoint"]
+    for bad in (
+        dict(checkpoint, entry_digest="f" * 64),
+        dict(checkpoint, sequence_number=4),
+        dict(checkpoint, offset=checkpoint["offset"] - 1),
+        dict(checkpoint, offset=checkpoint["offset"] + 10),
+    ):
+        result = verify_execution_log(log, resume_from=bad)
+        assert result["first_break"]["reason"] == "CHECKPOINT_MISMATCH"
+        assert result["checkpoint"] is None
+
+    # Rewriting the verified prefix is caught at the checkpoint.
+    _write(log, VECTORS["invalid"][0]["lines"])
+    assert verify_execution_log(log, resume_from=checkpoint)["first_break"]["reason"] == "CHECKPOINT_MISMATCH"
+
+
+def test_blank_lines_and_empty_log(tmp_path):
+    lines = VECTORS["valid"]["lines"]
+    log = _write(tmp_path / "log.jsonl", [lines[0], "", lines[1], "  "])
+    assert verify_execution_log(log)["entries"] == 2
+    empty = _write(tmp_path / "empty.jsonl", [])
+    assert verify_execution_log(empty) == {"ok": True, "entries": 0, "checkpoint": None, "first_break": None}
+
+
+def test_rejects_bad_arguments(tmp_path):
+    log = _write(tmp_path / "log.jsonl", [])
+    with pytest.raises(ValueError):
+        verify_execution_log(log, workers=-1)
+    with pytest.raises(ValueError):
+        verify_execution_log(log, block_size=0)
@@ -0,0 +1,155 @@
+"""Merkle checkpoints, inclusion and consistency proofs over execution logs."""
+
+import hashlib
+import json
+import random
+import re
+from pathlib import Path
+
+import pytest
+
+from talos_contracts import (
+    ExecutionLogMerkleTree,
+    ExecutionLogWriter,
+    calculate_digest,
+    verify_consistency_proof,
+    verify_inclusion_proof,
+)
+
+ROOT = Path(__file__).resolve().parents[2]
+VECTORS = json.loads((ROOT / "test_vectors" / "tga" / "execution_log_merkle.json").read_text())
+SCHEMA = json.loads((ROOT / "schemas" / "tga" / "v1" / "merkle_checkpoint.schema.json").read_text())
+
+
+def _h(data):
+    return hashlib.sha256(data).digest()
+
+
+def _mth(leaves):
+    """RFC 9162 section 2.1.1 MTH, straight from the definition."""
+    if not leaves:
+        return _h(b"")
+    if len(leaves) == 1:
+        return _h(b"\x00" + leaves[0])
+    k = 1 << ((len(leaves) - 1).bit_length() - 1)
+    return _h(b"\x01" + _mth(leaves[:k]) + _mth(leaves[k:]))
+
+
+def _digests(n, seed=0):
+    return [hashlib.sha256(f"{seed}-{i}".encode()).hexdigest() for i in range(n)]
+
+
+def test_reference_matches_certificate_transparency_roots():
+    leaves = [b"", b"\x00", b"\x10", b"\x20\x21", b"\x30\x31", b"\x40\x41\x42\x43", bytes(range(0x50, 0x58)), bytes(range(0x60, 0x70))]
+    assert _mth(leaves[:1]).hex() == "6e340b9cffb37a989ca544e6bb780a2c78901d3fb33738768511a30617afa01d"
+    assert _mth(leaves[:3]).hex() == "aeb6bcfe274b70a14fb067a5e5578264db0fa9b51af5e0ba159158f329e06e77"
+    assert _mth(leaves[:7]).hex() == "ddb89be403809e325750d3d263cd78929c2942b7942a34b77e122c9594a74c8c"
+    assert _mth(leaves).hex() == "5dc9da79a70659a9ad559cb701ded9a2ab9d823aad2f4960cfe370eff4604328"
+
+
+def test_vectors():
+    tree = ExecutionLogMerkleTree(VECTORS["entry_digests"])
+    for case in VECTORS["roots"]:
+        assert tree.root(case["tree_size"]) == case["merkle_root"]
+    roots = {case["tree_size"]: case["merkle_root"] for case in VECTORS["roots"]}
+    for case in VECTORS["inclusion_proofs"]:
+        index, size = case["index"], case["tree_size"]
+        assert tree.inclusion_proof(index, size) == case["proof"]
+        assert verify_inclusion_proof(VECTORS["entry_digests"][index], index, size, case["proof"], roots[size])
+    for case in VECTORS["consistency_proofs"]:
+        old, new = case["old_size"], case["new_size"]
+        assert tree.consistency_proof(old, new) == case["proof"]
+        assert verify_consistency_proof(old, new, roots[old], roots[new], case["proof"])
+    checkpoint = VECTORS["checkpoint"]
+    assert tree.checkpoint(checkpoint["trace_id"], checkpoint["tree_size"]) == checkpoint
+    assert calculate_digest(checkpoint, ["checkpoint_digest"]) == checkpoint["checkpoint_digest"]
+
+
+def test_checkpoint_matches_schema():
+    checkpoint = ExecutionLogMerkleTree(_digests(5)).checkpoint(VECTORS["checkpoint"]["trace_id"])
+    assert sorted(checkpoint) == sorted(SCHEMA["required"]) == sorted(SCHEMA["properties"])
+    assert re.fullmatch(SCHEMA["$defs"]["uuidv7"]["pattern"], checkpoint["trace_id"])
+    for field in ("merkle_root", "checkpoint_digest"):
+        assert re.fullmatch(SCHEMA["properties"][field]["pattern"], checkpoint[field])
+    assert checkpoint["tree_size"] == 5
+    assert checkpoint["checkpoint_sequence_number"] == 4
+
+
+def test_incremental_roots_match_definition():
+    digests = _digests(70)
+    tree = ExecutionLogMerkleTree()
+    bulk = ExecutionLogMerkleTree()
+    for n, digest in enumerate(digests, 1):
+        assert tree.append(digest) == n - 1
+        assert tree.root() == _mth([bytes.fromhex(d) for d in digests[:n]]).hex()
+    # extend() in uneven pieces builds the same levels as append().
+    for lo, hi in ((0, 3), (3, 4), (4, 33), (33, 70)):
+        bulk.extend(digests[lo:hi])
+    assert bulk._levels == tree._levels
+    assert len(bulk) == 70 and bulk.root(0) == hashlib.sha256(b"").hexdigest()
+
+
+def test_every_proof_verifies_and_tampering_fails():
+    digests = _digests(37, seed=1)
+    tree = ExecutionLogMerkleTree(digests)
+    for size in range(1, 38):
+        root = tree.root(size)
+        for index in range(size):
+            proof = tree.inclusion_proof(index, size)
+            assert len(proof) <= (size - 1).bit_length()
+            assert verify_inclusion_proof(digests[index], index, size, proof, root)
+            if size > 1:
+                assert not verify_inclusion_proof(digests[(index + 1) % size], index, size, proof, root)
+                assert not verify_inclusion_proof(digests[index], index, size, proof[:-1], root)
+        for old in range(1, size + 1):
+            proof = tree.consistency_proof(old, size)
+            old_root = tree.root(old)
+            assert verify_consistency_proof(old, size, old_root, root, proof)
+            if old < size:
+                assert not verify_consistency_proof(old, size, tree.root(old - 1), root, proof)
+                assert not verify_consistency_proof(old, size, old_root, root, proof + [proof[0]])
+
+
+def test_consistency_fails_for_a_rewritten_prefix():
+    digests = _digests(20)
+    tree = ExecutionLogMerkleTree(digests)
+    forked = ExecutionLogMerkleTree(digests[:5] + _digests(15, seed=9))
+    proof = forked.consistency_proof(11, 20)
+    assert not verify_consistency_proof(11, 20, tree.root(11), forked.root(), proof)
+
+
+def test_malformed_inputs():
+    tree = ExecutionLogMerkleTree(_digests(4))
+    with pytest.raises(ValueError):
+        tree.append("abc")
+    with pytest.raises(ValueError):
+        tree.extend(["zz" * 32])
+    with pytest.raises(ValueError):
+        tree.inclusion_proof(4)
+    with pytest.raises(ValueError):
+        tree.consistency_proof(0, 4)
+    with pytest.raises(ValueError):
+        tree.root(5)
+    with pytest.raises(ValueError):
+        ExecutionLogMerkleTree().checkpoint("t")
+    proof = tree.inclusion_proof(1)
+    assert not verify_inclusion_proof(_digests(4)[1], 1, 4, ["nothex"], tree.root())
+    assert not verify_inclusion_proof(_digests(4)[1], -1, 4, proof, tree.root())
+    assert not verify_consistency_proof(0, 4, tree.root(), tree.root(), [])
+    assert verify_consistency_proof(4, 4, tree.root(), tree.root(), [])
+
+
+def test_checkpoints_over_a_written_log(tmp_path):
+    rng = random.Random(4)
+    with ExecutionLogWriter(tmp_path, commit_interval=0) as writer:
+        entries = [writer.append("trace-1", "observation", {"n": rng.random()}) for _ in range(25)]
+    tree = ExecutionLogMerkleTree(e["entry_digest"] for e in entries)
+    early = tree.checkpoint("trace-1", 10)
+    late = tree.checkpoint("trace-1")
+    assert (early["checkpoint_sequence_number"], late["checkpoint_sequence_number"]) == (9, 24)
+    proof = tree.consistency_proof(early["tree_size"], late["tree_size"])
+    assert verify_consistency_proof(10, 25, early["merkle_root"], late["merkle_root"], proof)
+    entry = entries[17]
+    assert verify_inclusion_proof(
+        entry["entry_digest"], entry["sequence_number"], 25, tree.inclusion_proof(17), late["merkle_root"]
+    )
@@ -0,0 +1,216 @@
+"""Execution log writer (group commit, recovery) and indexed reader tests."""
+
+import json
+import os
+import threading
+from itertools import pairwise
+
+import pytest
+
+from talos_contracts import (
+    ExecutionLogReader,
+    ExecutionLogWriter,
+    canonical_json_bytes,
+    execution_log_entry_digest,
+    verify_execution_log,
+)
+
+TRACE = "018d0a5a-5a5a-7a5a-8a5a-5a5a5a5a5a5a"
+TS = "2026-01-27T12:00:00.000Z"
+
+
+def _payload(i):
+    return {"step": i, "tool": "echo", "args": {"text": f"hello {i} é", "ratio": i / 4}}
+
+
+@pytest.mark.parametrize("commit_interval", [0, 0.001])
+def test_entries_are_chained_canonical_lines(tmp_path, commit_interval):
+    with ExecutionLogWriter(tmp_path, commit_interval=commit_interval) as writer:
+        entries = [writer.append(TRACE, "tool_call", _payload(i), ts=TS) for i in range(5)]
+    assert [e["sequence_number"] for e in entries] == list(range(5))
+    assert entries[0]["prev_entry_digest"] == "0" * 64
+    for prev, entry in pairwise(entries):
+        assert entry["prev_entry_digest"] == prev["entry_digest"]
+    for entry in entries:
+        assert entry["entry_digest"] == execution_log_entry_digest(entry)
+
+    log = writer.log_path(TRACE)
+    assert log.read_bytes() == b"".join(canonical_json_bytes(e) + b"\n" for e in entries)
+    result = verify_execution_log(log)
+    assert result["ok"] and result["entries"] == 5
+
+
+def test_reader_jumps_to_entry_n(tmp_path):
+    with ExecutionLogWriter(tmp_path, commit_interval=0) as writer:
+        entries = [writer.append(TRACE, "observation", _payload(i), ts=TS, wait=False) for i in range(300)]
+    with ExecutionLogReader(writer.log_path(TRACE)) as reader:
+        assert len(reader) == 300
+        assert reader[0] == entries[0]
+        assert reader[299] == entries[299]
+        assert reader.raw(150) == canonical_json_bytes(entries[150])
+        assert list(reader.entries(295)) == entries[295:]
+        with pytest.raises(IndexError):
+            reader[300]
+        with pytest.raises(IndexError):
+            reader.raw(-1)
+    assert len(ExecutionLogReader(tmp_path / "missing.jsonl")) == 0
+
+
+def test_group_commit_from_many_threads(tmp_path):
+    traces = [f"trace-{k}" for k in range(3)]
+    with ExecutionLogWriter(tmp_path, commit_interval=0.005) as writer:
+
+        def produce(k):
+            for i in range(50):
+                writer.append(traces[k % 3], "tool_effect", _payload(i), ts=TS)
+
+        threads = [threading.Thread(target=produce, args=(k,)) for k in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    for trace in traces:
+        result = verify_execution_log(writer.log_path(trace))
+        assert result["ok"] and result["entries"] == 100
+        with ExecutionLogReader(writer.log_path(trace)) as reader:
+            assert len(reader) == 100
+            assert reader[99]["sequence_number"] == 99
+
+
+def test_wait_false_is_durable_after_commit(tmp_path):
+    writer = ExecutionLogWriter(tmp_path, commit_interval=10)
+    writer.append(TRACE, "plan", {}, ts=TS, wait=False)
+    assert writer.log_path(TRACE).read_bytes() == b""
+    writer.commit()
+    assert len(writer.log_path(TRACE).read_bytes().splitlines()) == 1
+    writer.close()
+    with pytest.raises(ValueError):
+        writer.append(TRACE, "plan", {})
+
+
+def test_max_batch_commits_without_interval(tmp_path):
+    with ExecutionLogWriter(tmp_path, commit_interval=0, max_batch=10) as writer:
+        for i in range(25):
+            writer.append(TRACE, "plan", _payload(i), ts=TS, wait=False)
+        assert len(writer.log_path(TRACE).read_bytes().splitlines()) == 20
+
+
+def test_recovers_to_last_complete_entry_and_continues(tmp_path):
+    with ExecutionLogWriter(tmp_path, commit_interval=0) as writer:
+        entries = [writer.append(TRACE, "tool_call", _payload(i), ts=TS) for i in range(10)]
+    log = writer.log_path(TRACE)
+    index = log.with_name(log.name + ".idx")
+    data = log.read_bytes()
+
+    # A crash mid-commit: a torn line, and index entries for lines never written.
+    log.write_bytes(data + canonical_json_bytes(entries[0])[:25])
+    index.write_bytes(index.read_bytes() + (len(data) + 500).to_bytes(8, "little") + b"\x01\x02")
+    with ExecutionLogReader(log) as reader:
+        assert len(reader) == 10
+    with ExecutionLogWriter(tmp_path, commit_interval=0) as writer:
+        entry = writer.append(TRACE, "tool_effect", {"ok": True}, ts=TS)
+    assert entry["sequence_number"] == 10
+    assert entry["prev_entry_digest"] == entries[9]["entry_digest"]
+    assert log.read_bytes().startswith(data)
+    assert verify_execution_log(log)["entries"] == 11
+    with ExecutionLogReader(log) as reader:
+        assert len(reader) == 11
+        assert reader[10] == entry
+        assert reader[3] == entries[3]
+
+
+def test_recovery_rebuilds_a_missing_index(tmp_path):
+    with ExecutionLogWriter(tmp_path, commit_interval=0) as writer:
+        entries = [writer.append(TRACE, "tool_call", _payload(i), ts=TS) for i in range(6)]
+    log = writer.log_path(TRACE)
+    log.with_name(log.name + ".idx").unlink()
+
+    with ExecutionLogWriter(tmp_path, commit_interval=0) as writer:
+        entry = writer.append(TRACE, "error", {"message": "retry"}, ts=TS)
+    assert entry["sequence_number"] == 6
+    assert entry["prev_entry_digest"] == entries[5]["entry_digest"]
+    with ExecutionLogReader(log) as reader:
+        assert [reader[i] for i in range(6)] == entries
+        assert reader[6] == entry
+
+
+def test_recovery_refuses_a_corrupt_complete_line(tmp_path):
+    with ExecutionLogWriter(tmp_path, commit_interval=0) as writer:
+        for i in range(6):
+            writer.append(TRACE, "tool_call", _payload(i), ts=TS)
+    log = writer.log_path(TRACE)
+    lines = log.read_bytes().splitlines(keepends=True)
+    tampered = json.loads(lines[5])
+    tampered["payload"]["step"] = 99
+    data = b"".join(lines[:5]) + canonical_json_bytes(tampered) + b"\n"
+    log.write_bytes(data)
+
+    with ExecutionLogWriter(tmp_path, commit_interval=0) as writer, pytest.raises(ValueError, match="corrupt"):
+        writer.append(TRACE, "error", {"message": "retry"}, ts=TS)
+    assert log.read_bytes() == data
+
+
+def test_written_entries_match_their_digest(tmp_path):
+    with ExecutionLogWriter(tmp_path, commit_interval=0) as writer:
+        for i in range(4):
+            writer.append(TRACE, "observation", _payload(i), ts=TS, wait=False)
+    with ExecutionLogReader(writer.log_path(TRACE)) as reader:
+        for entry in reader.entries():
+            assert execution_log_entry_digest(entry) == entry["entry_digest"]
+
+
+def test_failed_commit_stops_the_writer(tmp_path, monkeypatch):
+    writer = ExecutionLogWriter(tmp_path, commit_interval=0)
+    writer.append(TRACE, "plan", {}, ts=TS)
+    written = writer.log_path(TRACE).read_bytes()
+
+    def fail(fd):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "fsync", fail)
+    with pytest.raises(OSError):
+        writer.append(TRACE, "plan", {"n": 1}, ts=TS)
+    monkeypatch.undo()
+    with pytest.raises(OSError):
+        writer.append(TRACE, "plan", {"n": 2}, ts=TS, wait=False)
+    with pytest.raises(OSError):
+        writer.commit()
+    with pytest.raises(OSError):
+        writer.close()
+    # The unsynced entry may have reached the file, but nothing after it.
+    data = writer.log_path(TRACE).read_bytes()
+    assert data.startswith(written) and len(data.splitlines()) <= 2
+
+
+def test_bounded_open_traces(tmp_path):
+    traces = [f"trace-{k}" for k in range(5)]
+    with ExecutionLogWriter(tmp_path, commit_interval=0, max_open_traces=2) as writer:
+        for i in range(3):
+            for trace in traces:
+                writer.append(trace, "tool_call", _payload(i), ts=TS)
+            assert len(writer._open_traces) == 2
+    for trace in traces:
+        result = verify_execution_log(writer.log_path(trace))
+        assert result["ok"] and result["entries"] == 3
+        with ExecutionLogReader(writer.log_path(trace)) as reader:
+            assert [e["sequence_number"] for e in reader.entries()] == [0, 1, 2]
+
+
+def test_rejects_bad_arguments(tmp_path):
+    with pytest.raises(ValueError):
+        ExecutionLogWriter(tmp_path, commit_interval=-1)
+    with pytest.raises(ValueError):
+        ExecutionLogWriter(tmp_path, max_batch=0)
+    with pytest.raises(ValueError):
+        ExecutionLogWriter(tmp_path, max_open_traces=0)
+    with ExecutionLogWriter(tmp_path, commit_interval=0) as writer:
+        with pytest.raises(ValueError):
+            writer.append("../escape", "plan", {})
+        with pytest.raises(ValueError):
+            writer.append(TRACE, "unknown", {})
+        with pytest.raises(TypeError):
+            writer.append(TRACE, "plan", [1, 2])
+        with pytest.raises(TypeError):
+            writer.append(TRACE, "plan", {"x": object()})
+        # Rejected appends do not advance the chain.
+        assert writer.append(TRACE, "plan", {}, ts=TS)["sequence_number"] == 0
@@ -0,0 +1,199 @@
+"""Checkpoint-plus-replay recovery of TGA execution state."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from talos_contracts import (
+    ExecutionLogWriter,
+    apply_execution_log_entry,
+    canonical_json_bytes,
+    execution_checkpoint,
+    execution_log_entry_digest,
+    execution_state_digest,
+    initial_execution_state,
+    recover_execution_state,
+    verify_execution_log,
+)
+
+ROOT = Path(__file__).resolve().parents[2]
+VECTORS = json.loads((ROOT / "test_vectors" / "tga" / "execution_recovery.json").read_text())
+TRACE = VECTORS["trace_id"]
+PLAN = VECTORS["plan_id"]
+TS = "2026-01-27T12:00:00.000Z"
+
+
+def _write(directory, count):
+    """Write ``count`` entries moving through the execution states; return entries and states."""
+    transitions = {0: "PENDING", 1: "AUTHORIZED", 2: "EXECUTING", count - 1: "COMPLETED"}
+    entries = []
+    states = [initial_execution_state(TRACE, PLAN)]
+    with ExecutionLogWriter(directory, commit_interval=0) as writer:
+        for i in range(count):
+            payload = {"step": i}
+            if i in transitions:
+                payload["to_state"] = transitions[i]
+            entries.append(writer.append(TRACE, "observation", payload, ts=TS, wait=False))
+            states.append(apply_execution_log_entry(states[-1], entries[-1]))
+    return writer.log_path(TRACE), entries, states
+
+
+def test_vectors(tmp_path):
+    with ExecutionLogWriter(tmp_path, commit_interval=0) as writer:
+        for expected in VECTORS["entries"]:
+            entry = writer.append(TRACE, expected["type"], expected["payload"], ts=expected["ts"])
+            assert entry == expected
+    states = [VECTORS["initial_state"]]
+    assert initial_execution_state(TRACE, PLAN) == states[0]
+    for entry in VECTORS["entries"]:
+        states.append(apply_execution_log_entry(states[-1], entry))
+    assert states[-1] == VECTORS["expected_state"]
+    assert execution_state_digest(states[-1]) == states[-1]["state_digest"]
+
+    checkpoint = VECTORS["checkpoint"]
+    sequence_number = checkpoint["checkpoint_sequence_number"]
+    assert execution_checkpoint(states[sequence_number + 1], ts=checkpoint["ts"]) == checkpoint
+    result = recover_execution_state(
+        writer.log_path(TRACE), TRACE, PLAN, checkpoints=[checkpoint], stored_state=VECTORS["expected_state"]
+    )
+    assert result == {
+        "state": VECTORS["expected_state"],
+        "checkpoint_sequence_number": sequence_number,
+        "rejected_checkpoints": 0,
+        "replayed": len(VECTORS["entries"]) - 1 - sequence_number,
+        "chain_valid": True,
+        "first_break": None,
+        "state_diverged": False,
+    }
+
+
+def test_replays_only_the_suffix_after_the_newest_checkpoint(tmp_path):
+    log, entries, states = _write(tmp_path, 50)
+    checkpoints = [execution_checkpoint(states[n + 1], ts=TS) for n in (9, 19, 39)]
+    full = recover_execution_state(log, TRACE, PLAN)
+    fast = recover_execution_state(log, TRACE, PLAN, checkpoints=checkpoints[::-1], stored_state=states[-1])
+    assert full["state"] == fast["state"] == states[-1]
+    assert full["state"]["current_state"] == "COMPLETED"
+    assert (full["replayed"], full["checkpoint_sequence_number"]) == (50, None)
+    assert (fast["replayed"], fast["checkpoint_sequence_number"]) == (10, 39)
+    assert fast["chain_valid"] and not fast["state_diverged"]
+
+
+def test_rejects_bad_checkpoints_and_falls_back(tmp_path):
+    log, entries, states = _write(tmp_path, 30)
+    good = execution_checkpoint(states[11], ts=TS)
+    tampered = execution_checkpoint(states[21], ts=TS)
+    tampered["checkpoint_state"]["current_state"] = "FAILED"
+    beyond_log = execution_checkpoint(
+        apply_execution_log_entry(states[-1], {"sequence_number": 30, "entry_digest": "f" * 64}), ts=TS
+    )
+    forked = execution_checkpoint(
+        apply_execution_log_entry(states[25], {"sequence_number": 25, "entry_digest": "e" * 64}), ts=TS
+    )
+    other_plan = execution_checkpoint(dict(states[28], plan_id=TRACE), ts=TS)
+    result = recover_execution_state(log, TRACE, PLAN, checkpoints=[good, tampered, beyond_log, forked, other_plan, {}])
+    assert result["checkpoint_sequence_number"] == 10
+    assert result["rejected_checkpoints"] == 4
+    assert result["replayed"] == 19 and result["state"] == states[-1]
+    # Nothing usable: replay from genesis.
+    result = recover_execution_state(log, TRACE, PLAN, checkpoints=[tampered])
+    assert (result["checkpoint_sequence_number"], result["replayed"]) == (None, 30)
+
+
+def test_detects_divergence_in_the_replayed_suffix(tmp_path):
+    log, entries, states = _write(tmp_path, 20)
+    lines = log.read_bytes().splitlines(keepends=True)
+    tampered = json.loads(lines[15])
+    tampered["payload"]["step"] = -1
+    line = canonical_json_bytes(tampered) + b"\n"
+    assert len(line) == len(lines[15])  # keep the index offsets valid
+    log.write_bytes(b"".join(lines[:15]) + line + b"".join(lines[16:]))
+
+    result = recover_execution_state(
+        log, TRACE, PLAN, checkpoints=[execution_checkpoint(states[11], ts=TS)], stored_state=states[-1]
+    )
+    assert not result["chain_valid"]
+    assert result["first_break"] == {
+        "offset": len(b"".join(lines[:15])),
+        "sequence_number": 15,
+        "reason": "ENTRY_DIGEST_MISMATCH",
+    }
+    assert result["state"] == states[15] and result["replayed"] == 4
+    assert result["state_diverged"]
+    # A checkpoint naming the tampered entry is rejected.
+    assert recover_execution_state(log, TRACE, PLAN, checkpoints=[execution_checkpoint(states[16], ts=TS)])[
+        "checkpoint_sequence_number"
+    ] is None
+
+
+def test_stored_state_divergence_and_torn_tail(tmp_path):
+    log, entries, states = _write(tmp_path, 8)
+    # Crash after an entry was logged but before the state was persisted.
+    behind = recover_execution_state(log, TRACE, PLAN, stored_state=states[-2])
+    assert behind["chain_valid"] and behind["state_diverged"]
+    # A stored state edited without updating its state_digest diverges too.
+    forged = dict(states[-1], current_state="FAILED")
+    assert recover_execution_state(log, TRACE, PLAN, stored_state=forged)["state_diverged"]
+
+    with open(log, "ab") as f:
+        f.write(canonical_json_bytes(entries[0])[:30])
+    torn = recover_execution_state(log, TRACE, PLAN)
+    assert torn["chain_valid"] and torn["state"] == states[-1]
+    assert recover_execution_state(tmp_path / "missing.jsonl", TRACE, PLAN)["state"] == states[0]
+
+
+def test_entries_missing_from_a_short_index_are_replayed(tmp_path):
+    log, entries, states = _write(tmp_path, 10)
+    index = log.with_name(log.name + ".idx")
+    index.write_bytes(index.read_bytes()[: 8 * 7])  # the index is not fsynced
+    assert verify_execution_log(log)["entries"] == 10
+
+    result = recover_execution_state(log, TRACE, PLAN, stored_state=states[-1])
+    assert result["chain_valid"] and not result["state_diverged"]
+    assert result["state"] == states[-1] and result["state"]["current_state"] == "COMPLETED"
+    assert result["replayed"] == 10
+
+    checkpoints = [execution_checkpoint(states[n + 1], ts=TS) for n in (3, 8)]
+    resumed = recover_execution_state(log, TRACE, PLAN, checkpoints=checkpoints)
+    # The checkpoint past the end of the index cannot be located and is skipped.
+    assert resumed["checkpoint_sequence_number"] == 3 and resumed["rejected_checkpoints"] == 1
+    assert resumed["replayed"] == 6 and resumed["state"] == states[-1]
+
+
+def test_first_entry_sets_the_sequence_numbering(tmp_path):
+    # Logs written elsewhere may start at sequence number 1, as in the golden vectors.
+    log = tmp_path / "from-one.jsonl"
+    prev = "0" * 64
+    lines = []
+    for n in range(1, 4):
+        entry = {
+            "trace_id": TRACE,
+            "sequence_number": n,
+            "type": "observation",
+            "payload": {"to_state": "COMPLETED"} if n == 3 else {"step": n},
+            "ts": TS,
+            "prev_entry_digest": prev,
+        }
+        entry["entry_digest"] = prev = execution_log_entry_digest(entry)
+        lines.append(canonical_json_bytes(entry) + b"\n")
+    log.write_bytes(b"".join(lines))
+    assert verify_execution_log(log)["ok"]
+
+    result = recover_execution_state(log, TRACE, PLAN)
+    assert result["chain_valid"] and result["replayed"] == 3
+    assert result["state"]["last_sequence_number"] == 3
+    assert result["state"]["current_state"] == "COMPLETED"
+
+
+# Same-length edits keep the index offsets valid.
+@pytest.mark.parametrize("field, value", [("trace_id", TRACE[:-1] + "b"), ("sequence_number", 7)])
+def test_first_break_reasons(tmp_path, field, value):
+    log, entries, states = _write(tmp_path, 6)
+    lines = log.read_bytes().splitlines(keepends=True)
+    broken = dict(json.loads(lines[3]), **{field: value})
+    log.write_bytes(b"".join(lines[:3]) + canonical_json_bytes(broken) + b"\n" + b"".join(lines[4:]))
+    result = recover_execution_state(log, TRACE, PLAN)
+    expected = "TRACE_MISMATCH" if field == "trace_id" else "SEQUENCE_GAP"
+    assert result["first_break"]["reason"] == expected
+    assert result["state"] == states[3]
@@ -0,0 +1,84 @@
+"""ordering_key and merge_ordered parity with ordering_compare."""
+
+import json
+import random
+from functools import cmp_to_key
+from itertools import count, islice
+from pathlib import Path
+
+import pytest
+
+from talos_contracts import merge_ordered, ordering_compare, ordering_key, uuid7_batch
+
+V = Path(__file__).resolve().parents[2] / "test_vectors"
+
+# Prefixes, NUL, non-ASCII, a lone surrogate and the last code point.
+TRICKY_IDS = ["", "a", "ab", "abc", "a\x00", "a\x00b", "b", "\x7f", "é", "éa", "€", "\ud800", "\U0001f600", "\U0010ffff"]
+
+
+def _by_compare(events):
+    return sorted(events, key=cmp_to_key(ordering_compare))
+
+
+def test_ordering_vectors():
+    for c in json.loads((V / "ordering.json").read_text()):
+        ka, kb = ordering_key(c["a"]), ordering_key(c["b"])
+        assert (ka > kb) - (ka < kb) == c["expected"]
+
+
+def test_key_matches_compare_on_tricky_ids():
+    events = [{"timestamp": ts, "event_id": eid} for ts in (0, 1) for eid in TRICKY_IDS]
+    for a in events:
+        for b in events:
+            ka, kb = ordering_key(a), ordering_key(b)
+            assert (ka > kb) - (ka < kb) == ordering_compare(a, b), (a, b)
+
+
+def test_sorted_with_key_matches_cmp_to_key():
+    rng = random.Random(4)
+    events = [{"timestamp": rng.randrange(20), "event_id": eid, "n": i} for i, eid in enumerate(uuid7_batch(2000))]
+    events += [dict(e, n=-1) for e in rng.sample(events, 50)]  # equal keys keep input order
+    rng.shuffle(events)
+    assert sorted(events, key=ordering_key) == _by_compare(events)
+
+
+class TestMergeOrdered:
+    """merge_ordered over pre-sorted streams."""
+
+    def _streams(self, k, n, seed=9):
+        rng = random.Random(seed)
+        events = [{"timestamp": rng.randrange(50), "event_id": eid} for eid in uuid7_batch(n)]
+        shards = [[] for _ in range(k)]
+        for e in events:
+            shards[rng.randrange(k)].append(e)
+        return [_by_compare(s) for s in shards]
+
+    @pytest.mark.parametrize("k", [1, 2, 7])
+    def test_matches_sorting_the_union(self, k):
+        streams = self._streams(k, 1000)
+        merged = list(merge_ordered(*(iter(s) for s in streams)))
+        assert merged == _by_compare([e for s in streams for e in s])
+
+    def test_no_streams(self):
+        assert list(merge_ordered()) == []
+
+    def test_dedupe(self):
+        streams = self._streams(3, 600)
+        replicas = [s[::2] for s in streams]  # every other event delivered twice
+        union = _by_compare([e for s in streams for e in s])
+        assert list(merge_ordered(*streams, *replicas, dedupe=True)) == union
+        assert len(list(merge_ordered(*streams, *replicas))) == len(union) + sum(map(len, replicas))
+
+    def test_lazy_over_unbounded_streams(self):
+        def stream(offset):
+            ids = iter(uuid7_batch(1))
+            for ts in count(10**9, -2):
+                yield {"timestamp": ts - offset, "event_id": next(ids, "0190a5e0-7c3a-7000-8000-000000000001")}
+
+        head = list(islice(merge_ordered(stream(0), stream(1)), 6))
+        assert [e["timestamp"] for e in head] == [10**9, 10**9 - 1, 10**9 - 2, 10**9 - 3, 10**9 - 4, 10**9 - 5]
+
+    def test_out_of_order_stream_raises(self):
+        a = [{"timestamp": 1, "event_id": "a"}, {"timestamp": 2, "event_id": "a"}]
+        with pytest.raises(ValueError, match="contract order"):
+            list(merge_ordered(a, []))
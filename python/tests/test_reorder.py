@@ -0,0 +1,103 @@
+"""ReorderBuffer ordering, lateness and memory-bound tests."""
+
+import random
+from itertools import pairwise
+
+import pytest
+
+from talos_contracts import ReorderBuffer, compare_cursor, derive_cursor, uuid7_batch
+
+
+def _stream(count: int, max_delay: int, seed: int = 2, rate: int = 10) -> list[dict]:
+    """Events created ~``rate`` per second and delivered up to ``max_delay`` seconds late."""
+    rng = random.Random(seed)
+    events = [{"timestamp": 1_700_000_000 + i // rate, "event_id": eid} for i, eid in enumerate(uuid7_batch(count))]
+    arrivals = sorted(range(count), key=lambda i: events[i]["timestamp"] + rng.uniform(0, max_delay))
+    return [events[i] for i in arrivals]
+
+
+def _key(e):
+    return e["timestamp"], e["event_id"]
+
+
+def _run(buffer, stream):
+    released, late = [], []
+    for e in stream:
+        out = buffer.push(e)
+        released += out["released"]
+        late += out["late"]
+    released += buffer.flush()
+    return released, late
+
+
+def test_releases_in_order_within_lateness():
+    stream = _stream(2000, max_delay=3)
+    buffer = ReorderBuffer(lateness=3)
+    released, late = _run(buffer, stream)
+    assert late == []
+    assert released == sorted(stream, key=_key)
+    cursors = [derive_cursor(*_key(e)) for e in released]
+    assert all(compare_cursor(a, b) < 0 for a, b in pairwise(cursors))
+    assert buffer.stats == {"received": 2000, "released": 2000, "late": 0, "max_buffered": buffer.stats["max_buffered"]}
+    # Bounded by the events inside the lateness window (~10 per second), not the stream.
+    assert buffer.stats["max_buffered"] <= 10 * 5
+
+
+def test_late_arrivals_reported_separately():
+    stream = _stream(2000, max_delay=10)
+    buffer = ReorderBuffer(lateness=2)
+    released, late = _run(buffer, stream)
+    assert late
+    assert len(released) + len(late) == len(stream)
+    assert all(_key(a) < _key(b) for a, b in pairwise(released))
+    assert buffer.stats["late"] == len(late)
+    assert sorted(released + late, key=_key) == sorted(stream, key=_key)
+
+
+def test_duplicate_keys_are_released_once():
+    buffer = ReorderBuffer(lateness=5)
+    item = {"timestamp": 10, "event_id": "a"}
+    assert buffer.push(item) == {"released": [], "late": []}
+    assert buffer.push(dict(item)) == {"released": [], "late": [item]}
+    assert buffer.flush() == [item]
+    assert buffer.push(dict(item))["late"] == [item]
+    assert buffer.stats == {"received": 3, "released": 1, "late": 2, "max_buffered": 1}
+
+
+def test_event_messages_by_cursor():
+    stream = _stream(300, max_delay=2)
+    frames = [{"type": "event", "event": {"event_id": e["event_id"]}, "cursor": derive_cursor(*_key(e))} for e in stream]
+    buffer = ReorderBuffer(lateness=2, by_cursor=True)
+    released, late = _run(buffer, frames)
+    assert late == []
+    assert len(released) == 300
+    assert all(compare_cursor(a["cursor"], b["cursor"]) < 0 for a, b in pairwise(released))
+
+
+def test_max_buffered_releases_early():
+    stream = _stream(1000, max_delay=3, rate=100)
+    buffer = ReorderBuffer(lateness=3, max_buffered=50)
+    released, late = _run(buffer, stream)
+    assert buffer.stats["max_buffered"] == 50
+    assert all(_key(a) < _key(b) for a, b in pairwise(released))
+    assert len(released) + len(late) == 1000
+
+
+def test_advance_and_flush():
+    buffer = ReorderBuffer(lateness=5)
+    ids = uuid7_batch(3)
+    for ts, eid in zip((100, 98, 99), ids, strict=True):
+        assert buffer.push({"timestamp": ts, "event_id": eid}) == {"released": [], "late": []}
+    assert buffer.watermark == 95
+    assert [e["timestamp"] for e in buffer.advance(105)] == [98, 99]
+    assert buffer.last_released == (99, ids[2])
+    assert buffer.push({"timestamp": 99, "event_id": ids[2]})["late"]
+    assert [e["timestamp"] for e in buffer.flush()] == [100]
+    assert len(buffer) == 0
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        ReorderBuffer(lateness=-1)
+    with pytest.raises(ValueError):
+        ReorderBuffer(max_buffered=0)
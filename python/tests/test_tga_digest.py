@@ -3,7 +3,7 @@ from pathlib import Path
 
 import pytest
 
-from talos_contracts.infrastructure.canonical import calculate_digest
+from talos_contracts.infrastructure.canonical import calculate_digest, calculate_digest_streaming
 
 ROOT = Path(__file__).resolve().parents[2]
 VECTOR_PATH = ROOT / "test_vectors" / "tga" / "golden_trace_chain.json"
@@ -33,3 +33,9 @@ def test_tool_call_digest_parity(golden_chain):
 def test_tool_effect_digest_parity(golden_chain):
     te = golden_chain["tool_effect"]
     assert calculate_digest(te) == te["_digest"]
+
+
+@pytest.mark.parametrize("name", ["action_request", "supervisor_decision", "tool_call", "tool_effect"])
+def test_streaming_digest_parity(golden_chain, name):
+    obj = golden_chain[name]
+    assert calculate_digest_streaming(obj) == calculate_digest(obj) == obj["_digest"]
@@ -0,0 +1,157 @@
+"""TGA trace-chain (AR -> SD -> TC -> TE) linkage verification."""
+
+import copy
+import json
+from pathlib import Path
+
+import pytest
+
+from talos_contracts import (
+    TraceChainVerifier,
+    base64url_encode,
+    calculate_digest,
+    verify_trace_chains,
+)
+
+ROOT = Path(__file__).resolve().parents[2]
+GOLDEN = json.loads((ROOT / "test_vectors" / "tga" / "golden_trace_chain.json").read_text())
+ORDER = ["action_request", "supervisor_decision", "tool_call", "tool_effect"]
+
+
+def _chain(n=0):
+    """Golden chain with its ids renumbered for trace ``n`` and every digest recomputed."""
+    objects = []
+    for name in ORDER:
+        obj = copy.deepcopy(GOLDEN[name])
+        for key, value in obj.items():
+            if n and key.endswith("_id") and key != "schema_id":
+                obj[key] = value[:-4] + f"{n:04x}"
+        objects.append(obj)
+    _relink(objects)
+    return objects
+
+
+def _relink(objects, keep=None):
+    """Recompute ``_digest`` down the chain, pointing each child at its parent's digest except ``keep``."""
+    ar, sd, tc, te = objects
+    ar["_digest"] = calculate_digest(ar)
+    for child, parent, field in (
+        (sd, ar, "action_request_digest"),
+        (tc, sd, "supervisor_decision_digest"),
+        (te, tc, "tool_call_digest"),
+    ):
+        if field != keep:
+            child[field] = parent["_digest"]
+        child["_digest"] = calculate_digest(child)
+
+
+def _reasons(objects, **kwargs):
+    return [(b["index"], b["artifact"], b["field"], b["reason"]) for b in verify_trace_chains(objects, **kwargs)]
+
+
+def test_golden_chain_verifies():
+    objects = [GOLDEN[name] for name in ORDER]
+    verifier = TraceChainVerifier()
+    assert list(verifier.verify(objects)) == []
+    assert verifier.summary == {"traces": 1, "ok_traces": 1, "objects": 4, "breaks": 0}
+    # Order within a trace is free, and base64url digests are accepted too.
+    shuffled = copy.deepcopy(objects[::-1])
+    shuffled[1]["supervisor_decision_digest"] = base64url_encode(bytes.fromhex(objects[1]["_digest"]))
+    shuffled[1]["_digest"] = base64url_encode(bytes.fromhex(calculate_digest(shuffled[1])))
+    shuffled[0]["tool_call_digest"] = shuffled[1]["_digest"]
+    shuffled[0]["_digest"] = calculate_digest(shuffled[0])
+    assert _reasons(shuffled) == []
+
+
+def test_tampered_parent_breaks_its_own_digest_and_the_link():
+    objects = copy.deepcopy([GOLDEN[name] for name in ORDER])
+    objects[2]["call"]["args"]["name"] = "main"
+    assert _reasons(objects) == [
+        (2, "tool_call", "_digest", "DIGEST_MISMATCH"),
+        (3, "tool_effect", "tool_call_digest", "LINK_DIGEST_MISMATCH"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "position, field, value, expected",
+    [
+        (1, "action_request_id", "01946896-1234-7567-89ab-00000000ffff", (1, "supervisor_decision", "action_request_id", "MISSING_PARENT")),
+        (1, "action_request_id", ["not", "a", "string"], (1, "supervisor_decision", "action_request_id", "MISSING_PARENT")),
+        (3, "tool_call_id", {"id": 1}, (3, "tool_effect", "tool_call_id", "MISSING_PARENT")),
+        (3, "plan_id", "01946896-1234-7567-89ab-00000000ffff", (3, "tool_effect", "plan_id", "PLAN_MISMATCH")),
+        (2, "supervisor_decision_digest", "0" * 64, (2, "tool_call", "supervisor_decision_digest", "LINK_DIGEST_MISMATCH")),
+        (1, "decision", "DENY", (2, "tool_call", "supervisor_decision_id", "NOT_APPROVED")),
+    ],
+)
+def test_broken_links(position, field, value, expected):
+    objects = copy.deepcopy([GOLDEN[name] for name in ORDER])
+    objects[position][field] = value
+    _relink(objects, keep=field)
+    assert _reasons(objects) == [expected]
+
+
+def test_invalid_objects_and_duplicates():
+    ar, sd, tc, te = copy.deepcopy([GOLDEN[name] for name in ORDER])
+    no_id = dict(te)
+    del no_id["tool_effect_id"]
+    wrong_alg = dict(ar, _digest_alg="sha512")
+    objects = [
+        ar,
+        sd,
+        tc,
+        te,
+        dict(te),
+        no_id,
+        wrong_alg,
+        {"trace_id": ar["trace_id"], "schema_id": "x"},
+        {"trace_id": ar["trace_id"], "schema_id": ["talos.tga.action_request"]},
+        {"trace_id": ar["trace_id"], "schema_id": {"id": "talos.tga.tool_call"}},
+    ]
+    assert _reasons(objects) == [
+        (4, "tool_effect", "tool_effect_id", "DUPLICATE_ID"),
+        (5, "tool_effect", "tool_effect_id", "INVALID_OBJECT"),
+        (6, "action_request", "_digest_alg", "DIGEST_MISMATCH"),
+        (6, "action_request", "action_request_id", "DUPLICATE_ID"),
+        (7, None, "schema_id", "INVALID_OBJECT"),
+        (8, None, "schema_id", "INVALID_OBJECT"),
+        (9, None, "schema_id", "INVALID_OBJECT"),
+    ]
+
+
+def test_partial_traces_are_ok_and_split_traces_are_reported():
+    first, second = _chain(1), _chain(2)
+    assert first[0]["trace_id"] != second[0]["trace_id"]
+    stream = first[:2] + second + first[2:]
+    verifier = TraceChainVerifier(chunk_size=1)
+    breaks = list(verifier.verify(stream))
+    assert [(b["index"], b["reason"]) for b in breaks] == [(6, "TRACE_SPLIT"), (7, "TRACE_SPLIT")]
+    assert verifier.summary == {"traces": 3, "ok_traces": 2, "objects": 8, "breaks": 2}
+
+
+def test_parallel_matches_serial_in_input_order(tmp_path):
+    stream = []
+    for n in range(1, 40):
+        chain = _chain(n)
+        if n % 7 == 0:
+            chain[3]["outcome"]["status"] = "FAILURE"
+        if n % 11 == 0:
+            chain = chain[:2]
+        stream.extend(chain)
+    serial = list(verify_trace_chains(stream, chunk_size=5))
+    assert [b["reason"] for b in serial] == ["DIGEST_MISMATCH"] * 5
+    assert list(verify_trace_chains(stream, chunk_size=5, workers=2)) == serial
+
+    path = tmp_path / "traces.jsonl"
+    path.write_text("\n".join(json.dumps(o) for o in stream) + "\nnot json\n\n")
+    verifier = TraceChainVerifier(chunk_size=3)
+    breaks = list(verifier.verify_jsonl(path))
+    assert breaks[:-1] == serial
+    assert breaks[-1] == {"index": len(stream), "trace_id": None, "artifact": None, "field": "schema_id", "reason": "INVALID_OBJECT"}
+    assert verifier.summary["traces"] == 40 and verifier.summary["ok_traces"] == 34
+
+
+def test_rejects_bad_arguments():
+    with pytest.raises(ValueError):
+        TraceChainVerifier(chunk_size=0)
+    with pytest.raises(ValueError):
+        TraceChainVerifier(workers=-1)
@@ -0,0 +1,188 @@
+"""UUIDv7 validation, generation and packing tests."""
+
+import json
+import random
+import threading
+from functools import cmp_to_key
+from itertools import pairwise
+from pathlib import Path
+
+import pytest
+
+from talos_contracts import (
+    UUIDv7Generator,
+    is_canonical_lower_uuid,
+    is_canonical_uuid_v7,
+    is_uuid_v7,
+    ordering_compare,
+    pack_uuid7,
+    pack_uuid7_many,
+    sort_packed_uuid7,
+    unpack_uuid7,
+    unpack_uuid7_many,
+    uuid7,
+    uuid7_batch,
+    uuid7_timestamp_ms,
+    validate_uuid_v7_many,
+)
+
+ROOT = Path(__file__).resolve().parents[2]
+V = ROOT / "test_vectors"
+GOLDEN = Path(__file__).parent / "vectors" / "golden.json"
+
+VALID = "0190a5e0-7c3a-7000-8000-000000000001"
+
+
+def _mutations(rng: random.Random, count: int) -> list[str]:
+    """Single-character mutations of a valid id plus a few structural oddities."""
+    alphabet = "0123456789abcdefABCDEFg-_ \né"
+    out = []
+    for _ in range(count):
+        chars = list(VALID)
+        chars[rng.randrange(36)] = rng.choice(alphabet)
+        out.append("".join(chars))
+    out += [VALID + "\n", VALID[:-1], VALID + "0", VALID.replace("-", ""), VALID.upper(), ""]
+    return out
+
+
+def test_agrees_with_vectors():
+    data = json.loads((V / "uuidv7.json").read_text())
+    for v in data["valid"]:
+        assert is_canonical_uuid_v7(v) is True
+    for v in data["invalid"]:
+        assert is_canonical_uuid_v7(v) is False
+
+    golden = json.loads(GOLDEN.read_text())["uuidv7"]
+    for v in golden["valid"]:
+        assert is_canonical_uuid_v7(v) is True
+    for v in golden["invalid"]:
+        assert is_canonical_uuid_v7(v) is False
+    for tc in golden["valid_but_not_canonical"]:
+        assert is_canonical_uuid_v7(tc["input"]) is (tc["isV7"] and tc["isCanonicalLower"])
+
+
+def test_matches_two_call_path():
+    for value in _mutations(random.Random(7), 2000):
+        expected = is_uuid_v7(value) and is_canonical_lower_uuid(value)
+        assert is_canonical_uuid_v7(value) is expected, value
+
+
+def test_trailing_newline_rejected():
+    assert is_uuid_v7(VALID + "\n") is False
+    assert is_canonical_uuid_v7(VALID + "\n") is False
+
+
+@pytest.mark.parametrize("canonical", [True, False])
+def test_validate_many_matches_scalar(canonical):
+    rng = random.Random(11)
+    values = [VALID] * 600 + _mutations(rng, 300) + [VALID.upper()] * 10
+    rng.shuffle(values)
+    check = is_canonical_uuid_v7 if canonical else is_uuid_v7
+    result = validate_uuid_v7_many(iter(values), canonical=canonical)
+    assert result == bytes(check(v) for v in values)
+
+
+def test_validate_many_all_valid_and_empty():
+    assert validate_uuid_v7_many([VALID] * 1000) == b"\x01" * 1000
+    assert validate_uuid_v7_many([]) == b""
+
+
+class TestGenerator:
+    """UUIDv7Generator / uuid7 / uuid7_batch."""
+
+    def test_ids_are_canonical_v7(self):
+        ids = [uuid7() for _ in range(100)] + uuid7_batch(100)
+        assert validate_uuid_v7_many(ids) == b"\x01" * 200
+
+    def test_timestamp_roundtrip(self):
+        gen = UUIDv7Generator(clock_ms=lambda: 1_703_721_600_123)
+        assert uuid7_timestamp_ms(gen.uuid7()) == 1_703_721_600_123
+        assert uuid7_timestamp_ms("0190a5e0-7c3a-7000-8000-000000000001") == 0x0190A5E07C3A
+        with pytest.raises(ValueError):
+            uuid7_timestamp_ms("not-a-uuid")
+
+    def test_monotonic_with_frozen_and_backwards_clock(self):
+        ticks = iter([5, 5, 5, 4, 3, 6, 6, 2] * 50)
+        gen = UUIDv7Generator(clock_ms=lambda: next(ticks))
+        ids = []
+        for i in range(100):
+            ids.extend(gen.uuid7_batch(3) if i % 2 else [gen.uuid7()])
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+
+    def test_counter_overflow_advances_timestamp(self):
+        gen = UUIDv7Generator(clock_ms=lambda: 1000)
+        first = gen.uuid7()
+        gen._counter = (1 << 74) - 2  # push the shared counter to the edge
+        second = gen.uuid7_batch(2)
+        assert first < second[0] < second[1]
+        assert uuid7_timestamp_ms(first) == 1000
+        assert uuid7_timestamp_ms(second[0]) == 1001
+
+    def test_batch_crossing_rand_a_boundary(self):
+        seeds = iter([(1 << 62) - 2])
+        gen = UUIDv7Generator(clock_ms=lambda: 1, randbits=lambda k: next(seeds, 0))
+        ids = gen.uuid7_batch(5)
+        assert ids == sorted(ids)
+        assert validate_uuid_v7_many(ids) == b"\x01" * 5
+
+    def test_strictly_monotonic_across_threads(self):
+        gen = UUIDv7Generator()
+        per_thread: list[list[str]] = [[] for _ in range(8)]
+        barrier = threading.Barrier(len(per_thread))
+
+        def work(out: list[str]) -> None:
+            barrier.wait()
+            for i in range(500):
+                out.extend(gen.uuid7_batch(4) if i % 3 == 0 else [gen.uuid7()])
+
+        threads = [threading.Thread(target=work, args=(out,)) for out in per_thread]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        everything = [i for out in per_thread for i in out]
+        assert len(set(everything)) == len(everything)
+        for out in per_thread:
+            assert all(a < b for a, b in pairwise(out))
+        # Ids share one timeline: the global sort order is a total order that
+        # every thread's own sequence is a subsequence of.
+        rank = {v: i for i, v in enumerate(sorted(everything))}
+        for out in per_thread:
+            ranks = [rank[v] for v in out]
+            assert ranks == sorted(ranks)
+
+
+class TestPacked:
+    """16-byte packed UUIDv7 form."""
+
+    def test_roundtrip(self):
+        ids = uuid7_batch(50) + [uuid7() for _ in range(50)] + [VALID]
+        assert [unpack_uuid7(pack_uuid7(v)) for v in ids] == ids
+        packed = pack_uuid7_many(ids)
+        assert len(packed) == 16 * len(ids)
+        assert packed == b"".join(pack_uuid7(v) for v in ids)
+        assert unpack_uuid7_many(packed) == ids
+        assert unpack_uuid7_many(b"") == []
+
+    def test_rejects_non_canonical(self):
+        with pytest.raises(ValueError):
+            pack_uuid7(VALID.upper())
+        with pytest.raises(ValueError, match="index 1"):
+            pack_uuid7_many([VALID, "not-a-uuid"])
+        with pytest.raises(ValueError):
+            unpack_uuid7(b"\x00" * 15)
+        with pytest.raises(ValueError):
+            unpack_uuid7_many(b"\x00" * 17)
+
+    def test_sort_matches_ordering_compare_tiebreak(self):
+        ids = uuid7_batch(200) + [uuid7() for _ in range(200)]
+        random.Random(3).shuffle(ids)
+        events = [{"timestamp": 1, "event_id": v} for v in ids]
+        expected = [e["event_id"] for e in sorted(events, key=cmp_to_key(ordering_compare))]
+
+        assert unpack_uuid7_many(sort_packed_uuid7(pack_uuid7_many(ids))) == expected
+        assert sorted(ids, key=pack_uuid7, reverse=True) == expected
+        ascending = sort_packed_uuid7(pack_uuid7_many(ids), descending=False)
+        assert unpack_uuid7_many(ascending) == expected[::-1]
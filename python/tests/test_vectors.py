@@ -9,6 +9,8 @@ from talos_contracts import (
     Base64UrlError,
     base64url_decode,
     base64url_encode,
+    compare_cursor,
+    decode_cursor,
     derive_cursor,
     is_uuid_v7,
     ordering_compare,
@@ -42,6 +44,34 @@ def test_cursor_derivation():
         assert derive_cursor(c["timestamp"], c["event_id"]) == c["expected_cursor"]
 
 
+def test_cursor_v2_derivation():
+    """Test v1 and compact v2 cursors for the same events."""
+    vec = json.loads((V / "cursor_v2.json").read_text())
+    for c in vec["derive"]:
+        assert derive_cursor(c["timestamp"], c["event_id"]) == c["v1"]
+        assert derive_cursor(c["timestamp"], c["event_id"], version=2) == c["v2"]
+        assert len(c["v2"]) == 34
+        frame = c["timestamp"].to_bytes(8, "big") + bytes.fromhex(c["event_id"].replace("-", ""))
+        assert base64url_decode(c["v2"]) == b"\x02" + frame
+        expected = {"timestamp": c["timestamp"], "event_id": c["event_id"]}
+        assert decode_cursor(c["v1"]) == decode_cursor(c["v2"]) == expected
+
+
+def test_cursor_v2_compare():
+    """Test comparisons between v2 cursors and across formats."""
+    vec = json.loads((V / "cursor_v2.json").read_text())
+    for c in vec["compare"]:
+        assert compare_cursor(c["a"], c["b"]) == c["expected"]
+
+
+def test_cursor_v2_invalid():
+    """Test that malformed v2 cursors are rejected."""
+    vec = json.loads((V / "cursor_v2.json").read_text())
+    for c in vec["invalid_v2"]:
+        with pytest.raises(ValueError):
+            decode_cursor(c["cursor"])
+
+
 def test_uuidv7_valid():
     """Test valid UUIDv7 strings."""
     data = json.loads((V / "uuidv7.json").read_text())